@@ -1,63 +1,179 @@
 """The OCEAN Mining Pool integration."""
 from __future__ import annotations
 
+from functools import partial
 import logging
 
 import aiohttp
+import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import Platform
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers import config_validation as cv
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .const import (
+    ATTR_CONFIG_ENTRY_ID,
+    ATTR_CYCLES,
+    CONF_EXCHANGE_RATE_ENTITY,
     CONF_SCAN_INTERVAL,
     CONF_USERNAME,
+    CONF_WORKER_ENTITY_TYPES,
+    CONF_WORKER_INCLUDE,
+    CONF_WORKER_MODE,
+    CONF_WORKER_RETENTION,
+    CONF_WORKER_SCAN_INTERVAL,
+    DATA_ENGINE,
+    DEFAULT_PROFILE_CYCLES,
     DEFAULT_SCAN_INTERVAL,
+    DEFAULT_WORKER_MODE,
+    DEFAULT_WORKER_RETENTION,
+    DEFAULT_WORKER_SCAN_INTERVAL,
     DOMAIN,
+    EXCHANGE_RATE_ENTITY,
+    MAX_PROFILE_CYCLES,
     PLATFORMS,
+    SERVICE_PROFILE_UPDATE,
+    WORKER_ENTITY_TYPES,
+    WORKER_MODE_SUMMARY,
 )
-from .coordinator import OceanCoordinator
+from .coordinator import OceanCoordinator, data_store
+from .engine import OceanPollingEngine
 
 _LOGGER = logging.getLogger(__name__)
 
+PROFILE_UPDATE_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CYCLES, default=DEFAULT_PROFILE_CYCLES): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=MAX_PROFILE_CYCLES)
+        ),
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+    }
+)
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up OCEAN Mining Pool from a config entry."""
     username = entry.data[CONF_USERNAME]
     scan_interval = entry.data.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+    worker_retention = entry.options.get(CONF_WORKER_RETENTION, DEFAULT_WORKER_RETENTION)
+    worker_scan_interval = entry.options.get(
+        CONF_WORKER_SCAN_INTERVAL, DEFAULT_WORKER_SCAN_INTERVAL
+    )
+    exchange_rate_entity = entry.options.get(CONF_EXCHANGE_RATE_ENTITY, EXCHANGE_RATE_ENTITY)
+    # In summary mode only the selected workers get their own entities
+    worker_include = None
+    if entry.options.get(CONF_WORKER_MODE, DEFAULT_WORKER_MODE) == WORKER_MODE_SUMMARY:
+        worker_include = entry.options.get(CONF_WORKER_INCLUDE, [])
+    worker_entity_types = entry.options.get(CONF_WORKER_ENTITY_TYPES, WORKER_ENTITY_TYPES)
     
     _LOGGER.info(f"Setting up OCEAN Mining Pool for user {username}")
     
-    # Get aiohttp session
-    session = async_get_clientsession(hass)
+    # All accounts share one polling engine using Home Assistant's pooled session
+    hass.data.setdefault(DOMAIN, {})
+    if DATA_ENGINE not in hass.data[DOMAIN]:
+        hass.data[DOMAIN][DATA_ENGINE] = OceanPollingEngine(async_get_clientsession(hass))
+    engine = hass.data[DOMAIN][DATA_ENGINE]
     
     # Create coordinator
     coordinator = OceanCoordinator(
         hass=hass,
         username=username,
         scan_interval=scan_interval,
-        session=session,
+        engine=engine,
+        worker_retention=worker_retention * 3600,
+        worker_scan_interval=worker_scan_interval,
+        exchange_rate_entity=exchange_rate_entity,
+        worker_include=worker_include,
+        worker_entity_types=worker_entity_types,
     )
     
     # Store coordinator
-    hass.data.setdefault(DOMAIN, {})
     hass.data[DOMAIN][entry.entry_id] = coordinator
     
-    # Perform initial refresh
-    await coordinator.async_config_entry_first_refresh()
+    # Start from the last saved data and refresh in the background, only the
+    # very first setup has to wait for the API
+    if await coordinator.async_restore_data():
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"OCEAN {username} initial refresh"
+        )
+    else:
+        await coordinator.async_config_entry_first_refresh()
+    engine.async_register(coordinator)
+    
+    # Drop the devices of workers that no longer get entities, e.g. after
+    # switching to summary mode
+    coordinator.async_remove_unregistered_devices(entry.entry_id)
+    
+    # Lifetime earnings scrapes scheduled after a found block die with the entry
+    entry.async_on_unload(coordinator.lifetime_coordinator.async_cancel_followup)
+    
+    # USD sensors read the cached rate, which follows the exchange rate entity
+    entry.async_on_unload(coordinator.exchange_rate.async_start())
     
     # Forward entry setup to platforms
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
     
+    # Reload when the options change
+    entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+    
+    if not hass.services.has_service(DOMAIN, SERVICE_PROFILE_UPDATE):
+        hass.services.async_register(
+            DOMAIN,
+            SERVICE_PROFILE_UPDATE,
+            partial(async_profile_update, hass),
+            schema=PROFILE_UPDATE_SCHEMA,
+        )
+    
     return True
 
 
+async def async_profile_update(hass: HomeAssistant, call: ServiceCall) -> None:
+    """Profile the next update cycles of one or all accounts."""
+    entry_id = call.data.get(ATTR_CONFIG_ENTRY_ID)
+    coordinators = [
+        coordinator
+        for key, coordinator in hass.data[DOMAIN].items()
+        if isinstance(coordinator, OceanCoordinator) and entry_id in (None, key)
+    ]
+    if not coordinators:
+        raise HomeAssistantError(f"No loaded OCEAN account with config entry {entry_id}")
+    
+    for coordinator in coordinators:
+        if not coordinator.async_start_profile(call.data[ATTR_CYCLES]):
+            raise HomeAssistantError(
+                f"OCEAN account {coordinator.username} is already being profiled"
+            )
+        # Start the first profiled cycle now instead of waiting for the next poll
+        await coordinator.async_request_refresh()
+
+
+async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Reload a config entry after its options changed."""
+    await hass.config_entries.async_reload(entry.entry_id)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        coordinator = hass.data[DOMAIN].pop(entry.entry_id)
+        # Flush the pending save, a removed entry deletes the file afterwards
+        await coordinator.async_shutdown()
+        engine = hass.data[DOMAIN][DATA_ENGINE]
+        engine.async_unregister(coordinator)
+        
+        # Shut down the shared engine and the service with the last account
+        if not engine.accounts:
+            hass.data[DOMAIN].pop(DATA_ENGINE).shutdown()
+            hass.services.async_remove(DOMAIN, SERVICE_PROFILE_UPDATE)
     
     return unload_ok
+
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the saved data of a deleted config entry."""
+    await data_store(hass, entry.data[CONF_USERNAME]).async_remove()
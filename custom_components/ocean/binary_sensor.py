@@ -26,51 +26,49 @@ async def async_setup_entry(
     """Set up OCEAN Mining Pool binary sensors from a config entry."""
     coordinator = hass.data[DOMAIN][entry.entry_id]
     
-    entities = []
-    
-    # Add worker status binary sensors dynamically
-    workers = coordinator.data.get("workers", {})
-    for worker_name in workers:
-        entities.append(
-            OceanWorkerStatusSensor(
-                coordinator=coordinator,
-                worker_name=worker_name,
-            )
+    # Status sensors by worker, following the coordinator's worker registry
+    worker_entities: dict[str, OceanWorkerStatusSensor] = {}
+    with_status = "status" in coordinator.worker_entity_types
+    for worker_name in coordinator.worker_registry if with_status else ():
+        worker_entities[worker_name] = OceanWorkerStatusSensor(
+            coordinator=coordinator,
+            worker_name=worker_name,
         )
     
-    async_add_entities(entities)
+    async_add_entities(list(worker_entities.values()))
+    
+    # Drop status sensors when they were turned off in the options
+    coordinator.async_remove_unused_worker_entities(
+        entry.entry_id,
+        "binary_sensor",
+        {binary_sensor.unique_id for binary_sensor in worker_entities.values()},
+    )
     
-    # Listen for coordinator updates to add new workers
     @callback
-    def _async_add_new_workers():
-        """Add binary sensors for newly discovered workers."""
+    def _async_workers_changed(added: set[str], removed: set[str]) -> None:
+        """Add binary sensors for new workers and remove those of dropped workers."""
         new_entities = []
-        current_workers = coordinator.data.get("workers", {})
-        
-        # Find workers that don't have entities yet
-        existing_workers = {
-            entity.worker_name
-            for entity in entities
-            if isinstance(entity, OceanWorkerStatusSensor)
-        }
-        
-        new_workers = set(current_workers.keys()) - existing_workers
-        
-        for worker_name in new_workers:
+        for worker_name in added if with_status else ():
             new_entity = OceanWorkerStatusSensor(
                 coordinator=coordinator,
                 worker_name=worker_name,
             )
+            worker_entities[worker_name] = new_entity
             new_entities.append(new_entity)
-            entities.append(new_entity)
+        
+        for worker_name in removed:
+            worker_entity = worker_entities.pop(worker_name, None)
+            # Entities disabled in the entity registry were never added
+            if worker_entity is not None and worker_entity.hass is not None:
+                hass.async_create_task(worker_entity.async_remove(force_remove=True))
         
         if new_entities:
             _LOGGER.info(f"Adding {len(new_entities)} binary sensors for new workers")
             async_add_entities(new_entities)
     
-    # Subscribe to coordinator updates
+    # Subscribe to worker registry changes
     entry.async_on_unload(
-        coordinator.async_add_listener(_async_add_new_workers)
+        coordinator.async_add_workers_listener(_async_workers_changed)
     )
 
 
@@ -91,6 +89,17 @@ class OceanWorkerStatusSensor(CoordinatorEntity, BinarySensorEntity):
         self._attr_device_class = BinarySensorDeviceClass.CONNECTIVITY
         self._attr_icon = "mdi:server-network"
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Only write state when this worker's data changed."""
+        if self.coordinator.worker_changed(self.worker_name):
+            super()._handle_coordinator_update()
+
+    async def async_update(self) -> None:
+        """Update the entity, fetching a fresh worker list."""
+        if self.enabled:
+            await self.coordinator.async_request_workers_refresh()
+
     @property
     def device_info(self) -> entity.DeviceInfo:
         """Return device info - each worker is its own device."""
@@ -0,0 +1,73 @@
+"""Circuit breaker for the OCEAN endpoints."""
+from __future__ import annotations
+
+from typing import Any
+
+
+class CircuitBreaker:
+    """Stops requests to a failing endpoint for a cool-down window.
+
+    The breaker opens after `threshold` failed requests in a row. While it
+    is open requests fail fast, once the cool-down has passed a single trial
+    request is let through. A successful trial closes the breaker, a failed
+    one reopens it with the cool-down doubled up to `max_cooldown`.
+    """
+
+    def __init__(self, threshold: int, cooldown: float, max_cooldown: float) -> None:
+        """Initialize a closed breaker."""
+        self._threshold = threshold
+        self._base_cooldown = cooldown
+        self._max_cooldown = max_cooldown
+        self.cooldown = cooldown
+        self.failures = 0
+        # Monotonic time the breaker opened at, None while closed
+        self.opened_at: float | None = None
+        self._trial = False
+
+    def retry_in(self, now: float) -> float:
+        """Return the seconds until the breaker lets a request through."""
+        if self.opened_at is None:
+            return 0.0
+        return max(0.0, self.opened_at + self.cooldown - now)
+
+    def allow(self, now: float) -> bool:
+        """Return True if a request may be sent, claiming the trial when half-open."""
+        if self.opened_at is None:
+            return True
+        if self._trial or now < self.opened_at + self.cooldown:
+            return False
+        self._trial = True
+        return True
+
+    def release(self) -> None:
+        """Give back a trial request that was abandoned before it completed."""
+        self._trial = False
+
+    def record_success(self) -> None:
+        """Close the breaker."""
+        self.failures = 0
+        self.opened_at = None
+        self.cooldown = self._base_cooldown
+        self._trial = False
+
+    def record_failure(self, now: float) -> bool:
+        """Count a failed request, return True if it opened the breaker."""
+        self.failures += 1
+        if self._trial:
+            self._trial = False
+            self.cooldown = min(self.cooldown * 2, self._max_cooldown)
+            self.opened_at = now
+            return True
+        if self.opened_at is None and self.failures >= self._threshold:
+            self.opened_at = now
+            return True
+        return False
+
+    def as_dict(self, now: float) -> dict[str, Any]:
+        """Return the breaker state for diagnostics."""
+        return {
+            "open": self.opened_at is not None,
+            "failures": self.failures,
+            "cooldown": self.cooldown,
+            "retry_in": round(self.retry_in(now), 1),
+        }
@@ -8,17 +8,32 @@ import aiohttp
 import voluptuous as vol
 
 from homeassistant import config_entries
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
+from homeassistant.helpers import selector
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 
 from .const import (
     API_USERINFO_FULL,
+    CONF_EXCHANGE_RATE_ENTITY,
     CONF_SCAN_INTERVAL,
     CONF_USERNAME,
+    CONF_WORKER_ENTITY_TYPES,
+    CONF_WORKER_INCLUDE,
+    CONF_WORKER_MODE,
+    CONF_WORKER_RETENTION,
+    CONF_WORKER_SCAN_INTERVAL,
     DEFAULT_SCAN_INTERVAL,
+    DEFAULT_WORKER_MODE,
+    DEFAULT_WORKER_RETENTION,
+    DEFAULT_WORKER_SCAN_INTERVAL,
     DOMAIN,
+    EXCHANGE_RATE_ENTITY,
+    WORKER_ENTITY_TYPES,
+    WORKER_MODE_FULL,
+    WORKER_MODE_SUMMARY,
 )
+from .decode import json_loads
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -48,7 +63,7 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
             if response.status != 200:
                 raise ValueError(f"API returned HTTP {response.status}")
             
-            api_data = await response.json()
+            api_data = await response.json(loads=json_loads)
             if not api_data.get("result"):
                 raise ValueError("Invalid API response")
             
@@ -65,6 +80,14 @@ class OceanConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> OceanOptionsFlow:
+        """Get the options flow for this handler."""
+        return OceanOptionsFlow(config_entry)
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
@@ -92,3 +115,71 @@ class OceanConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             data_schema=STEP_USER_DATA_SCHEMA,
             errors=errors,
         )
+
+
+class OceanOptionsFlow(config_entries.OptionsFlow):
+    """Handle OCEAN Mining Pool options."""
+
+    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
+        """Initialize options flow."""
+        self.config_entry = config_entry
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage the options."""
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+        
+        options = self.config_entry.options
+        # Offer the workers the account has seen so far
+        coordinator = self.hass.data.get(DOMAIN, {}).get(self.config_entry.entry_id)
+        known_workers = sorted(coordinator.workers.names) if coordinator else []
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(
+                        CONF_WORKER_RETENTION,
+                        default=options.get(CONF_WORKER_RETENTION, DEFAULT_WORKER_RETENTION),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0)),
+                    vol.Optional(
+                        CONF_WORKER_SCAN_INTERVAL,
+                        default=options.get(
+                            CONF_WORKER_SCAN_INTERVAL, DEFAULT_WORKER_SCAN_INTERVAL
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0)),
+                    vol.Optional(
+                        CONF_EXCHANGE_RATE_ENTITY,
+                        default=options.get(CONF_EXCHANGE_RATE_ENTITY, EXCHANGE_RATE_ENTITY),
+                    ): selector.EntitySelector(selector.EntitySelectorConfig(domain="sensor")),
+                    vol.Optional(
+                        CONF_WORKER_MODE,
+                        default=options.get(CONF_WORKER_MODE, DEFAULT_WORKER_MODE),
+                    ): selector.SelectSelector(
+                        selector.SelectSelectorConfig(
+                            options=[WORKER_MODE_FULL, WORKER_MODE_SUMMARY],
+                            translation_key=CONF_WORKER_MODE,
+                        )
+                    ),
+                    vol.Optional(
+                        CONF_WORKER_INCLUDE,
+                        default=options.get(CONF_WORKER_INCLUDE, []),
+                    ): selector.SelectSelector(
+                        selector.SelectSelectorConfig(
+                            options=known_workers, multiple=True, custom_value=True
+                        )
+                    ),
+                    vol.Optional(
+                        CONF_WORKER_ENTITY_TYPES,
+                        default=options.get(CONF_WORKER_ENTITY_TYPES, list(WORKER_ENTITY_TYPES)),
+                    ): selector.SelectSelector(
+                        selector.SelectSelectorConfig(
+                            options=list(WORKER_ENTITY_TYPES),
+                            multiple=True,
+                            translation_key=CONF_WORKER_ENTITY_TYPES,
+                        )
+                    ),
+                }
+            ),
+        )
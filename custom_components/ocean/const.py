@@ -9,15 +9,113 @@ PLATFORMS = [Platform.SENSOR, Platform.BINARY_SENSOR]
 # Configuration
 CONF_USERNAME = "username"
 CONF_SCAN_INTERVAL = "scan_interval"
+CONF_WORKER_RETENTION = "worker_retention"
+CONF_WORKER_SCAN_INTERVAL = "worker_scan_interval"
+CONF_EXCHANGE_RATE_ENTITY = "exchange_rate_entity"
+CONF_WORKER_MODE = "worker_mode"
+CONF_WORKER_INCLUDE = "worker_include"
+CONF_WORKER_ENTITY_TYPES = "worker_entity_types"
+
+# Worker modes: entities for every worker, or fleet sensors plus selected workers
+WORKER_MODE_FULL = "full"
+WORKER_MODE_SUMMARY = "summary"
+
+# Worker entity types that can be turned off in the options
+WORKER_ENTITY_TYPES = (
+    "hashrate_60s",
+    "hashrate_300s",
+    "last_share_ts",
+    "estimated_earn_next_block",
+    "lifetime_earnings",
+    "rolling",
+    "status",
+)
 
 # Defaults
 DEFAULT_SCAN_INTERVAL = 60  # seconds (matches OCEAN's 60s window)
+DEFAULT_WORKER_RETENTION = 168  # hours a missing worker is kept, 0 keeps it forever
+DEFAULT_WORKER_SCAN_INTERVAL = 0  # seconds between worker list fetches, 0 fetches every poll
+DEFAULT_WORKER_MODE = WORKER_MODE_FULL
+
+# Last good data persisted for instant startup
+STORE_VERSION = 1
+STORE_KEY = f"{DOMAIN}.data"  # one store per account: "ocean.data.<username>"
+STORE_SAVE_DELAY = 60  # seconds, at most one write per delay however often polls change data
+
+# Snapshot-aligned polling
+SNAPSHOT_ROLL_MARGIN = 2  # accuracy (seconds) to which the snapshot roll is located
+SNAPSHOT_RETRY_DELAY = 5  # first retry when the snapshot has not rolled yet
+SNAPSHOT_FAST_DELAY = 15  # poll delay right after a block was found
+SNAPSHOT_BLOCK_FAST_POLLS = 3  # number of fast polls after a block
+SNAPSHOT_MIN_DELAY = 5  # never poll more often than this, even after a block
+SNAPSHOT_MIN_CADENCE = 10  # plausible snapshot cadence bounds
+SNAPSHOT_MAX_CADENCE = 600
+SNAPSHOT_CADENCE_SAMPLES = 20  # recent snapshot spacings the cadence is taken from
 
 # API URLs
 API_BASE_URL = "https://api.ocean.xyz/v1"
 API_STATSNAP = f"{API_BASE_URL}/statsnap/{{username}}"
 API_USERINFO_FULL = f"{API_BASE_URL}/userinfo_full/{{username}}"
 
+# Request pipeline shared by API fetches and stats page scrapes
+API_TIMEOUT = 10  # seconds
+API_RETRY_ATTEMPTS = 3  # tries per request, only transient failures are retried
+API_RETRY_BASE_DELAY = 1  # seconds before the first retry, doubled per retry and jittered
+API_RETRY_MAX_DELAY = 10  # seconds, cap of the retry delay
+BREAKER_FAILURE_THRESHOLD = 3  # failed requests in a row that pause an endpoint
+BREAKER_COOLDOWN = 60  # seconds an endpoint is paused, doubled per failed trial request
+BREAKER_MAX_COOLDOWN = 900  # seconds
+STALE_MAX_AGE = 1800  # seconds the last good data is kept while the API fails
+
+# Stats page URLs (scraped for lifetime earnings)
+STATS_BASE_URL = "https://ocean.xyz/stats"
+STATS_ACCOUNT_URL = f"{STATS_BASE_URL}/{{username}}"
+STATS_WORKER_URL = f"{STATS_BASE_URL}/{{username}}.{{worker}}"
+
+# Scraping
+SCRAPE_MAX_CONCURRENCY = 4  # simultaneous stats page fetches per account
+SCRAPE_TIMEOUT = 15  # seconds
+SCRAPE_CHUNK_SIZE = 65536  # bytes handed to the parser at once while scanning a stats page
+
+# Lifetime earnings only change when a found block is credited
+LIFETIME_SAFETY_INTERVAL = 3600  # seconds between scrapes without a detected block
+LIFETIME_BLOCK_FOLLOWUP = 300  # seconds after a block, scrape again for late page updates
+
+# Rolling hashrate statistics kept in memory
+ROLLING_WINDOWS = (3600, 21600, 86400)  # seconds: 1h, 6h and 24h
+ROLLING_ACCOUNT_CAPACITY = 8640  # account samples, 24h at the shortest snapshot cadence
+ROLLING_MIN_SAMPLE_INTERVAL = 60  # seconds, sizes the per-worker buffers
+ROLLING_MEAN_BUCKETS = 24  # buckets of the 24h average kept for workers without rolling entities
+
+# profile_update service
+SERVICE_PROFILE_UPDATE = "profile_update"
+ATTR_CYCLES = "cycles"
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+DEFAULT_PROFILE_CYCLES = 3
+MAX_PROFILE_CYCLES = 100
+
+# Per-phase metrics, percentiles are taken over the latest samples
+METRICS_SAMPLES = 256
+
+# Fleet summary sensors
+FLEET_UNDERPERFORM_RATIO = 0.8  # 300s hashrate below this share of the 24h average
+FLEET_TOP_UNDERPERFORMERS = 10  # underperforming workers listed in the attributes
+FLEET_OFFLINE_LIST_LIMIT = 50  # offline workers listed in the attributes
+
+# Polling engine shared by all accounts
+DATA_ENGINE = "engine"
+ENGINE_REQUESTS_PER_MINUTE = 60  # API requests per minute across all accounts
+ENGINE_REQUEST_BURST = 10  # requests that may be sent back to back
+ENGINE_MAX_CONCURRENCY = 4  # API requests in flight across all accounts
+ENGINE_SPREAD_WINDOW = 20  # seconds over which account polls are spread
+
+# userinfo_full bodies at least this large have their workers decoded one by one
+STREAM_DECODE_MIN_BYTES = 262144
+
+# Parsing pool shared by all accounts
+DEFAULT_PARSE_WORKERS = 2  # threads, 0 parses on the event loop
+DEFAULT_PARSE_QUEUE_DEPTH = 8  # page batches queued or parsing at once
+
 # Units
 TERA_HASH_PER_SECOND = "TH/s"
 BITCOIN = "BTC"
@@ -45,5 +143,5 @@ WORKER_ESTIMATED_EARN = "estimated_earn_next_block"
 # Binary sensor keys
 BINARY_SENSOR_WORKER_STATUS = "status"
 
-# Exchange rate sensor entity ID
+# Default exchange rate sensor entity ID, BTC price in USD
 EXCHANGE_RATE_ENTITY = "sensor.exchange_rate_1_btc"
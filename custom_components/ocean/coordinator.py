@@ -1,24 +1,98 @@
 """OCEAN Mining Pool DataUpdateCoordinator."""
 import asyncio
+import codecs
+import hashlib
 import logging
+import math
+import random
+import time
+from collections.abc import Awaitable, Callable, Iterable
 from datetime import datetime, timedelta
-from typing import Any
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, TypeVar
 
 import aiohttp
+from aiohttp import hdrs
 
-from homeassistant.core import HomeAssistant
+from homeassistant.const import EVENT_STATE_CHANGED
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, callback
+from homeassistant.helpers import device_registry as dr, entity_registry as er
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
     UpdateFailed,
 )
+from homeassistant.util import dt as dt_util
 
 from .const import (
+    API_RETRY_ATTEMPTS,
+    API_RETRY_BASE_DELAY,
+    API_RETRY_MAX_DELAY,
     API_STATSNAP,
+    API_TIMEOUT,
+    BREAKER_COOLDOWN,
+    BREAKER_FAILURE_THRESHOLD,
+    BREAKER_MAX_COOLDOWN,
+    DOMAIN,
     API_USERINFO_FULL,
+    EXCHANGE_RATE_ENTITY,
+    FLEET_OFFLINE_LIST_LIMIT,
+    FLEET_TOP_UNDERPERFORMERS,
+    FLEET_UNDERPERFORM_RATIO,
+    LIFETIME_BLOCK_FOLLOWUP,
+    LIFETIME_SAFETY_INTERVAL,
+    METRICS_SAMPLES,
+    ROLLING_ACCOUNT_CAPACITY,
+    ROLLING_MEAN_BUCKETS,
+    ROLLING_MIN_SAMPLE_INTERVAL,
+    ROLLING_WINDOWS,
+    SCRAPE_CHUNK_SIZE,
+    SCRAPE_MAX_CONCURRENCY,
+    SCRAPE_TIMEOUT,
+    STALE_MAX_AGE,
+    STATS_ACCOUNT_URL,
+    STATS_WORKER_URL,
+    STORE_KEY,
+    STORE_SAVE_DELAY,
+    STORE_VERSION,
+    STREAM_DECODE_MIN_BYTES,
+    WORKER_ENTITY_TYPES,
 )
+from .breaker import CircuitBreaker
+from .decode import JSONLoads, StreamedUserinfo, json_loads
+from .engine import OceanPollingEngine
+from .exchange_rate import ExchangeRateCache
+from .fleet import summarize_fleet
+from .metrics import (
+    COUNTER_FAILURES,
+    COUNTER_RETRIES,
+    METRIC_BYTES_RECEIVED,
+    METRIC_DECODE,
+    METRIC_ENTITIES_NOTIFIED,
+    METRIC_FAN_OUT,
+    METRIC_FETCH,
+    METRIC_PARSE_WORKERS,
+    METRIC_POLL,
+    METRIC_SCRAPE,
+    METRIC_SCRAPE_BYTES,
+    METRIC_SCRAPE_PARSE,
+    METRIC_STATE_WRITES,
+    METRIC_WORKERS_PARSED,
+    Metrics,
+)
+from .profiling import UpdateProfile
+from .rolling import RollingMean, RollingStats
+from .scheduler import SnapshotScheduler
+from .workers import WorkerTable
+
+if TYPE_CHECKING:
+    from .scrape import AccountPageExtractor, LifetimeEarningsExtractor
 
 _LOGGER = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
 DEFAULT_DATA = {
     "username": None,
     "snap_ts": None,
@@ -35,56 +109,367 @@ DEFAULT_DATA = {
     "last_share_ts": None,
     "active_workers": 0,
     "workers": {},
+    # Seconds since the data was fetched, above 0 while the last good data is served
+    "data_age": 0,
 }
 
 
+class _FetchError(Exception):
+    """A failed request, retried if the failure is likely transient."""
+
+    def __init__(self, message: str, retryable: bool = True) -> None:
+        """Initialize the error."""
+        super().__init__(message)
+        self.retryable = retryable
+
+
+def _is_transient(status: int) -> bool:
+    """Return True if an HTTP error status is worth retrying."""
+    return status >= 500 or status == 429
+
+
+@callback
+def _ignore_event(_event: Event) -> None:
+    """Event listener for filters that never pass an event."""
+
+
+def data_store(hass: HomeAssistant, username: str) -> Store:
+    """Return the store holding an account's last good data."""
+    return Store(hass, STORE_VERSION, f"{STORE_KEY}.{username}")
+
+
 class OceanAPI:
     """API client for OCEAN Mining Pool."""
 
-    def __init__(self, username: str, session: aiohttp.ClientSession):
+    def __init__(
+        self, username: str, engine: OceanPollingEngine, loads: JSONLoads = json_loads
+    ):
         """Initialize API."""
         self.username = username
-        self.session = session
+        self.engine = engine
+        self._loads = loads
+        # Per URL: validators and body hash of the last response
+        self._cache: dict[str, dict[str, Any]] = {}
+        # Per URL: the fetch currently in flight, shared by concurrent callers
+        self._inflight: dict[str, asyncio.Future] = {}
+        self._scrape_semaphore = asyncio.Semaphore(SCRAPE_MAX_CONCURRENCY)
+        # Per URL: circuit breaker pausing requests while the endpoint fails
+        self.breakers: dict[str, CircuitBreaker] = {}
+        self.stats = {
+            "requests": 0,
+            "not_modified": 0,
+            "unchanged": 0,
+            "coalesced": 0,
+            "short_circuited": 0,
+        }
+        # Per-phase timings and sizes of the account's polls and scrapes
+        self.metrics = Metrics(METRICS_SAMPLES)
+        # Profiling session started by the profile_update service
+        self.profile: UpdateProfile | None = None
 
-    async def fetch_statsnap(self) -> dict[str, Any] | None:
-        """Fetch account stats snapshot."""
-        url = API_STATSNAP.format(username=self.username)
-        try:
-            async with self.session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
-                if response.status != 200:
-                    _LOGGER.error(f"HTTP {response.status} from {url}")
-                    return None
-                data = await response.json()
-                return data.get("result")
-        except asyncio.TimeoutError:
-            _LOGGER.error(f"Timeout fetching {url}")
-            return None
-        except aiohttp.ClientError as err:
-            _LOGGER.error(f"Client error fetching {url}: {err}")
-            return None
-        except Exception as err:
-            _LOGGER.exception(f"Unexpected error fetching {url}: {err}")
+    async def _single_flight(self, url: str, fetch: Callable[[], Awaitable[_T]]) -> _T:
+        """Run fetch for url, or join the fetch of url that is already in flight."""
+        task = self._inflight.get(url)
+        if task is None:
+            coro = fetch()
+            if self.profile is not None:
+                coro = self.profile.async_run(coro)
+            task = asyncio.ensure_future(coro)
+            self._inflight[url] = task
+            task.add_done_callback(lambda _: self._inflight.pop(url, None))
+        else:
+            self.stats["coalesced"] += 1
+            _LOGGER.debug(f"Joining in-flight request for {url}")
+        # A cancelled caller must not cancel the request for the others
+        return await asyncio.shield(task)
+
+    async def _request(self, url: str, attempt: Callable[[], Awaitable[_T]]) -> _T | None:
+        """Run a request through the URL's circuit breaker, retrying transient failures.
+
+        attempt raises _FetchError when the request failed. Retries wait an
+        exponentially growing, fully jittered delay so accounts that failed
+        together do not retry in lockstep. Returns None when the request
+        failed or the breaker is open.
+        """
+        breaker = self.breakers.get(url)
+        if breaker is None:
+            breaker = self.breakers[url] = CircuitBreaker(
+                BREAKER_FAILURE_THRESHOLD, BREAKER_COOLDOWN, BREAKER_MAX_COOLDOWN
+            )
+        if not breaker.allow(time.monotonic()):
+            self.stats["short_circuited"] += 1
+            _LOGGER.debug(
+                f"Skipping request to {url}, paused for another "
+                f"{breaker.retry_in(time.monotonic()):.0f} s"
+            )
             return None
+        
+        try:
+            for retry in range(API_RETRY_ATTEMPTS):
+                if retry:
+                    delay = random.uniform(
+                        0, min(API_RETRY_MAX_DELAY, API_RETRY_BASE_DELAY * 2 ** (retry - 1))
+                    )
+                    self.metrics.increment(COUNTER_RETRIES)
+                    _LOGGER.debug(f"{error}, retrying in {delay:.1f} s")
+                    await asyncio.sleep(delay)
+                try:
+                    result = await attempt()
+                except _FetchError as err:
+                    error = err
+                    if not err.retryable:
+                        break
+                    continue
+                breaker.record_success()
+                return result
+        except asyncio.CancelledError:
+            breaker.release()
+            raise
+        
+        # Only unexpected errors carry their traceback
+        _LOGGER.error(str(error), exc_info=error.__cause__)
+        if breaker.record_failure(time.monotonic()):
+            _LOGGER.warning(
+                f"{url} failed {breaker.failures} times in a row, "
+                f"pausing requests for {breaker.cooldown:.0f} s"
+            )
+        return None
+
+    def retry_after(self) -> float:
+        """Return the seconds until a request to one of the API endpoints may be sent."""
+        now = time.monotonic()
+        return min(
+            self.breakers[url].retry_in(now) if url in self.breakers else 0.0
+            for url in (
+                API_STATSNAP.format(username=self.username),
+                API_USERINFO_FULL.format(username=self.username),
+            )
+        )
+
+    async def fetch_statsnap(
+        self, conditional: bool = True
+    ) -> tuple[dict[str, Any] | None, bool]:
+        """Fetch account stats snapshot, return (result, unchanged)."""
+        url = API_STATSNAP.format(username=self.username)
+        return await self._single_flight(
+            url if conditional else f"{url} unconditional",
+            lambda: self._fetch_result(url, conditional=conditional),
+        )
 
-    async def fetch_userinfo_full(self) -> dict[str, Any] | None:
-        """Fetch full user info including workers."""
+    async def fetch_userinfo_full(
+        self, conditional: bool = True
+    ) -> tuple[dict[str, Any] | StreamedUserinfo | None, bool]:
+        """Fetch full user info including workers, return (result, unchanged).
+
+        Large payloads are returned as a StreamedUserinfo whose workers are
+        decoded while they are consumed.
+        """
         url = API_USERINFO_FULL.format(username=self.username)
-        try:
-            async with self.session.get(url, timeout=aiohttp.ClientTimeout(total=10)) as response:
-                if response.status != 200:
-                    _LOGGER.error(f"HTTP {response.status} from {url}")
-                    return None
-                data = await response.json()
-                return data.get("result")
-        except asyncio.TimeoutError:
-            _LOGGER.error(f"Timeout fetching {url}")
-            return None
-        except aiohttp.ClientError as err:
-            _LOGGER.error(f"Client error fetching {url}: {err}")
-            return None
-        except Exception as err:
-            _LOGGER.exception(f"Unexpected error fetching {url}: {err}")
+        return await self._single_flight(
+            url if conditional else f"{url} unconditional",
+            lambda: self._fetch_result(url, stream_workers=True, conditional=conditional),
+        )
+
+    async def fetch_lifetime_earnings(
+        self, worker_name: str | None = None
+    ) -> tuple[float | None, float | None]:
+        """Scrape lifetime earnings of the account or one worker from its stats page.
+
+        Returns the value and the seconds spent parsing, which is None when the
+        page could not be fetched.
+        """
+        # Imported off the loop by the lifetime earnings coordinator's first refresh
+        from .scrape import LifetimeEarningsExtractor  # pylint: disable=import-outside-toplevel
+        
+        if worker_name is None:
+            url = STATS_ACCOUNT_URL.format(username=self.username)
+        else:
+            url = STATS_WORKER_URL.format(username=self.username, worker=worker_name)
+        
+        async def scrape() -> tuple[float | None, float | None]:
+            extractor = LifetimeEarningsExtractor()
+            parse_time = await self._scrape(url, extractor)
+            return extractor.value, parse_time
+        
+        return await self._single_flight(url, scrape)
+
+    async def fetch_account_earnings(
+        self,
+    ) -> tuple[float | None, dict[str, float] | None, float | None]:
+        """Scrape lifetime earnings of the account and its workers from the account page.
+
+        Returns the account value, the values of the workers listed in the
+        page's workers table (None without a table) and the seconds spent
+        parsing, which is None when the page could not be fetched.
+        """
+        # Imported off the loop by the lifetime earnings coordinator's first refresh
+        from .scrape import AccountPageExtractor  # pylint: disable=import-outside-toplevel
+        
+        url = STATS_ACCOUNT_URL.format(username=self.username)
+        
+        async def scrape() -> tuple[float | None, dict[str, float] | None, float | None]:
+            extractor = AccountPageExtractor(self.username)
+            parse_time = await self._scrape(url, extractor)
+            return extractor.value, extractor.workers, parse_time
+        
+        return await self._single_flight(url, scrape)
+
+    async def _scrape(
+        self, url: str, extractor: "LifetimeEarningsExtractor | AccountPageExtractor"
+    ) -> float | None:
+        """Fetch a stats page into an extractor, return the seconds spent parsing.
+
+        The page is scanned in batches on the parse pool while it streams in and
+        the download stops as soon as the extractor has found its values.
+        Returns None when the page could not be fetched.
+        """
+        parse_pool = self.engine.parse_pool
+        # Only one profiler can be active in a process, so a profile session
+        # parses on the event loop where its profiler runs
+        inline = self.profile is not None
+        
+        async def scrape() -> tuple[float, int]:
+            parse_time = 0.0
+            received = 0
+            # An extractor that was fed cannot be rewound, so the request is not retried
+            fed = False
+            try:
+                async with self._scrape_semaphore, self.engine.session.get(
+                    url, timeout=aiohttp.ClientTimeout(total=SCRAPE_TIMEOUT)
+                ) as response:
+                    if response.status != 200:
+                        raise _FetchError(
+                            f"HTTP {response.status} from {url}", _is_transient(response.status)
+                        )
+                    
+                    decoder = codecs.getincrementaldecoder(response.charset or "utf-8")(errors="replace")
+                    pending: list[bytes] = []
+                    pending_size = 0
+                    found = False
+                    async for chunk in response.content.iter_chunked(SCRAPE_CHUNK_SIZE):
+                        pending.append(chunk)
+                        pending_size += len(chunk)
+                        received += len(chunk)
+                        if pending_size < SCRAPE_CHUNK_SIZE:
+                            continue
+                        fed = True
+                        found, elapsed = await parse_pool.async_feed(
+                            extractor, decoder, b"".join(pending), inline=inline
+                        )
+                        parse_time += elapsed
+                        pending.clear()
+                        pending_size = 0
+                        if found:
+                            break
+                    if not found:
+                        fed = True
+                        _, elapsed = await parse_pool.async_feed(
+                            extractor, decoder, b"".join(pending), final=True, inline=inline
+                        )
+                        parse_time += elapsed
+            except _FetchError:
+                raise
+            except asyncio.TimeoutError:
+                raise _FetchError(f"Timeout fetching lifetime earnings from {url}", not fed) from None
+            except aiohttp.ClientError as err:
+                raise _FetchError(
+                    f"Error fetching lifetime earnings from {url}: {err}", not fed
+                ) from None
+            except Exception as err:
+                raise _FetchError(
+                    f"Error fetching lifetime earnings from {url}: {err}", retryable=False
+                ) from None
+            return parse_time, received
+        
+        if (scraped := await self._request(url, scrape)) is None:
             return None
+        parse_time, received = scraped
+        self.metrics.record(METRIC_SCRAPE_BYTES, received)
+        
+        if not extractor.found:
+            _LOGGER.warning(f"Could not find Lifetime Earnings on page: {url}")
+        return parse_time
+
+    async def _fetch_result(
+        self, url: str, stream_workers: bool = False, conditional: bool = True
+    ) -> tuple[dict[str, Any] | StreamedUserinfo | None, bool]:
+        """Fetch an API endpoint, return (result payload, unchanged).
+
+        Only the validators and a hash of the last body are kept, not the
+        decoded result. A conditional fetch sends the validators and reports
+        a 304 or a byte-identical body as unchanged without a result. An
+        unconditional fetch always decodes the body, for callers that no
+        longer have the previous result. The result is None on failure.
+        """
+        cached = self._cache.get(url) if conditional else None
+        headers = {}
+        if cached:
+            if cached["etag"]:
+                headers[hdrs.IF_NONE_MATCH] = cached["etag"]
+            if cached["last_modified"]:
+                headers[hdrs.IF_MODIFIED_SINCE] = cached["last_modified"]
+        
+        async def request() -> tuple[int, bytes, str | None, str | None]:
+            self.stats["requests"] += 1
+            start = time.perf_counter()
+            try:
+                async with self.engine.async_request() as session, session.get(
+                    url, headers=headers, timeout=aiohttp.ClientTimeout(total=API_TIMEOUT)
+                ) as response:
+                    if response.status == 304 and cached:
+                        return 304, b"", None, None
+                    if response.status != 200:
+                        raise _FetchError(
+                            f"HTTP {response.status} from {url}", _is_transient(response.status)
+                        )
+                    body = await response.read()
+                    etag = response.headers.get(hdrs.ETAG)
+                    last_modified = response.headers.get(hdrs.LAST_MODIFIED)
+            except _FetchError:
+                raise
+            except asyncio.TimeoutError:
+                raise _FetchError(f"Timeout fetching {url}") from None
+            except aiohttp.ClientError as err:
+                raise _FetchError(f"Client error fetching {url}: {err}") from None
+            except Exception as err:
+                raise _FetchError(
+                    f"Unexpected error fetching {url}: {err}", retryable=False
+                ) from err
+            self.metrics.record(METRIC_FETCH, time.perf_counter() - start)
+            return response.status, body, etag, last_modified
+        
+        if (response := await self._request(url, request)) is None:
+            return None, False
+        status, body, etag, last_modified = response
+        if status == 304:
+            self.stats["not_modified"] += 1
+            return None, True
+        self.metrics.record(METRIC_BYTES_RECEIVED, len(body))
+        
+        digest = hashlib.sha1(body).digest()
+        if cached and cached["digest"] == digest:
+            self.stats["unchanged"] += 1
+            cached["etag"] = etag
+            cached["last_modified"] = last_modified
+            return None, True
+        
+        try:
+            with self.metrics.timer(METRIC_DECODE):
+                if stream_workers and len(body) >= STREAM_DECODE_MIN_BYTES:
+                    # Decoding errors surface while the workers are iterated
+                    result = StreamedUserinfo(body.decode("utf-8"))
+                else:
+                    result = self._loads(body).get("result")
+        except ValueError as err:
+            _LOGGER.error(f"Invalid JSON from {url}: {err}")
+            return None, False
+        
+        self._cache[url] = {
+            "etag": etag,
+            "last_modified": last_modified,
+            "digest": digest,
+        }
+        return result, False
 
 
 class OceanCoordinator(DataUpdateCoordinator):
@@ -95,18 +480,83 @@ class OceanCoordinator(DataUpdateCoordinator):
         hass: HomeAssistant,
         username: str,
         scan_interval: int,
-        session: aiohttp.ClientSession,
+        engine: OceanPollingEngine,
+        worker_retention: int = 0,
+        worker_scan_interval: int = 0,
+        exchange_rate_entity: str = EXCHANGE_RATE_ENTITY,
+        worker_include: Iterable[str] | None = None,
+        worker_entity_types: Iterable[str] = WORKER_ENTITY_TYPES,
     ) -> None:
         """Initialize coordinator."""
         self.username = username
-        self.api = OceanAPI(username, session)
+        self.api = OceanAPI(username, engine)
+        self.metrics = self.api.metrics
         self._failure_count = 0
+        # Wall clock time the current data was fetched, and whether it is
+        # served past a failed update
+        self._fetched_at: float | None = None
+        self.stale = False
+        # Endpoint whose last fetched payload is parsed into self.data
+        self._last_parsed: str | None = None
+        # What changed in the last update, used to skip unchanged state writes
+        self._all_changed = True
+        self.changed_keys: set[str] = set()
+        self.changed_workers: set[str] = set()
+        # Poll timing follows OCEAN's snapshot rolls, scan_interval is the fallback
+        self._scan_interval = timedelta(seconds=scan_interval)
+        self.scheduler = SnapshotScheduler(scan_interval)
+        self.block_found = False
+        # Worker rows are updated in place on every userinfo_full poll
+        self.workers = WorkerTable()
+        # Polls in between only fetch the small statsnap, 0 fetches workers every poll
+        self._worker_scan_interval = worker_scan_interval
+        self._workers_fetched = float("-inf")
+        self._workers_requested = False
+        # Workers that have entities, and the changes not yet published to the platforms
+        self.worker_registry: set[str] = set()
+        self._workers_added: set[str] = set()
+        self._workers_removed: set[str] = set()
+        self._workers_listeners: list[Callable[[set[str], set[str]], None]] = []
+        # Workers that get entities, None for all, and which entities they get
+        self._worker_include = set(worker_include) if worker_include is not None else None
+        self.worker_entity_types = set(worker_entity_types)
+        # Seconds a worker may be missing from the API before it is removed, 0 never
+        self._worker_retention = worker_retention
+        # Rolling hashrate statistics, sampled whenever new data is parsed. Only
+        # workers with rolling entities keep samples and histograms, the others
+        # keep the running sums of the 24h average the fleet sensors need
+        self.account_rolling = RollingStats(ROLLING_ACCOUNT_CAPACITY, ROLLING_WINDOWS)
+        self.worker_rolling: dict[str, RollingStats | RollingMean] = {}
+        self._worker_rolling_capacity = math.ceil(
+            ROLLING_WINDOWS[-1]
+            / max(worker_scan_interval or scan_interval, ROLLING_MIN_SAMPLE_INTERVAL)
+        )
+        self.account_sampled = False
+        self.workers_sampled = False
+        # Aggregates over all workers for the fleet sensors
+        self.fleet = self._summarize_fleet()
+        # BTC to USD rate shared by all USD sensors of the account
+        self.exchange_rate = ExchangeRateCache(hass, exchange_rate_entity)
+        # Last good data, loaded on startup so entities do not wait for the API
+        self._store = data_store(hass, username)
+        # A delayed save is rescheduled by every call, so only one is requested
+        # at a time and it writes whatever data is current when it runs
+        self._save_pending = False
         
         super().__init__(
             hass=hass,
             logger=_LOGGER,
             name=f"OCEAN {username}",
             update_interval=timedelta(seconds=scan_interval),
+            # Returning the previous data object skips the listener fan-out
+            always_update=False,
+        )
+        
+        # One shared scrape coordinator per account for all lifetime earnings sensors
+        self.lifetime_coordinator = OceanLifetimeEarningsCoordinator(
+            hass=hass,
+            username=username,
+            api=self.api,
         )
 
     def _parse_account_data(self, data: dict[str, Any]) -> dict[str, Any]:
@@ -134,68 +584,427 @@ class OceanCoordinator(DataUpdateCoordinator):
         
         return result
 
-    def _parse_workers(self, workers_list: list) -> dict[str, dict[str, Any]]:
-        """Parse worker data from userinfo_full."""
-        workers = {}
-        
-        if not workers_list:
-            return workers
-        
-        for worker_dict in workers_list:
-            # Each worker is a dict with one key (worker name) and value (worker data)
-            for worker_name, worker_data in worker_dict.items():
-                # Convert hashrate to TH/s
-                hashrate_60s = float(worker_data.get("hashrate_60s", 0)) / 1_000_000_000_000
-                hashrate_300s = float(worker_data.get("hashrate_300s", 0)) / 1_000_000_000_000
-                
-                workers[worker_name] = {
-                    "hashrate_60s": hashrate_60s,
-                    "hashrate_300s": hashrate_300s,
-                    "shares_60s": int(worker_data.get("shares_60s", 0)),
-                    "shares_300s": int(worker_data.get("shares_300s", 0)),
-                    "last_share_ts": worker_data.get("lastest_share_ts"),
-                    "shares_in_tides": int(worker_data.get("shares_in_tides", 0)),
-                    "estimated_earn_next_block": float(worker_data.get("estimated_earn_next_block", 0)),
-                    "estimated_bonus_next_block": float(worker_data.get("estimated_bonus_earn_next_block", 0)),
-                    "estimated_total_earn_next_block": float(worker_data.get("estimated_total_earn_next_block", 0)),
-                    "is_active": int(worker_data.get("shares_60s", 0)) > 0,
-                }
-        
-        return workers
+    async def async_restore_data(self) -> bool:
+        """Load the last saved data as current data, return True if there was any."""
+        stored = await self._store.async_load()
+        if not stored:
+            return False
+        
+        workers = WorkerTable()
+        try:
+            workers.restore(stored["workers"])
+        except (KeyError, IndexError, TypeError, ValueError) as err:
+            _LOGGER.warning(f"Ignoring invalid saved OCEAN data for {self.username}: {err}")
+            return False
+        self.workers = workers
+        # Platforms create the restored workers' entities during setup
+        self.worker_registry = set(filter(self._worker_has_entities, workers.names))
+        self.fleet = self._summarize_fleet()
+        
+        data = {**DEFAULT_DATA, **stored["account"]}
+        data["workers"] = workers
+        data["workers_version"] = workers.version
+        data["active_workers"] = workers.active_count
+        self._fetched_at = stored.get("fetched_at", stored.get("saved_at"))
+        if self._fetched_at is not None:
+            data["data_age"] = round(max(0.0, time.time() - self._fetched_at))
+        self.data = data
+        if stored.get("lifetime"):
+            self.lifetime_coordinator.data = stored["lifetime"]
+            self.lifetime_coordinator.scraped_at = stored.get("lifetime_scraped_at")
+        
+        _LOGGER.debug(
+            f"Restored OCEAN data for {self.username} saved at {stored.get('saved_at')} "
+            f"with {len(workers)} workers"
+        )
+        return True
+
+    async def async_shutdown(self) -> None:
+        """Stop polling and write a save that is still waiting for its delay."""
+        await super().async_shutdown()
+        if self._save_pending:
+            # Also cancels the delayed write and the write on stop of the store
+            await self._store.async_save(self._data_to_store())
+
+    @callback
+    def _data_to_store(self) -> dict[str, Any]:
+        """Return the current data in its compact stored form."""
+        self._save_pending = False
+        return {
+            "saved_at": time.time(),
+            "fetched_at": self._fetched_at,
+            "account": {
+                key: value
+                for key, value in self.data.items()
+                if key not in ("workers", "workers_version", "data_age")
+            },
+            "workers": self.workers.as_compact(),
+            "lifetime": self.lifetime_coordinator.data,
+            "lifetime_scraped_at": self.lifetime_coordinator.scraped_at,
+        }
+
+    @callback
+    def async_add_workers_listener(
+        self, update_callback: Callable[[set[str], set[str]], None]
+    ) -> CALLBACK_TYPE:
+        """Listen for workers added to and removed from the registry."""
+        self._workers_listeners.append(update_callback)
+        
+        @callback
+        def remove_listener() -> None:
+            self._workers_listeners.remove(update_callback)
+        
+        return remove_listener
+
+    def _worker_has_entities(self, worker_name: str) -> bool:
+        """Return True if the worker gets its own entities."""
+        return self._worker_include is None or worker_name in self._worker_include
+
+    @callback
+    def _async_register_workers(self, workers: Iterable[str]) -> None:
+        """Add workers to the registry, queueing the new ones for the platforms."""
+        for worker_name in filter(self._worker_has_entities, workers):
+            if worker_name not in self.worker_registry:
+                self.worker_registry.add(worker_name)
+                self._workers_added.add(worker_name)
+                self._workers_removed.discard(worker_name)
+                if isinstance(self.worker_rolling.get(worker_name), RollingMean):
+                    # Its rolling entities need the full statistics
+                    del self.worker_rolling[worker_name]
+
+    @callback
+    def async_remove_workers(self, workers: Iterable[str]) -> None:
+        """Remove workers from the registry, the platforms drop their entities."""
+        for worker_name in workers:
+            if worker_name in self.worker_registry:
+                self.worker_registry.discard(worker_name)
+                self._workers_removed.add(worker_name)
+                self._workers_added.discard(worker_name)
+
+    @callback
+    def _async_evict_workers(self, cutoff: float) -> None:
+        """Remove workers missing from the API since before cutoff, with their devices."""
+        stale = self.workers.missing_since(cutoff)
+        if not stale:
+            return
+        
+        _LOGGER.info(f"Removing {len(stale)} workers of {self.username} that disappeared: {stale}")
+        self.workers.remove(stale)
+        self.async_remove_workers(stale)
+        for worker_name in stale:
+            self.worker_rolling.pop(worker_name, None)
+        
+        device_registry = dr.async_get(self.hass)
+        for worker_name in stale:
+            self.lifetime_coordinator.async_remove_worker(worker_name)
+            device = device_registry.async_get_device(
+                identifiers={(DOMAIN, f"{self.username}_{worker_name}")}
+            )
+            if device is not None:
+                device_registry.async_remove_device(device.id)
+
+    @callback
+    def async_remove_unregistered_devices(self, config_entry_id: str) -> None:
+        """Remove worker devices, with their entities, of workers not in the registry."""
+        device_registry = dr.async_get(self.hass)
+        prefix = f"{self.username}_"
+        for device in dr.async_entries_for_config_entry(device_registry, config_entry_id):
+            for domain, identifier in device.identifiers:
+                if (
+                    domain == DOMAIN
+                    and identifier.startswith(prefix)
+                    and identifier[len(prefix):] not in self.worker_registry
+                ):
+                    _LOGGER.debug(f"Removing device of worker {identifier[len(prefix):]}")
+                    device_registry.async_remove_device(device.id)
+                    break
+
+    @callback
+    def async_remove_unused_worker_entities(
+        self, config_entry_id: str, platform: str, unique_ids: set[str]
+    ) -> None:
+        """Remove a platform's worker entities that were not created this setup."""
+        account_device = dr.async_get(self.hass).async_get_device(
+            identifiers={(DOMAIN, self.username)}
+        )
+        entity_registry = er.async_get(self.hass)
+        for entry in er.async_entries_for_config_entry(entity_registry, config_entry_id):
+            if (
+                entry.domain == platform
+                and entry.device_id is not None
+                and (account_device is None or entry.device_id != account_device.id)
+                and entry.unique_id not in unique_ids
+            ):
+                _LOGGER.debug(f"Removing unused worker entity {entry.entity_id}")
+                entity_registry.async_remove(entry.entity_id)
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Publish worker registry changes, then update the entities."""
+        if self._workers_added or self._workers_removed:
+            added, self._workers_added = self._workers_added, set()
+            removed, self._workers_removed = self._workers_removed, set()
+            for update_callback in list(self._workers_listeners):
+                update_callback(added, removed)
+        
+        # Entities write their states synchronously while they are notified,
+        # so every state change fired during the fan-out is one of ours
+        state_writes = 0
+        
+        @callback
+        def count_state_write(_event: Event) -> bool:
+            nonlocal state_writes
+            state_writes += 1
+            return False
+        
+        unsub = self.hass.bus.async_listen(
+            EVENT_STATE_CHANGED, _ignore_event, event_filter=count_state_write
+        )
+        try:
+            with self.metrics.timer(METRIC_FAN_OUT):
+                if self.api.profile is not None:
+                    with self.api.profile.active():
+                        super().async_update_listeners()
+                else:
+                    super().async_update_listeners()
+        finally:
+            unsub()
+        self.metrics.record(METRIC_ENTITIES_NOTIFIED, len(self._listeners))
+        self.metrics.record(METRIC_STATE_WRITES, state_writes)
+
+    def _workers_due(self) -> bool:
+        """Return True if this poll should fetch the worker list."""
+        return (
+            not self._worker_scan_interval
+            or self._workers_requested
+            or self.data is None
+            or time.monotonic() - self._workers_fetched >= self._worker_scan_interval
+        )
+
+    @callback
+    def _async_workers_fetched(self) -> None:
+        """Record a successful worker list fetch."""
+        self._workers_fetched = time.monotonic()
+        self._workers_requested = False
+
+    async def async_request_workers_refresh(self) -> None:
+        """Request a refresh that includes the worker list."""
+        self._workers_requested = True
+        await self.async_request_refresh()
+
+    @callback
+    def _async_sample(self, data: dict[str, Any], workers: bool) -> None:
+        """Add the parsed data to the rolling statistics."""
+        now = time.time()
+        self.account_rolling.add(now, data["hashrate_60s"], data["shares_60s"] > 0)
+        self.account_sampled = True
+        if not workers:
+            return
+        
+        rolling = self.worker_rolling
+        for worker_name, hashrate, active in self.workers.samples():
+            if (stats := rolling.get(worker_name)) is None:
+                stats = rolling[worker_name] = self._new_worker_rolling(worker_name)
+            stats.add(now, hashrate, active)
+        self.workers_sampled = True
+        self.fleet = self._summarize_fleet()
+
+    def _new_worker_rolling(self, worker_name: str) -> RollingStats | RollingMean:
+        """Return empty rolling statistics for a worker."""
+        if "rolling" in self.worker_entity_types and worker_name in self.worker_registry:
+            return RollingStats(self._worker_rolling_capacity, ROLLING_WINDOWS)
+        return RollingMean(ROLLING_WINDOWS[-1], ROLLING_MEAN_BUCKETS)
+
+    def _summarize_fleet(self) -> dict[str, dict[str, Any]]:
+        """Return the fleet sensor values and attributes for the worker table."""
+        return summarize_fleet(
+            self.workers,
+            self.worker_rolling,
+            ROLLING_WINDOWS[-1],
+            FLEET_UNDERPERFORM_RATIO,
+            FLEET_TOP_UNDERPERFORMERS,
+            FLEET_OFFLINE_LIST_LIMIT,
+        )
+
+    @callback
+    def fleet_changed(self) -> bool:
+        """Return True if the fleet summary was recomputed in the last update."""
+        return self._all_changed or not self.last_update_success or self.workers_sampled
+
+    @callback
+    def rolling_changed(self, worker_name: str | None = None) -> bool:
+        """Return True if the rolling statistics of the account or a worker changed."""
+        if self._all_changed or not self.last_update_success:
+            return True
+        return self.account_sampled if worker_name is None else self.workers_sampled
+
+    @callback
+    def key_changed(self, key: str) -> bool:
+        """Return True if an account-level value changed in the last update."""
+        return self._all_changed or not self.last_update_success or key in self.changed_keys
+
+    @callback
+    def worker_changed(self, worker_name: str) -> bool:
+        """Return True if a worker's data changed in the last update."""
+        return (
+            self._all_changed
+            or not self.last_update_success
+            or worker_name in self.changed_workers
+        )
+
+    def _diff_data(self, data: dict[str, Any], changed_workers: set[str]) -> None:
+        """Record which account keys and workers differ from the current data."""
+        previous = self.data
+        if self._all_changed or previous is None:
+            self._all_changed = True
+            self.changed_keys = set(data)
+            self.changed_workers = set(self.workers)
+            return
+        
+        self.changed_keys = {
+            key
+            for key, value in data.items()
+            if key != "workers" and previous.get(key) != value
+        }
+        # The worker table reports rows that changed, appeared or disappeared
+        self.changed_workers = changed_workers
+
+    @staticmethod
+    def _detect_block(previous: dict[str, Any] | None, data: dict[str, Any]) -> bool:
+        """Return True if the data shows earnings credited for a found block."""
+        if not previous or previous.get("snap_ts") is None:
+            return False
+        # Unpaid balance only grows when a block credits our share
+        return data["unpaid"] > previous["unpaid"]
+
+    def _schedule_next_poll(self, data: dict[str, Any]) -> None:
+        """Time the next poll to land just after the next expected snapshot."""
+        delay = self.scheduler.observe(data.get("snap_ts"), time.time(), self.block_found)
+        self.update_interval = timedelta(seconds=delay)
+        _LOGGER.debug(f"Next OCEAN poll for {self.username} in {delay:.1f} s")
 
     async def _async_update_data(self):
-        """Fetch data from OCEAN API."""
+        """Fetch data from OCEAN API, timing the whole update."""
+        if (profile := self.api.profile) is None:
+            with self.metrics.timer(METRIC_POLL):
+                return await self._async_poll()
+        
         try:
-            _LOGGER.debug(f"Fetching data for OCEAN user {self.username}")
+            with self.metrics.timer(METRIC_POLL):
+                return await profile.async_run(self._async_poll())
+        finally:
+            profile.cycles_left -= 1
+            if profile.cycles_left <= 0:
+                # Runs after this refresh has notified the entities
+                self.hass.async_create_task(self._async_finish_profile(profile))
+
+    @callback
+    def async_start_profile(self, cycles: int) -> bool:
+        """Profile the next update cycles, return False if a session is running."""
+        if self.api.profile is not None:
+            return False
+        _LOGGER.info(f"Profiling the next {cycles} OCEAN updates for {self.username}")
+        self.api.profile = UpdateProfile(cycles)
+        return True
+
+    async def _async_finish_profile(self, profile: UpdateProfile) -> None:
+        """Stop profiling and write the stats file to the config directory."""
+        self.api.profile = None
+        path = self.hass.config.path(
+            f"{DOMAIN}_profile_{self.username}_{dt_util.utcnow():%Y%m%d_%H%M%S}.prof"
+        )
+        try:
+            summary = await self.hass.async_add_executor_job(profile.save, path)
+        except OSError as err:
+            _LOGGER.error(f"Could not write OCEAN update profile to {path}: {err}")
+            return
+        _LOGGER.info(f"Wrote OCEAN update profile for {self.username} to {path}\n{summary}")
+
+    async def _async_poll(self):
+        """Fetch and parse the account data."""
+        # Fall back to the fixed interval unless a snapshot was observed
+        self.update_interval = self._scan_interval
+        self.block_found = False
+        self.account_sampled = self.workers_sampled = False
+        
+        # Everything is rewritten after a failed update or on the first update,
+        # last good data served in between left the entities' states intact
+        self._all_changed = self.data is None or not self.last_update_success
+        
+        try:
+            fetch_workers = self._workers_due()
+            endpoint = API_USERINFO_FULL if fetch_workers else API_STATSNAP
+            # An unchanged payload can only be skipped when it is the one parsed last
+            conditional = self.data is not None and self._last_parsed == endpoint
+            if fetch_workers:
+                _LOGGER.debug(f"Fetching data for OCEAN user {self.username}")
+                # Fetch userinfo_full (includes everything we need)
+                payload, unchanged = await self.api.fetch_userinfo_full(conditional)
+            else:
+                _LOGGER.debug(f"Fetching stats snapshot for OCEAN user {self.username}")
+                payload, unchanged = await self.api.fetch_statsnap(conditional)
             
-            # Fetch userinfo_full (includes everything we need)
-            userinfo = await self.api.fetch_userinfo_full()
+            # Payload identical to the one already parsed, nothing to do
+            if unchanged:
+                self._failure_count = 0
+                self._fetched_at = time.time()
+                if fetch_workers:
+                    self._async_workers_fetched()
+                _LOGGER.debug(f"OCEAN data unchanged for {self.username}")
+                self._schedule_next_poll(self.data)
+                return self.data
             
-            if not userinfo:
-                self._failure_count += 1
-                
-                if self._failure_count == 1:
-                    _LOGGER.warning(f"OCEAN API returned no data for {self.username}")
-                    return DEFAULT_DATA.copy()
-                
-                raise UpdateFailed(f"OCEAN API failed for {self.username}")
+            if not payload:
+                return self._stale_data(f"OCEAN API returned no data for {self.username}")
             
             # Parse data
             data = DEFAULT_DATA.copy()
             data["username"] = self.username
             
-            # Get account-level data from user_full section
-            if "user_full" in userinfo:
-                data.update(self._parse_account_data(userinfo["user_full"]))
+            if fetch_workers:
+                # Update worker rows in place, large payloads are decoded worker by worker
+                with self.metrics.timer(METRIC_PARSE_WORKERS):
+                    if isinstance(payload, StreamedUserinfo):
+                        changed_workers = self.workers.update(payload.iter_workers())
+                        result = payload.fields
+                    else:
+                        changed_workers = self.workers.update(payload.get("workers"))
+                        result = payload
+                self.metrics.record(METRIC_WORKERS_PARSED, len(self.workers))
+                self._async_workers_fetched()
+                self._async_register_workers(self.workers.appeared)
+                if self._worker_retention:
+                    self._async_evict_workers(time.time() - self._worker_retention)
+                account = result.get("user_full")
+            else:
+                # The snapshot only carries account-level values, workers stay as they are
+                changed_workers = set()
+                account = payload
+            
+            # Get account-level data from user_full section or the snapshot
+            if account:
+                data.update(self._parse_account_data(account))
             
-            # Parse workers
-            if "workers" in userinfo:
-                data["workers"] = self._parse_workers(userinfo["workers"])
-                # Count active workers
-                data["active_workers"] = sum(1 for w in data["workers"].values() if w["is_active"])
+            data["workers"] = self.workers
+            # The table is the same object every poll, its version tells polls apart
+            data["workers_version"] = self.workers.version
+            data["active_workers"] = self.workers.active_count
             
             # Reset failure count on success
             self._failure_count = 0
+            self.stale = False
+            self._fetched_at = time.time()
+            self._last_parsed = endpoint
+            
+            self._diff_data(data, changed_workers)
+            self._async_sample(data, fetch_workers)
+            self.block_found = self._detect_block(self.data, data)
+            if self.block_found:
+                self.lifetime_coordinator.async_block_found()
+            self._schedule_next_poll(data)
+            if (self.changed_keys or self.changed_workers) and not self._save_pending:
+                self._save_pending = True
+                self._store.async_delay_save(self._data_to_store, STORE_SAVE_DELAY)
             
             _LOGGER.debug(
                 f"Got data from OCEAN for {self.username}: "
@@ -203,22 +1012,223 @@ class OceanCoordinator(DataUpdateCoordinator):
                 f"hashrate_300s={data.get('hashrate_300s', 0):.2f} TH/s, "
                 f"unpaid={data.get('unpaid', 0):.8f} BTC, "
                 f"workers={len(data.get('workers', {}))}, "
-                f"active={data.get('active_workers', 0)}"
+                f"active={data.get('active_workers', 0)}, "
+                f"changed keys={len(self.changed_keys)}, "
+                f"changed workers={len(self.changed_workers)}"
             )
             
             return data
             
+        except UpdateFailed:
+            raise
         except Exception as err:
-            self._failure_count += 1
-            
-            if self._failure_count == 1:
-                _LOGGER.warning(f"Error fetching data from OCEAN for {self.username}: {err}")
-                return DEFAULT_DATA.copy()
-            
-            _LOGGER.exception(f"Failed to fetch data from OCEAN for {self.username}")
-            raise UpdateFailed(f"Error communicating with OCEAN API: {err}")
+            if not self._failure_count:
+                _LOGGER.exception(f"Failed to parse OCEAN data for {self.username}")
+            return self._stale_data(f"Error processing OCEAN data for {self.username}: {err}")
+
+    def _stale_data(self, reason: str) -> dict[str, Any]:
+        """Return the last good data marked with its age after a failed poll.
+        
+        Serving the previous values keeps the entities' states and the
+        recorder's statistics intact during short outages instead of
+        dropping them to zero. Raises UpdateFailed once the data is older
+        than STALE_MAX_AGE, or when there is none.
+        """
+        self._failure_count += 1
+        self._last_parsed = None
+        self.metrics.increment(COUNTER_FAILURES)
+        # Do not poll again before the API endpoints accept requests
+        self.update_interval = max(
+            self._scan_interval, timedelta(seconds=self.api.retry_after())
+        )
+        
+        if self.data is None or self._fetched_at is None:
+            self.stale = False
+            raise UpdateFailed(reason)
+        age = time.time() - self._fetched_at
+        if age > STALE_MAX_AGE:
+            self.stale = False
+            raise UpdateFailed(f"{reason}, last good data is {age:.0f} s old")
+        
+        if not self.stale:
+            _LOGGER.warning(f"{reason}, keeping the last good data while retrying")
+        self.stale = True
+        # Only the data age changes, the entities skip their state writes
+        self._all_changed = False
+        self.changed_keys = {"data_age"}
+        self.changed_workers = set()
+        return {**self.data, "data_age": round(age)}
 
     @property
     def available(self) -> bool:
-        """Return if OCEAN API is available."""
-        return self._failure_count < 2
+        """Return if OCEAN data is current, or recent enough to be served stale."""
+        return not self._failure_count or self.stale
+
+
+class OceanLifetimeEarningsCoordinator(DataUpdateCoordinator):
+    """Shared coordinator scraping lifetime earnings for an account and its workers.
+
+    A single timer drives every lifetime earnings sensor of the account. Stats
+    pages are fetched under a bounded concurrency limit and the results are
+    fanned out to the sensors through the coordinator data.
+    
+    Lifetime earnings only change when a found block is credited, so the
+    pages are scraped when the account coordinator detects a block, once
+    more shortly after in case the pages lag behind, and otherwise only
+    every LIFETIME_SAFETY_INTERVAL.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        username: str,
+        api: OceanAPI,
+    ) -> None:
+        """Initialize coordinator."""
+        self.username = username
+        self.api = api
+        # Wall clock time of the last scrape, saved with the account data
+        self.scraped_at: float | None = None
+        self._unsub_followup: CALLBACK_TYPE | None = None
+        # Stats page scraping is loaded on the first refresh, see _async_update_data
+        self._scrape_loaded = False
+        self._workers: set[str] = set()
+        self._warned_no_table = False
+        # Parse time of the last refresh, split by where it ran
+        self.parse_stats = {"pages": 0, "loop_blocked": 0.0, "offloaded": 0.0}
+        
+        super().__init__(
+            hass=hass,
+            logger=_LOGGER,
+            name=f"OCEAN {username} Lifetime Earnings",
+            update_interval=timedelta(seconds=LIFETIME_SAFETY_INTERVAL),
+        )
+
+    @property
+    def scrape_due(self) -> bool:
+        """Return True if the last scrape is older than the safety interval."""
+        return (
+            self.data is None
+            or self.scraped_at is None
+            or time.time() - self.scraped_at >= LIFETIME_SAFETY_INTERVAL
+        )
+
+    @callback
+    def async_block_found(self) -> None:
+        """Scrape now and again after LIFETIME_BLOCK_FOLLOWUP for a found block."""
+        _LOGGER.debug(f"Block found for {self.username}, scraping lifetime earnings")
+        self.hass.async_create_task(self.async_request_refresh())
+        self.async_cancel_followup()
+        self._unsub_followup = async_call_later(
+            self.hass, LIFETIME_BLOCK_FOLLOWUP, self._async_followup
+        )
+
+    @callback
+    def _async_followup(self, _now: datetime) -> None:
+        """Scrape again after a block, the stats pages may have lagged."""
+        self._unsub_followup = None
+        self.hass.async_create_task(self.async_request_refresh())
+
+    @callback
+    def async_cancel_followup(self) -> None:
+        """Cancel a pending follow-up scrape."""
+        if self._unsub_followup is not None:
+            self._unsub_followup()
+            self._unsub_followup = None
+
+    @property
+    def workers(self) -> set[str]:
+        """Return the workers whose stats pages are scraped."""
+        return self._workers
+
+    @callback
+    def async_add_worker(self, worker_name: str) -> None:
+        """Start scraping lifetime earnings for a worker."""
+        self._workers.add(worker_name)
+
+    @callback
+    def async_remove_worker(self, worker_name: str) -> None:
+        """Stop scraping lifetime earnings for a worker."""
+        self._workers.discard(worker_name)
+
+    async def _async_update_data(self) -> dict[str, Any]:
+        """Scrape lifetime earnings, timing the whole refresh."""
+        metrics = self.api.metrics
+        with metrics.timer(METRIC_SCRAPE):
+            if self.api.profile is not None:
+                data = await self.api.profile.async_run(self._async_scrape())
+            else:
+                data = await self._async_scrape()
+        metrics.record(
+            METRIC_SCRAPE_PARSE, self.parse_stats["loop_blocked"] + self.parse_stats["offloaded"]
+        )
+        return data
+
+    async def _async_scrape(self) -> dict[str, Any]:
+        """Scrape lifetime earnings for the account and all registered workers."""
+        if not self._scrape_loaded:
+            # Keep the scrape stack out of integration setup and import it off the loop
+            await self.hass.async_add_executor_job(import_module, ".scrape", __package__)
+            self._scrape_loaded = True
+        
+        self.parse_stats = {"pages": 0, "loop_blocked": 0.0, "offloaded": 0.0}
+        inline = self.api.engine.parse_pool.inline or self.api.profile is not None
+        
+        def count_page(parse_time: float | None) -> None:
+            if parse_time is not None:
+                self.parse_stats["pages"] += 1
+                self.parse_stats["loop_blocked" if inline else "offloaded"] += parse_time
+        
+        # The account page lists every worker's lifetime earnings in one table
+        account, table, parse_time = await self.api.fetch_account_earnings()
+        count_page(parse_time)
+        values = {
+            worker_name: table.get(worker_name) if table is not None else None
+            for worker_name in self._workers
+        }
+        
+        # Workers the table does not list fall back to their own page, unless
+        # the account page itself failed: the site is down or its breaker is open
+        if parse_time is None:
+            missing = []
+        else:
+            missing = [worker_name for worker_name, value in values.items() if value is None]
+            if table is None and missing and not self._warned_no_table:
+                self._warned_no_table = True
+                _LOGGER.warning(
+                    f"The account stats page of {self.username} has no workers table, "
+                    f"scraping the pages of {len(missing)} workers instead"
+                )
+        if missing:
+            _LOGGER.debug(
+                f"{len(missing)} workers of {self.username} not in the account page "
+                "workers table, scraping their pages"
+            )
+            pages = await asyncio.gather(
+                *(self.api.fetch_lifetime_earnings(worker_name) for worker_name in missing)
+            )
+            for worker_name, (value, parse_time) in zip(missing, pages):
+                values[worker_name] = value
+                count_page(parse_time)
+        
+        # Keep the last known value when a page fails to scrape
+        previous = self.data or {"account": None, "workers": {}}
+        data = {
+            "account": account if account is not None else previous["account"],
+            "workers": {},
+        }
+        for worker_name, value in values.items():
+            if value is None:
+                value = previous["workers"].get(worker_name)
+            data["workers"][worker_name] = value
+        
+        self.scraped_at = time.time()
+        
+        _LOGGER.debug(
+            f"Scraped lifetime earnings for {self.username}: "
+            f"{self.parse_stats['pages']} pages, "
+            f"parse loop_blocked={self.parse_stats['loop_blocked'] * 1000:.1f} ms, "
+            f"offloaded={self.parse_stats['offloaded'] * 1000:.1f} ms"
+        )
+        
+        return data
@@ -0,0 +1,124 @@
+"""JSON decoding helpers for OCEAN API payloads."""
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+import json
+from json.decoder import scanstring
+import re
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+JSONLoads = Callable[[bytes | str], Any]
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+def _stdlib_loads(data: bytes | str) -> Any:
+    """Decode JSON with the standard library."""
+    return json.loads(data)
+
+
+# orjson is several times faster on large bodies, fall back to the stdlib without it
+json_loads: JSONLoads = orjson.loads if orjson is not None else _stdlib_loads
+JSON_BACKEND = "orjson" if orjson is not None else "json"
+
+
+def _skip(text: str, pos: int) -> int:
+    """Return the position of the next non-whitespace character."""
+    return _WHITESPACE.match(text, pos).end()
+
+
+def _read_key(text: str, pos: int) -> tuple[str | None, int]:
+    """Read an object key and its colon, return (None, end) at the closing brace."""
+    pos = _skip(text, pos)
+    char = text[pos:pos + 1]
+    if char == "}":
+        return None, pos + 1
+    if char != '"':
+        raise ValueError(f"Expecting property name at char {pos}")
+    key, pos = scanstring(text, pos + 1)
+    pos = _skip(text, pos)
+    if text[pos:pos + 1] != ":":
+        raise ValueError(f"Expecting ':' delimiter at char {pos}")
+    return key, _skip(text, pos + 1)
+
+
+def _after_member(text: str, pos: int) -> int:
+    """Skip the comma separating object members."""
+    pos = _skip(text, pos)
+    return pos + 1 if text[pos:pos + 1] == "," else pos
+
+
+def _iter_array(text: str, pos: int) -> Iterator[Any]:
+    """Decode the array at `pos` one element at a time, return its end position."""
+    pos = _skip(text, pos + 1)
+    if text[pos:pos + 1] == "]":
+        return pos + 1
+    while True:
+        value, pos = _DECODER.raw_decode(text, pos)
+        yield value
+        pos = _skip(text, pos)
+        char = text[pos:pos + 1]
+        if char == "]":
+            return pos + 1
+        if char != ",":
+            raise ValueError(f"Expecting ',' delimiter at char {pos}")
+        pos = _skip(text, pos + 1)
+
+
+class StreamedUserinfo:
+    """userinfo_full result whose workers array is decoded element by element.
+
+    Large accounts carry thousands of workers. Instead of materialising the
+    whole object graph, :meth:`iter_workers` walks the document and yields
+    one worker at a time so it can be consumed straight into the worker
+    table. Every other member of ``result`` is decoded normally into
+    :attr:`fields`, which is complete once the iteration has finished. A
+    document without a ``result`` object raises ValueError at the end of the
+    iteration, like a body that does not decode.
+    """
+
+    def __init__(self, text: str) -> None:
+        """Initialize from the raw response text."""
+        self._text = text
+        self.fields: dict[str, Any] = {}
+
+    def iter_workers(self) -> Iterator[dict[str, Any]]:
+        """Yield the elements of result.workers, filling fields on the way."""
+        text = self._text
+        fields = self.fields = {}
+        found = False
+
+        pos = _skip(text, 0)
+        if text[pos:pos + 1] != "{":
+            raise ValueError("Expecting object at char 0")
+        pos += 1
+
+        while True:
+            key, pos = _read_key(text, pos)
+            if key is None:
+                if not found:
+                    raise ValueError("No result object in userinfo_full")
+                return
+            if key != "result" or text[pos:pos + 1] != "{":
+                _, pos = _DECODER.raw_decode(text, pos)
+                pos = _after_member(text, pos)
+                continue
+
+            found = True
+            pos += 1
+            while True:
+                key, pos = _read_key(text, pos)
+                if key is None:
+                    break
+                if key == "workers" and text[pos:pos + 1] == "[":
+                    pos = yield from _iter_array(text, pos)
+                else:
+                    fields[key], pos = _DECODER.raw_decode(text, pos)
+                pos = _after_member(text, pos)
+            pos = _after_member(text, pos)
@@ -0,0 +1,63 @@
+"""Diagnostics support for the OCEAN Mining Pool integration."""
+from __future__ import annotations
+
+import time
+from typing import Any
+
+from homeassistant.components.diagnostics import REDACTED, async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import CONF_USERNAME, CONF_WORKER_INCLUDE, DATA_ENGINE, DOMAIN
+from .decode import JSON_BACKEND
+
+# The username is the payout address
+TO_REDACT = {CONF_USERNAME, CONF_WORKER_INCLUDE, "username"}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    lifetime_coordinator = coordinator.lifetime_coordinator
+    engine = hass.data[DOMAIN][DATA_ENGINE]
+    now = time.monotonic()
+
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": async_redact_data(dict(entry.options), TO_REDACT),
+        },
+        "coordinator": {
+            "last_update_success": coordinator.last_update_success,
+            "stale": coordinator.stale,
+            "data_age": coordinator.data.get("data_age") if coordinator.data else None,
+            "failures_in_a_row": coordinator._failure_count,  # pylint: disable=protected-access
+            "update_interval": coordinator.update_interval.total_seconds(),
+            "snapshot_cadence": coordinator.scheduler.cadence,
+            "workers": len(coordinator.workers),
+            "workers_with_entities": len(coordinator.worker_registry),
+            "listeners": len(coordinator._listeners),  # pylint: disable=protected-access
+            "json_backend": JSON_BACKEND,
+        },
+        "api": {
+            **coordinator.api.stats,
+            # Breakers are keyed by URL, which contains the username
+            "breakers": {
+                url.replace(coordinator.username, REDACTED): breaker.as_dict(now)
+                for url, breaker in coordinator.api.breakers.items()
+            },
+        },
+        "metrics": coordinator.metrics.as_dict(),
+        "lifetime_earnings": {
+            "last_update_success": lifetime_coordinator.last_update_success,
+            "scraped_at": lifetime_coordinator.scraped_at,
+            "workers": len(lifetime_coordinator.workers),
+            "parse_stats": lifetime_coordinator.parse_stats,
+        },
+        "engine": {
+            "accounts": engine.accounts,
+            **engine.stats,
+        },
+    }
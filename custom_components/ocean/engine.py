@@ -0,0 +1,120 @@
+"""Domain-wide polling engine shared by all OCEAN Mining Pool accounts."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+import logging
+import time
+from typing import TYPE_CHECKING
+
+import aiohttp
+
+from homeassistant.core import callback
+
+from .const import (
+    ENGINE_MAX_CONCURRENCY,
+    ENGINE_REQUEST_BURST,
+    ENGINE_REQUESTS_PER_MINUTE,
+    ENGINE_SPREAD_WINDOW,
+)
+
+if TYPE_CHECKING:
+    from .coordinator import OceanCoordinator
+    from .scrape import ParsePool
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class OceanPollingEngine:
+    """Shared request budget, connection pool and poll spreading for all accounts.
+
+    Every API request of every account passes through :meth:`async_request`,
+    which enforces a global requests-per-minute token bucket and a maximum
+    number of requests in flight. Registered coordinators are given evenly
+    spaced poll phases so accounts do not all fetch right after the same
+    snapshot roll.
+    """
+
+    def __init__(
+        self,
+        session: aiohttp.ClientSession,
+        requests_per_minute: int = ENGINE_REQUESTS_PER_MINUTE,
+        max_concurrency: int = ENGINE_MAX_CONCURRENCY,
+        burst: int = ENGINE_REQUEST_BURST,
+    ) -> None:
+        """Initialize the engine."""
+        self.session = session
+        self._parse_pool: ParsePool | None = None
+        self._rate = requests_per_minute / 60
+        self._burst = burst
+        self._tokens = float(burst)
+        self._refilled = time.monotonic()
+        self._bucket_lock = asyncio.Lock()
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._coordinators: list[OceanCoordinator] = []
+        self.stats = {"requests": 0, "throttled": 0, "throttle_wait": 0.0}
+
+    @callback
+    def async_register(self, coordinator: OceanCoordinator) -> None:
+        """Add an account's coordinator to the engine."""
+        self._coordinators.append(coordinator)
+        self._async_spread_phases()
+
+    @callback
+    def async_unregister(self, coordinator: OceanCoordinator) -> None:
+        """Remove an account's coordinator from the engine."""
+        if coordinator in self._coordinators:
+            self._coordinators.remove(coordinator)
+            self._async_spread_phases()
+
+    @property
+    def parse_pool(self) -> ParsePool:
+        """Return the shared stats page parse pool, created on first use."""
+        if self._parse_pool is None:
+            # The scrape stack is imported by the first lifetime earnings refresh
+            from .scrape import ParsePool  # pylint: disable=import-outside-toplevel
+
+            self._parse_pool = ParsePool()
+        return self._parse_pool
+
+    @property
+    def accounts(self) -> int:
+        """Return the number of registered accounts."""
+        return len(self._coordinators)
+
+    @callback
+    def _async_spread_phases(self) -> None:
+        """Space the poll phases of all accounts evenly over the spread window."""
+        count = len(self._coordinators)
+        for index, coordinator in enumerate(self._coordinators):
+            coordinator.scheduler.phase = ENGINE_SPREAD_WINDOW * index / count
+
+    async def _async_take_token(self) -> None:
+        """Wait until the global request budget allows another request."""
+        async with self._bucket_lock:
+            now = time.monotonic()
+            self._tokens = min(self._burst, self._tokens + (now - self._refilled) * self._rate)
+            self._refilled = now
+            if self._tokens < 1:
+                wait = (1 - self._tokens) / self._rate
+                self.stats["throttled"] += 1
+                self.stats["throttle_wait"] += wait
+                _LOGGER.debug(f"OCEAN request budget exhausted, waiting {wait:.1f} s")
+                await asyncio.sleep(wait)
+                self._tokens = 1.0
+                self._refilled = time.monotonic()
+            self._tokens -= 1
+
+    @asynccontextmanager
+    async def async_request(self) -> AsyncIterator[aiohttp.ClientSession]:
+        """Reserve budget and a concurrency slot for one API request."""
+        await self._async_take_token()
+        async with self._semaphore:
+            self.stats["requests"] += 1
+            yield self.session
+
+    def shutdown(self) -> None:
+        """Release resources held by the engine."""
+        if self._parse_pool is not None:
+            self._parse_pool.shutdown()
@@ -0,0 +1,74 @@
+"""Cached BTC to USD exchange rate for the OCEAN Mining Pool integration."""
+from __future__ import annotations
+
+from collections.abc import Callable
+import logging
+
+from homeassistant.core import CALLBACK_TYPE, Event, HomeAssistant, State, callback
+from homeassistant.helpers.event import async_track_state_change_event
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class ExchangeRateCache:
+    """Exchange rate read from a Home Assistant entity.
+
+    The rate is parsed once per state change of the entity instead of on
+    every read, and listeners are told when it changes so USD sensors can
+    recompute their values right away.
+    """
+
+    def __init__(self, hass: HomeAssistant, entity_id: str) -> None:
+        """Initialize the cache."""
+        self.hass = hass
+        self.entity_id = entity_id
+        self.rate: float | None = None
+        self._listeners: list[CALLBACK_TYPE] = []
+        self._unsub: CALLBACK_TYPE | None = None
+
+    @callback
+    def async_start(self) -> CALLBACK_TYPE:
+        """Read the current rate and follow the entity, return a stop callback."""
+        self._set_rate(self.hass.states.get(self.entity_id))
+        self._unsub = async_track_state_change_event(
+            self.hass, [self.entity_id], self._async_state_changed
+        )
+        return self.async_stop
+
+    @callback
+    def async_stop(self) -> None:
+        """Stop following the entity."""
+        if self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+
+    @callback
+    def async_add_listener(self, update_callback: CALLBACK_TYPE) -> Callable[[], None]:
+        """Call update_callback whenever the rate changes."""
+        self._listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            self._listeners.remove(update_callback)
+
+        return remove_listener
+
+    def _set_rate(self, state: State | None) -> None:
+        """Parse the rate from the entity state."""
+        if state is None:
+            self.rate = None
+            return
+        try:
+            self.rate = float(state.state)
+        except (ValueError, TypeError):
+            _LOGGER.debug(f"Exchange rate {self.entity_id} is not a number: {state.state}")
+            self.rate = None
+
+    @callback
+    def _async_state_changed(self, event: Event) -> None:
+        """Update the rate and notify listeners."""
+        previous = self.rate
+        self._set_rate(event.data.get("new_state"))
+        if self.rate != previous:
+            for update_callback in list(self._listeners):
+                update_callback()
@@ -0,0 +1,74 @@
+"""Fleet-wide worker summary for the OCEAN Mining Pool integration."""
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import Any
+
+from .rolling import RollingMean, RollingStats
+from .workers import WorkerTable
+
+
+def summarize_fleet(
+    table: WorkerTable,
+    rolling: Mapping[str, RollingStats | RollingMean],
+    window: float,
+    ratio: float,
+    top_n: int,
+    list_limit: int,
+) -> dict[str, dict[str, Any]]:
+    """Aggregate the worker table into fleet sensor values and attributes.
+
+    A worker underperforms when its 300s hashrate is below `ratio` times its
+    average over `window`. Offline workers are only counted as offline. The
+    attribute lists are capped so the state stays small on large fleets.
+    """
+    hashrate_60s = table.columns["hashrate_60s"]
+    hashrate_300s = table.columns["hashrate_300s"]
+    shares_60s = table.columns["shares_60s"]
+    fleet_60s = fleet_300s = 0.0
+    online = 0
+    offline: list[str] = []
+    underperforming: list[tuple[float, str, float, float]] = []
+
+    for row, name in enumerate(table.names):
+        if name not in table or not shares_60s[row]:
+            offline.append(name)
+            continue
+        online += 1
+        fleet_60s += hashrate_60s[row]
+        fleet_300s += hashrate_300s[row]
+        stats = rolling.get(name)
+        average = stats.mean(window) if stats is not None else None
+        if average and hashrate_300s[row] < ratio * average:
+            underperforming.append(
+                (hashrate_300s[row] / average, name, hashrate_300s[row], average)
+            )
+
+    offline.sort()
+    underperforming.sort()
+    return {
+        "values": {
+            "fleet_hashrate": fleet_60s,
+            "workers_online": online,
+            "workers_offline": len(offline),
+            "underperforming_workers": len(underperforming),
+        },
+        "attributes": {
+            "fleet_hashrate": {
+                "hashrate_300s": round(fleet_300s, 3),
+                "workers": len(table.names),
+            },
+            "workers_offline": {"workers": offline[:list_limit]},
+            "underperforming_workers": {
+                "workers": [
+                    {
+                        "name": name,
+                        "hashrate_300s": round(current, 3),
+                        "average": round(average, 3),
+                        "ratio": round(share, 2),
+                    }
+                    for share, name, current, average in underperforming[:top_n]
+                ]
+            },
+        },
+    }
@@ -0,0 +1,82 @@
+"""Per-phase timings and counts of the OCEAN polling and scraping paths."""
+from __future__ import annotations
+
+from collections import deque
+from collections.abc import Iterator
+from contextlib import contextmanager
+import math
+import time
+from typing import Any
+
+# Samples measured on every poll or scrape
+METRIC_POLL = "poll"  # seconds, whole account update
+METRIC_FETCH = "fetch"  # seconds, API request until the body is read
+METRIC_DECODE = "decode"  # seconds, JSON decoding of the body
+METRIC_PARSE_WORKERS = "parse_workers"  # seconds, worker table update incl. streamed decode
+METRIC_FAN_OUT = "fan_out"  # seconds, notifying the entities
+METRIC_SCRAPE = "scrape"  # seconds, whole lifetime earnings refresh
+METRIC_SCRAPE_PARSE = "scrape_parse"  # seconds, parsing the scraped pages
+METRIC_BYTES_RECEIVED = "bytes_received"  # API body bytes per request
+METRIC_SCRAPE_BYTES = "scrape_bytes"  # stats page bytes per scrape
+METRIC_WORKERS_PARSED = "workers_parsed"  # workers in a worker list fetch
+METRIC_ENTITIES_NOTIFIED = "entities_notified"  # listeners called per update
+METRIC_STATE_WRITES = "state_writes"  # entity states changed per update
+
+# Events counted since startup
+COUNTER_FAILURES = "failures"
+COUNTER_RETRIES = "retries"
+
+
+class Metrics:
+    """Rolling samples of per-phase timings and sizes with event counters.
+
+    The last `size` samples of each metric are kept, percentiles are
+    computed from them when read, which only happens for diagnostics.
+    """
+
+    def __init__(self, size: int) -> None:
+        """Initialize empty metrics."""
+        self._size = size
+        self._samples: dict[str, deque[float]] = {}
+        self.counters: dict[str, int] = {COUNTER_FAILURES: 0, COUNTER_RETRIES: 0}
+
+    def record(self, name: str, value: float) -> None:
+        """Add a sample of a metric."""
+        if (samples := self._samples.get(name)) is None:
+            samples = self._samples[name] = deque(maxlen=self._size)
+        samples.append(value)
+
+    @contextmanager
+    def timer(self, name: str) -> Iterator[None]:
+        """Record the seconds spent in the block."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, time.perf_counter() - start)
+
+    def increment(self, name: str, count: int = 1) -> None:
+        """Count events."""
+        self.counters[name] = self.counters.get(name, 0) + count
+
+    def summary(self, name: str) -> dict[str, float | int] | None:
+        """Return the last value, percentiles and maximum of a metric."""
+        samples = self._samples.get(name)
+        if not samples:
+            return None
+        ordered = sorted(samples)
+        count = len(ordered)
+        return {
+            "last": samples[-1],
+            "p50": ordered[math.ceil(count * 0.5) - 1],
+            "p95": ordered[math.ceil(count * 0.95) - 1],
+            "max": ordered[-1],
+            "samples": count,
+        }
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return every metric summary and counter."""
+        return {
+            "metrics": {name: self.summary(name) for name in self._samples},
+            "counters": dict(self.counters),
+        }
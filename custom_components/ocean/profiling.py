@@ -0,0 +1,85 @@
+"""Scoped profiling of OCEAN update cycles."""
+from __future__ import annotations
+
+from collections.abc import Coroutine, Generator, Iterator
+from contextlib import contextmanager
+import cProfile
+import io
+import pstats
+import types
+from typing import Any, TypeVar
+
+_T = TypeVar("_T")
+
+# Python 3.12+ allows only one enabled profiler per process
+_enabled: cProfile.Profile | None = None
+
+
+@types.coroutine
+def _profiled(coro: Coroutine[Any, Any, _T], profile: UpdateProfile) -> Generator[Any, Any, _T]:
+    """Drive a coroutine with the profiler enabled only while it runs.
+
+    The profiler is disabled whenever the coroutine awaits, so other work
+    on the event loop never shows up in the profile.
+    """
+    value: Any = None
+    error: BaseException | None = None
+    while True:
+        try:
+            with profile.active():
+                if error is None:
+                    yielded = coro.send(value)
+                else:
+                    yielded = coro.throw(error)
+        except StopIteration as stop:
+            return stop.value
+        value, error = None, None
+        try:
+            value = yield yielded
+        except BaseException as err:  # pylint: disable=broad-except
+            # Cancellation and errors are delivered to the wrapped coroutine
+            error = err
+
+
+class UpdateProfile:
+    """cProfile session covering a number of update cycles of one account.
+
+    Coroutines run through :meth:`async_run` and blocks run under
+    :meth:`active` are profiled on the event loop. Only one profiler can be
+    enabled at a time, so stats pages are parsed on the event loop while a
+    session runs and a block nested in a profiled one is left to it.
+    """
+
+    def __init__(self, cycles: int) -> None:
+        """Initialize the session."""
+        self.cycles_left = cycles
+        self._profiler = cProfile.Profile()
+
+    async def async_run(self, coro: Coroutine[Any, Any, _T]) -> _T:
+        """Await a coroutine, profiling its steps."""
+        return await _profiled(coro, self)
+
+    @contextmanager
+    def active(self) -> Iterator[None]:
+        """Profile the block unless a profiler is already enabled."""
+        global _enabled  # pylint: disable=global-statement
+        if _enabled is not None:
+            yield
+            return
+        self._profiler.enable()
+        _enabled = self._profiler
+        try:
+            yield
+        finally:
+            _enabled = None
+            self._profiler.disable()
+
+    def save(self, path: str) -> str:
+        """Write the pstats dump to path and return a text summary, runs in the executor."""
+        stats = pstats.Stats(self._profiler)
+        stats.dump_stats(path)
+
+        summary = io.StringIO()
+        stats.stream = summary
+        stats.sort_stats(pstats.SortKey.CUMULATIVE).print_stats(30)
+        return summary.getvalue()
@@ -0,0 +1,229 @@
+"""In-memory rolling statistics of hashrate samples."""
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable
+import math
+
+# Log-scale histogram used for percentiles: bin 0 holds zero hashrate, the
+# others cover 2**_LOG2_MIN .. 2**(_LOG2_MIN + _OCTAVES) TH/s with
+# _BINS_PER_OCTAVE bins per doubling (about 4 % resolution).
+_LOG2_MIN = -20
+_OCTAVES = 40
+_BINS_PER_OCTAVE = 16
+_BINS = _OCTAVES * _BINS_PER_OCTAVE + 1
+
+
+def _bin(value: float) -> int:
+    """Return the histogram bin of a hashrate."""
+    if value <= 0:
+        return 0
+    position = int((math.log2(value) - _LOG2_MIN) * _BINS_PER_OCTAVE) + 1
+    return min(max(position, 1), _BINS - 1)
+
+
+def _bin_value(position: int) -> float:
+    """Return the hashrate at the middle of a histogram bin."""
+    if position == 0:
+        return 0.0
+    return 2 ** (_LOG2_MIN + (position - 0.5) / _BINS_PER_OCTAVE)
+
+
+class _Window:
+    """Running aggregates over the samples of the last `seconds`."""
+
+    __slots__ = ("seconds", "head", "count", "total", "active", "bins")
+
+    def __init__(self, seconds: float) -> None:
+        """Initialize an empty window."""
+        self.seconds = seconds
+        # Sequence number of the oldest sample in the window
+        self.head = 0
+        self.count = 0
+        self.total = 0.0
+        self.active = 0
+        # Sample counts never exceed the buffer capacity
+        self.bins = array("I", bytes(_BINS * array("I").itemsize))
+
+
+class RollingStats:
+    """Fixed-size ring buffer of (time, hashrate, active) samples.
+
+    Every window keeps a running sum, active sample count and histogram, so
+    adding a sample is O(1) amortized: it is added to each window once and
+    leaves each window once. Reading a mean or uptime is O(1), a percentile
+    is O(histogram bins). When the buffer is full the oldest sample is
+    dropped even if it is still inside a window, so capacity should cover
+    the longest window at the expected sample rate.
+    """
+
+    def __init__(self, capacity: int, windows: Iterable[float]) -> None:
+        """Initialize the buffer."""
+        self._capacity = capacity
+        self._times = array("d", bytes(capacity * array("d").itemsize))
+        self._values = array("d", bytes(capacity * array("d").itemsize))
+        self._active = bytearray(capacity)
+        self._positions = array("H", bytes(capacity * array("H").itemsize))
+        # Sequence number of the next sample and number of samples kept
+        self._next = 0
+        self._count = 0
+        self._windows = {seconds: _Window(seconds) for seconds in windows}
+
+    def __len__(self) -> int:
+        """Return the number of samples kept."""
+        return self._count
+
+    def _drop(self, window: _Window) -> None:
+        """Remove the oldest sample of a window."""
+        slot = window.head % self._capacity
+        window.count -= 1
+        window.total -= self._values[slot]
+        window.active -= self._active[slot]
+        window.bins[self._positions[slot]] -= 1
+        window.head += 1
+        if not window.count:
+            # Reset the rounding drift of the running sum
+            window.total = 0.0
+
+    def add(self, timestamp: float, value: float, active: bool) -> None:
+        """Add a sample taken at `timestamp` (epoch seconds)."""
+        if self._count == self._capacity:
+            oldest = self._next - self._count
+            for window in self._windows.values():
+                if window.head == oldest and window.count:
+                    self._drop(window)
+            self._count -= 1
+
+        position = _bin(value)
+        slot = self._next % self._capacity
+        self._times[slot] = timestamp
+        self._values[slot] = value
+        self._active[slot] = active
+        self._positions[slot] = position
+        self._next += 1
+        self._count += 1
+
+        for window in self._windows.values():
+            window.count += 1
+            window.total += value
+            window.active += active
+            window.bins[position] += 1
+            cutoff = timestamp - window.seconds
+            while window.count and self._times[window.head % self._capacity] <= cutoff:
+                self._drop(window)
+
+    def mean(self, seconds: float) -> float | None:
+        """Return the mean hashrate over a window."""
+        window = self._windows[seconds]
+        if not window.count:
+            return None
+        # Clamp the rounding drift of the running sum
+        return max(window.total / window.count, 0.0)
+
+    def uptime(self, seconds: float) -> float | None:
+        """Return the percentage of samples in a window with shares."""
+        window = self._windows[seconds]
+        if not window.count:
+            return None
+        return 100 * window.active / window.count
+
+    def percentile(self, seconds: float, percent: float) -> float | None:
+        """Return an approximate hashrate percentile over a window."""
+        window = self._windows[seconds]
+        if not window.count:
+            return None
+        rank = max(math.ceil(window.count * percent / 100), 1)
+        seen = 0
+        for position, count in enumerate(window.bins):
+            seen += count
+            if seen >= rank:
+                return _bin_value(position)
+        return None
+
+
+class RollingMean:
+    """Approximate mean and uptime over one window from per-bucket running sums.
+
+    The window is split into `buckets` equal time buckets that expire whole,
+    so the statistics cover between (buckets - 1) / buckets of the window and
+    all of it. Memory does not depend on the sample rate, which keeps it
+    cheap enough for every worker of a large fleet.
+    """
+
+    __slots__ = (
+        "seconds",
+        "_span",
+        "_totals",
+        "_counts",
+        "_active",
+        "_current",
+        "_total",
+        "_count",
+        "_active_count",
+    )
+
+    def __init__(self, seconds: float, buckets: int) -> None:
+        """Initialize empty buckets."""
+        self.seconds = seconds
+        self._span = seconds / buckets
+        self._totals = array("d", bytes(buckets * array("d").itemsize))
+        self._counts = array("I", bytes(buckets * array("I").itemsize))
+        self._active = array("I", bytes(buckets * array("I").itemsize))
+        # Bucket number of the newest sample
+        self._current: int | None = None
+        self._total = 0.0
+        self._count = 0
+        self._active_count = 0
+
+    def __len__(self) -> int:
+        """Return the number of samples kept."""
+        return self._count
+
+    def add(self, timestamp: float, value: float, active: bool) -> None:
+        """Add a sample taken at `timestamp` (epoch seconds)."""
+        size = len(self._counts)
+        bucket = int(timestamp // self._span)
+        if self._current is None:
+            self._current = bucket
+        elif bucket > self._current:
+            # Expire the buckets the window moved past
+            for number in range(max(self._current + 1, bucket - size + 1), bucket + 1):
+                slot = number % size
+                self._total -= self._totals[slot]
+                self._count -= self._counts[slot]
+                self._active_count -= self._active[slot]
+                self._totals[slot] = 0.0
+                self._counts[slot] = 0
+                self._active[slot] = 0
+            if not self._count:
+                # Reset the rounding drift of the running sum
+                self._total = 0.0
+            self._current = bucket
+        else:
+            # Samples from a clock that went back count towards the newest bucket
+            bucket = self._current
+
+        slot = bucket % size
+        self._totals[slot] += value
+        self._counts[slot] += 1
+        self._active[slot] += active
+        self._total += value
+        self._count += 1
+        self._active_count += active
+
+    def mean(self, seconds: float) -> float | None:
+        """Return the mean hashrate over the window."""
+        if seconds != self.seconds:
+            raise KeyError(seconds)
+        if not self._count:
+            return None
+        # Clamp the rounding drift of the running sum
+        return max(self._total / self._count, 0.0)
+
+    def uptime(self, seconds: float) -> float | None:
+        """Return the percentage of samples in the window with shares."""
+        if seconds != self.seconds:
+            raise KeyError(seconds)
+        if not self._count:
+            return None
+        return 100 * self._active_count / self._count
@@ -0,0 +1,165 @@
+"""Snapshot-aligned poll scheduling for the OCEAN Mining Pool integration."""
+from __future__ import annotations
+
+from collections import deque
+from datetime import datetime
+import logging
+import math
+from typing import Any
+
+from .const import (
+    SNAPSHOT_BLOCK_FAST_POLLS,
+    SNAPSHOT_CADENCE_SAMPLES,
+    SNAPSHOT_FAST_DELAY,
+    SNAPSHOT_MAX_CADENCE,
+    SNAPSHOT_MIN_CADENCE,
+    SNAPSHOT_MIN_DELAY,
+    SNAPSHOT_RETRY_DELAY,
+    SNAPSHOT_ROLL_MARGIN,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def parse_snap_ts(value: Any) -> float | None:
+    """Convert an OCEAN snap_ts (epoch seconds/ms or ISO 8601) to epoch seconds."""
+    if value is None or value == "":
+        return None
+    try:
+        timestamp = float(value)
+    except (TypeError, ValueError):
+        try:
+            return datetime.fromisoformat(str(value).replace("Z", "+00:00")).timestamp()
+        except ValueError:
+            return None
+    # Millisecond timestamps
+    if timestamp > 1e11:
+        timestamp /= 1000
+    return timestamp
+
+
+class SnapshotScheduler:
+    """Learn OCEAN's snapshot cadence from snap_ts and time polls after each roll.
+
+    The cadence is the smallest recent spacing of observed snap_ts values, or
+    difference of two spacings, since snapshots slept through make spacings
+    multiples of it. The delay between a snapshot's snap_ts and the local
+    time at which it becomes visible (clock skew plus publishing lag) is
+    bracketed: a poll bounds it from above by the snapshot it sees and from
+    below by the one after it, which it does not see yet. Polls bisect the
+    bracket until it is narrower than SNAPSHOT_ROLL_MARGIN and then land at
+    its upper end. Polls are never closer together than the configured scan
+    interval; when the next roll comes sooner, the first roll at least the
+    interval away is targeted instead. Polls that find an unchanged snapshot
+    back off exponentially, and only a detected block switches to faster
+    polling for a few cycles.
+    """
+
+    def __init__(self, scan_interval: float) -> None:
+        """Initialize the scheduler with the configured interval as first guess."""
+        self.scan_interval = float(scan_interval)
+        self.cadence = float(scan_interval)
+        # Recent snap_ts spacings, the cadence is learned once one is seen
+        self._gaps: deque[float] = deque(maxlen=SNAPSHOT_CADENCE_SAMPLES)
+        self._learned = False
+        self._last_snap_ts: float | None = None
+        # Bracket for (local time - snap_ts) at which a snapshot becomes visible
+        self._visible_after = 0.0
+        self._early_before = 0.0
+        self._unchanged_polls = 0
+        self._fast_polls = 0
+        self.phase = 0.0
+
+    def observe(self, snap_ts: Any, now: float, block_found: bool = False) -> float:
+        """Record the snap_ts seen at local time `now`, return seconds to next poll."""
+        snap = parse_snap_ts(snap_ts)
+        if snap is None:
+            return self.scan_interval
+
+        if block_found:
+            self._fast_polls = SNAPSHOT_BLOCK_FAST_POLLS
+
+        if self._last_snap_ts is None:
+            self._visible_after = now - snap
+            self._early_before = self._visible_after - self.cadence
+            self._last_snap_ts = snap
+        elif snap > self._last_snap_ts:
+            cadence = self.cadence
+            self._learn_cadence(snap - self._last_snap_ts)
+            if self.cadence > cadence:
+                # Lower bounds taken with the shorter cadence were too high
+                self._early_before = self._visible_after - self.cadence
+            self._last_snap_ts = snap
+            self._unchanged_polls = 0
+        else:
+            self._unchanged_polls += 1
+
+        # The snapshot seen is visible and the one after it is not yet. Polls
+        # can be several rolls apart, so both hold whichever snapshot was
+        # seen, but the second needs a cadence that is not the first guess
+        self._visible_after = min(self._visible_after, now - snap)
+        early = self._learned and now - snap - self.cadence > self._early_before
+        if early:
+            self._early_before = now - snap - self.cadence
+        if self._visible_after <= self._early_before:
+            # Publishing lag varies, resolve towards the later bound since a
+            # poll that comes too early costs a whole interval of fresh data
+            if early:
+                self._visible_after = self._early_before + SNAPSHOT_ROLL_MARGIN
+            else:
+                self._early_before = self._visible_after - SNAPSHOT_ROLL_MARGIN
+
+        if self._unchanged_polls:
+            # The roll is late, retry with exponential back-off
+            delay = min(SNAPSHOT_RETRY_DELAY * 2 ** (self._unchanged_polls - 1), self.cadence)
+        else:
+            window = self._visible_after - self._early_before
+            if window > SNAPSHOT_ROLL_MARGIN:
+                target = self._early_before + window / 2
+            else:
+                target = self._visible_after + self.phase
+            delay = self._last_snap_ts + self.cadence + target - now
+            if delay > self.cadence + SNAPSHOT_ROLL_MARGIN + self.phase:
+                delay = self.cadence
+            elif delay < self.scan_interval - SNAPSHOT_ROLL_MARGIN:
+                # Skip to the first roll at least scan_interval away, a poll
+                # that is only a little early is pushed back to it below
+                delay += (
+                    math.ceil((self.scan_interval - SNAPSHOT_ROLL_MARGIN - delay) / self.cadence)
+                    * self.cadence
+                )
+
+        if self._fast_polls:
+            self._fast_polls -= 1
+            delay = min(delay, SNAPSHOT_FAST_DELAY)
+        else:
+            delay = max(delay, self.scan_interval)
+
+        return max(delay, SNAPSHOT_MIN_DELAY)
+
+    def _learn_cadence(self, delta: float) -> None:
+        """Update the cadence estimate from the spacing of two snapshots."""
+        if delta < SNAPSHOT_MIN_CADENCE:
+            return
+        self._gaps.append(delta)
+        gaps = list(self._gaps)
+        # Snapshots we slept through show up as multiples of the cadence, keep
+        # the estimate while it still explains every recent spacing
+        if self._learned and all(
+            abs(gap - round(gap / self.cadence) * self.cadence) <= SNAPSHOT_ROLL_MARGIN
+            for gap in gaps
+        ):
+            return
+        # The difference of two spacings is a multiple as well, which finds
+        # the cadence even when polls are always more than one roll apart
+        candidates = [
+            candidate
+            for candidate in gaps
+            + [abs(gap - other) for index, gap in enumerate(gaps) for other in gaps[index + 1:]]
+            if SNAPSHOT_MIN_CADENCE <= candidate <= SNAPSHOT_MAX_CADENCE
+        ]
+        if not candidates:
+            return
+        self.cadence = min(candidates)
+        self._learned = True
+        _LOGGER.debug(f"OCEAN snapshot cadence estimate: {self.cadence:.1f} s")
@@ -0,0 +1,266 @@
+"""Lightweight extraction of values from OCEAN stats pages.
+
+The stats pages are only scraped for a few numbers, so instead of building a
+DOM we scan the HTML incrementally as it arrives and stop as soon as the
+"Lifetime Earnings" block, and on the account page the workers table, has
+been seen.
+"""
+from __future__ import annotations
+
+import asyncio
+import codecs
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+import html
+import logging
+import re
+import time
+
+from .const import DEFAULT_PARSE_QUEUE_DEPTH, DEFAULT_PARSE_WORKERS
+
+_LOGGER = logging.getLogger(__name__)
+
+LIFETIME_EARNINGS_LABEL = "Lifetime Earnings"
+
+# <div class="... blocks-label ...">Lifetime Earnings</div>
+_LABEL_RE = re.compile(
+    r"<div[^>]*\bclass=[\"'][^\"']*\bblocks-label\b[^\"']*[\"'][^>]*>(.*?)</div\s*>",
+    re.IGNORECASE | re.DOTALL,
+)
+# The value lives in the span following the label
+_VALUE_RE = re.compile(r"<span[^>]*>(.*?)</span\s*>", re.IGNORECASE | re.DOTALL)
+_TAG_RE = re.compile(r"<[^>]*>")
+
+# Workers table of the account page, matched by its header cells
+_TABLE_START_RE = re.compile(r"<table\b", re.IGNORECASE)
+_TABLE_END_RE = re.compile(r"</table\s*>", re.IGNORECASE)
+_ROW_RE = re.compile(r"<tr\b[^>]*>(.*?)</tr\s*>", re.IGNORECASE | re.DOTALL)
+_HEADER_RE = re.compile(r"<th\b[^>]*>(.*?)</th\s*>", re.IGNORECASE | re.DOTALL)
+_CELL_RE = re.compile(r"<td\b[^>]*>(.*?)</td\s*>", re.IGNORECASE | re.DOTALL)
+
+
+def _cell_text(cell_html: str) -> str:
+    """Return the visible text of a table cell or value span."""
+    return " ".join(html.unescape(_TAG_RE.sub("", cell_html)).split())
+
+
+def _parse_btc(text: str) -> float | None:
+    """Convert a BTC amount like '0.01234567 BTC' to a float."""
+    try:
+        return float(text.replace("BTC", "").replace(",", "").strip())
+    except ValueError:
+        return None
+
+
+def _clean_value(value_html: str) -> float | None:
+    """Convert the inner HTML of the value span to a BTC amount."""
+    value = _parse_btc(_cell_text(value_html))
+    if value is None:
+        _LOGGER.warning(f"Could not parse lifetime earnings value: {_cell_text(value_html)}")
+    return value
+
+
+class LifetimeEarningsExtractor:
+    """Incrementally locate the Lifetime Earnings value in a stats page.
+
+    Feed decoded HTML chunks with :meth:`feed` until it returns True. Only the
+    unscanned tail of the page is kept in memory.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the extractor."""
+        self._buffer = ""
+        self.found = False
+        self.value: float | None = None
+
+    def feed(self, text: str) -> bool:
+        """Scan another chunk of HTML, return True once the value was found."""
+        if self.found:
+            return True
+
+        buffer = self._buffer + text
+        pos = 0
+
+        while (label := _LABEL_RE.search(buffer, pos)) is not None:
+            if LIFETIME_EARNINGS_LABEL not in label.group(1):
+                pos = label.end()
+                continue
+
+            value = _VALUE_RE.search(buffer, label.end())
+            if value is None:
+                # The value span has not fully arrived yet
+                self._buffer = buffer[label.start():]
+                return False
+
+            self.found = True
+            self.value = _clean_value(value.group(1))
+            self._buffer = ""
+            return True
+
+        # Only keep a possibly incomplete label from the end of the buffer
+        keep = buffer.rfind("<div", pos)
+        if keep == -1:
+            keep = max(pos, len(buffer) - 4)
+        self._buffer = buffer[keep:]
+        return False
+
+
+class WorkerTableExtractor:
+    """Incrementally locate the workers table and read each worker's lifetime earnings.
+
+    Tables are buffered one at a time. The first one with a worker column and
+    a lifetime earnings column in its header is read; rows whose values do not
+    parse are skipped. :attr:`workers` stays None when no such table exists,
+    so callers can fall back to the worker pages.
+    """
+
+    def __init__(self, username: str) -> None:
+        """Initialize the extractor."""
+        self._prefix = f"{username}."
+        self._buffer = ""
+        self.found = False
+        self.workers: dict[str, float] | None = None
+
+    def feed(self, text: str) -> bool:
+        """Scan another chunk of HTML, return True once the table was read."""
+        if self.found:
+            return True
+
+        buffer = self._buffer + text
+        while (start := _TABLE_START_RE.search(buffer)) is not None:
+            end = _TABLE_END_RE.search(buffer, start.end())
+            if end is None:
+                # The table has not fully arrived yet
+                self._buffer = buffer[start.start():]
+                return False
+            if self._read_table(buffer[start.end():end.start()]):
+                self.found = True
+                self._buffer = ""
+                return True
+            buffer = buffer[end.end():]
+
+        # Only keep a possibly incomplete table tag from the end of the buffer
+        keep = buffer.rfind("<")
+        self._buffer = buffer[keep:] if keep != -1 and len(buffer) - keep < 8 else ""
+        return False
+
+    def _read_table(self, table_html: str) -> bool:
+        """Read worker earnings from a table, return False if it is not the workers table."""
+        headers = [_cell_text(header).lower() for header in _HEADER_RE.findall(table_html)]
+        worker_column = next(
+            (column for column, header in enumerate(headers) if "worker" in header), None
+        )
+        lifetime_column = next(
+            (column for column, header in enumerate(headers) if "lifetime" in header), None
+        )
+        if worker_column is None or lifetime_column is None:
+            return False
+
+        workers: dict[str, float] = {}
+        for row_html in _ROW_RE.findall(table_html):
+            cells = _CELL_RE.findall(row_html)
+            if len(cells) <= max(worker_column, lifetime_column):
+                continue
+            worker_name = _cell_text(cells[worker_column])
+            # Worker cells may carry the full "username.worker" identifier
+            if worker_name.startswith(self._prefix):
+                worker_name = worker_name[len(self._prefix):]
+            value = _parse_btc(_cell_text(cells[lifetime_column]))
+            if worker_name and value is not None:
+                workers[worker_name] = value
+        self.workers = workers
+        return True
+
+
+class AccountPageExtractor:
+    """Extract the account's and its workers' lifetime earnings from the account page."""
+
+    def __init__(self, username: str) -> None:
+        """Initialize the extractor."""
+        self._lifetime = LifetimeEarningsExtractor()
+        self._table = WorkerTableExtractor(username)
+
+    @property
+    def found(self) -> bool:
+        """Return True once the account's lifetime earnings were found."""
+        return self._lifetime.found
+
+    @property
+    def value(self) -> float | None:
+        """Return the account's lifetime earnings."""
+        return self._lifetime.value
+
+    @property
+    def workers(self) -> dict[str, float] | None:
+        """Return the workers' lifetime earnings, None without a workers table."""
+        return self._table.workers
+
+    def feed(self, text: str) -> bool:
+        """Scan another chunk of HTML, return True once both values were read."""
+        found_lifetime = self._lifetime.feed(text)
+        return self._table.feed(text) and found_lifetime
+
+
+def _feed_timed(
+    extractor: LifetimeEarningsExtractor | AccountPageExtractor,
+    decoder: codecs.IncrementalDecoder,
+    data: bytes,
+    final: bool,
+) -> tuple[bool, float]:
+    """Decode and scan raw page bytes, returning (found, seconds spent)."""
+    start = time.perf_counter()
+    found = extractor.feed(decoder.decode(data, final=final))
+    return found, time.perf_counter() - start
+
+
+class ParsePool:
+    """Bounded pool running stats page extraction off the event loop.
+
+    At most ``max_queue`` batches may be queued or running at once; further
+    callers wait for a free slot. With ``max_workers`` set to 0 parsing runs
+    inline on the event loop, which is useful to compare loop-blocked time.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_PARSE_WORKERS,
+        max_queue: int = DEFAULT_PARSE_QUEUE_DEPTH,
+    ) -> None:
+        """Initialize the pool."""
+        self._executor = (
+            ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ocean_parse")
+            if max_workers > 0
+            else None
+        )
+        self._slots = asyncio.Semaphore(max(max_queue, 1))
+
+    @property
+    def inline(self) -> bool:
+        """Return True if parsing runs on the event loop."""
+        return self._executor is None
+
+    async def async_feed(
+        self,
+        extractor: LifetimeEarningsExtractor | AccountPageExtractor,
+        decoder: codecs.IncrementalDecoder,
+        data: bytes,
+        final: bool = False,
+        inline: bool = False,
+    ) -> tuple[bool, float]:
+        """Feed raw page bytes to an extractor, return (found, seconds spent).
+
+        With `inline` set the batch is parsed on the event loop even when the
+        pool has threads, which keeps it in a running profile session.
+        """
+        if inline or self._executor is None:
+            return _feed_timed(extractor, decoder, data, final)
+
+        async with self._slots:
+            return await asyncio.get_running_loop().run_in_executor(
+                self._executor, partial(_feed_timed, extractor, decoder, data, final)
+            )
+
+    def shutdown(self) -> None:
+        """Shut down the worker threads."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
@@ -1,14 +1,12 @@
 """Support for OCEAN Mining Pool sensors."""
 from __future__ import annotations
 
-from datetime import datetime, timedelta, timezone
+from collections.abc import Callable
+from datetime import datetime, timezone
+from functools import partial
 import logging
-import re
 from typing import Any
 
-import aiohttp
-from bs4 import BeautifulSoup
-
 from homeassistant.components.sensor import (
     SensorDeviceClass,
     SensorEntity,
@@ -16,23 +14,40 @@ from homeassistant.components.sensor import (
     SensorStateClass,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CURRENCY_DOLLAR, UnitOfTime
+from homeassistant.const import (
+    CURRENCY_DOLLAR,
+    PERCENTAGE,
+    EntityCategory,
+    UnitOfInformation,
+    UnitOfTime,
+)
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers import entity
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import (
-    CoordinatorEntity,
-    DataUpdateCoordinator,
-    UpdateFailed,
-)
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
     BITCOIN,
     DOMAIN,
-    EXCHANGE_RATE_ENTITY,
+    ROLLING_WINDOWS,
     TERA_HASH_PER_SECOND,
 )
+from .exchange_rate import ExchangeRateCache
+from .metrics import (
+    COUNTER_FAILURES,
+    COUNTER_RETRIES,
+    METRIC_BYTES_RECEIVED,
+    METRIC_DECODE,
+    METRIC_ENTITIES_NOTIFIED,
+    METRIC_FAN_OUT,
+    METRIC_FETCH,
+    METRIC_PARSE_WORKERS,
+    METRIC_POLL,
+    METRIC_SCRAPE,
+    METRIC_STATE_WRITES,
+    METRIC_WORKERS_PARSED,
+)
+from .rolling import RollingStats
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -123,6 +138,15 @@ ACCOUNT_SENSOR_TYPES: dict[str, SensorEntityDescription] = {
         state_class=SensorStateClass.MEASUREMENT,
         icon="mdi:laptop",
     ),
+    "data_age": SensorEntityDescription(
+        key="data_age",
+        name="Data Age",
+        native_unit_of_measurement=UnitOfTime.SECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        icon="mdi:clock-alert-outline",
+    ),
 }
 
 # Worker sensor descriptions
@@ -157,6 +181,191 @@ WORKER_SENSOR_TYPES: dict[str, SensorEntityDescription] = {
     ),
 }
 
+# Fleet summary sensors, aggregated over all workers
+FLEET_SENSOR_TYPES: dict[str, SensorEntityDescription] = {
+    "fleet_hashrate": SensorEntityDescription(
+        key="fleet_hashrate",
+        name="Fleet Hashrate",
+        native_unit_of_measurement=TERA_HASH_PER_SECOND,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:speedometer",
+        suggested_display_precision=2,
+    ),
+    "workers_online": SensorEntityDescription(
+        key="workers_online",
+        name="Workers Online",
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:server-network",
+    ),
+    "workers_offline": SensorEntityDescription(
+        key="workers_offline",
+        name="Workers Offline",
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:server-network-off",
+    ),
+    "underperforming_workers": SensorEntityDescription(
+        key="underperforming_workers",
+        name="Underperforming Workers",
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:speedometer-slow",
+    ),
+}
+
+# Rolling statistics sensors, computed in memory from the coordinator's samples
+ROLLING_SENSOR_TYPES: dict[str, SensorEntityDescription] = {
+    "hashrate_1h": SensorEntityDescription(
+        key="hashrate_1h",
+        name="Hashrate (1h Average)",
+        native_unit_of_measurement=TERA_HASH_PER_SECOND,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:speedometer",
+    ),
+    "hashrate_6h": SensorEntityDescription(
+        key="hashrate_6h",
+        name="Hashrate (6h Average)",
+        native_unit_of_measurement=TERA_HASH_PER_SECOND,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:speedometer",
+    ),
+    "hashrate_24h": SensorEntityDescription(
+        key="hashrate_24h",
+        name="Hashrate (24h Average)",
+        native_unit_of_measurement=TERA_HASH_PER_SECOND,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:speedometer",
+    ),
+    "hashrate_24h_p5": SensorEntityDescription(
+        key="hashrate_24h_p5",
+        name="Hashrate (24h 5th Percentile)",
+        native_unit_of_measurement=TERA_HASH_PER_SECOND,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:speedometer-slow",
+        suggested_display_precision=2,
+    ),
+    "hashrate_24h_p95": SensorEntityDescription(
+        key="hashrate_24h_p95",
+        name="Hashrate (24h 95th Percentile)",
+        native_unit_of_measurement=TERA_HASH_PER_SECOND,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:speedometer",
+        suggested_display_precision=2,
+    ),
+    "uptime_24h": SensorEntityDescription(
+        key="uptime_24h",
+        name="Uptime (24h)",
+        native_unit_of_measurement=PERCENTAGE,
+        state_class=SensorStateClass.MEASUREMENT,
+        icon="mdi:timer-check",
+        suggested_display_precision=1,
+    ),
+}
+
+# Diagnostic sensors of the per-phase metrics, disabled by default
+def _duration(key: str, name: str) -> SensorEntityDescription:
+    """Describe a phase duration sensor."""
+    return SensorEntityDescription(
+        key=key,
+        name=name,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        icon="mdi:timer-outline",
+        suggested_display_precision=1,
+    )
+
+
+def _count(key: str, name: str, icon: str) -> SensorEntityDescription:
+    """Describe a per-update count sensor."""
+    return SensorEntityDescription(
+        key=key,
+        name=name,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        icon=icon,
+    )
+
+
+METRIC_SENSOR_TYPES: dict[str, SensorEntityDescription] = {
+    METRIC_POLL: _duration(METRIC_POLL, "Poll Duration"),
+    METRIC_FETCH: _duration(METRIC_FETCH, "Fetch Duration"),
+    METRIC_DECODE: _duration(METRIC_DECODE, "Decode Duration"),
+    METRIC_PARSE_WORKERS: _duration(METRIC_PARSE_WORKERS, "Worker Parse Duration"),
+    METRIC_FAN_OUT: _duration(METRIC_FAN_OUT, "Entity Update Duration"),
+    METRIC_BYTES_RECEIVED: SensorEntityDescription(
+        key=METRIC_BYTES_RECEIVED,
+        name="Bytes Received",
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        device_class=SensorDeviceClass.DATA_SIZE,
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        icon="mdi:download-network",
+    ),
+    METRIC_WORKERS_PARSED: _count(METRIC_WORKERS_PARSED, "Workers Parsed", "mdi:laptop"),
+    METRIC_ENTITIES_NOTIFIED: _count(
+        METRIC_ENTITIES_NOTIFIED, "Entities Notified", "mdi:bell-ring-outline"
+    ),
+    METRIC_STATE_WRITES: _count(METRIC_STATE_WRITES, "State Writes", "mdi:database-edit"),
+    COUNTER_FAILURES: SensorEntityDescription(
+        key=COUNTER_FAILURES,
+        name="API Failures",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        icon="mdi:alert-circle-outline",
+    ),
+    COUNTER_RETRIES: SensorEntityDescription(
+        key=COUNTER_RETRIES,
+        name="API Retries",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        icon="mdi:refresh",
+    ),
+}
+
+# Updated by the lifetime earnings coordinator
+SCRAPE_METRIC_SENSOR_TYPES: dict[str, SensorEntityDescription] = {
+    METRIC_SCRAPE: _duration(METRIC_SCRAPE, "Lifetime Earnings Scrape Duration"),
+}
+
+_HOUR, _SIX_HOURS, _DAY = ROLLING_WINDOWS
+
+ROLLING_VALUES: dict[str, Callable[[RollingStats], float | None]] = {
+    "hashrate_1h": lambda stats: stats.mean(_HOUR),
+    "hashrate_6h": lambda stats: stats.mean(_SIX_HOURS),
+    "hashrate_24h": lambda stats: stats.mean(_DAY),
+    "hashrate_24h_p5": lambda stats: stats.percentile(_DAY, 5),
+    "hashrate_24h_p95": lambda stats: stats.percentile(_DAY, 95),
+    "uptime_24h": lambda stats: stats.uptime(_DAY),
+}
+
+
+def _account_btc(coordinator, sensor_key: str) -> float | None:
+    """Return an account BTC value."""
+    return coordinator.data.get(sensor_key)
+
+
+def _worker_btc(coordinator, worker_name: str, sensor_key: str) -> float | None:
+    """Return a worker BTC value."""
+    worker_data = coordinator.data.get("workers", {}).get(worker_name)
+    return worker_data[sensor_key] if worker_data else None
+
+
+def _lifetime_btc(lifetime_coordinator, worker_name: str | None) -> float | None:
+    """Return scraped lifetime earnings of the account or a worker."""
+    if worker_name is None:
+        return lifetime_coordinator.data["account"]
+    return lifetime_coordinator.data["workers"].get(worker_name)
+
+
+def _always() -> bool:
+    """Return True, lifetime earnings are rewritten on every scrape."""
+    return True
+
 
 async def async_setup_entry(
     hass: HomeAssistant,
@@ -165,6 +374,7 @@ async def async_setup_entry(
 ) -> None:
     """Set up OCEAN Mining Pool sensors from a config entry."""
     coordinator = hass.data[DOMAIN][entry.entry_id]
+    lifetime_coordinator = coordinator.lifetime_coordinator
     
     entities = []
     
@@ -178,91 +388,188 @@ async def async_setup_entry(
             )
         )
     
-    # Add USD value sensor for unpaid balance
+    # Add rolling statistics sensors for the account
+    for description in ROLLING_SENSOR_TYPES.values():
+        entities.append(
+            OceanRollingSensor(
+                coordinator=coordinator,
+                description=description,
+            )
+        )
+    
+    # Add USD value sensors for every account BTC sensor
+    exchange_rate = coordinator.exchange_rate
+    for sensor_key, description in ACCOUNT_SENSOR_TYPES.items():
+        if description.native_unit_of_measurement != BITCOIN:
+            continue
+        entities.append(
+            OceanUSDSensor(
+                coordinator=coordinator,
+                exchange_rate=exchange_rate,
+                unique_id=f"{coordinator.username}_{sensor_key}_usd",
+                name=f"Mining Account {description.name} USD",
+                btc_value=partial(_account_btc, coordinator, sensor_key),
+                source_changed=partial(coordinator.key_changed, sensor_key),
+            )
+        )
     entities.append(
-        OceanUnpaidUSDSensor(
-            coordinator=coordinator,
+        OceanUSDSensor(
+            coordinator=lifetime_coordinator,
+            exchange_rate=exchange_rate,
+            unique_id=f"{coordinator.username}_lifetime_earnings_usd",
+            name="Mining Account Lifetime Earnings USD",
+            btc_value=partial(_lifetime_btc, lifetime_coordinator, None),
+            source_changed=_always,
         )
     )
     
+    # Add fleet summary sensors
+    for description in FLEET_SENSOR_TYPES.values():
+        entities.append(
+            OceanFleetSensor(
+                coordinator=coordinator,
+                description=description,
+            )
+        )
+    
+    # Add diagnostic sensors of the poll and scrape metrics
+    for description in METRIC_SENSOR_TYPES.values():
+        entities.append(
+            OceanMetricSensor(
+                coordinator=coordinator,
+                description=description,
+            )
+        )
+    for description in SCRAPE_METRIC_SENSOR_TYPES.values():
+        entities.append(
+            OceanMetricSensor(
+                coordinator=lifetime_coordinator,
+                description=description,
+            )
+        )
+    
     # Add lifetime earnings scrape sensor for main account
     entities.append(
         OceanAccountLifetimeEarningsSensor(
-            hass=hass,
-            username=coordinator.username,
-            scan_interval=coordinator.update_interval,
+            coordinator=lifetime_coordinator,
         )
     )
     
-    # Add worker sensors dynamically
-    workers = coordinator.data.get("workers", {})
-    for worker_name in workers:
-        for sensor_key, description in WORKER_SENSOR_TYPES.items():
-            entities.append(
-                OceanWorkerSensor(
+    # Worker entities, by worker, following the coordinator's worker registry
+    worker_entities: dict[str, list[SensorEntity]] = {}
+    # Worker entity types selected in the options
+    entity_types = coordinator.worker_entity_types
+    worker_sensor_types = {
+        sensor_key: description
+        for sensor_key, description in WORKER_SENSOR_TYPES.items()
+        if sensor_key in entity_types
+    }
+    
+    @callback
+    def _async_create_worker_entities(worker_name: str) -> list[SensorEntity]:
+        """Create the sensors of one worker."""
+        new_entities: list[SensorEntity] = [
+            OceanWorkerSensor(
+                coordinator=coordinator,
+                description=description,
+                sensor_key=sensor_key,
+                worker_name=worker_name,
+            )
+            for sensor_key, description in worker_sensor_types.items()
+        ]
+        
+        # Rolling statistics per worker, disabled by default
+        if "rolling" in entity_types:
+            new_entities.extend(
+                OceanRollingSensor(
                     coordinator=coordinator,
                     description=description,
-                    sensor_key=sensor_key,
                     worker_name=worker_name,
                 )
+                for description in ROLLING_SENSOR_TYPES.values()
             )
         
-        # Add lifetime earnings scrape sensor for each worker
-        entities.append(
-            OceanWorkerLifetimeEarningsSensor(
-                hass=hass,
-                username=coordinator.username,
-                worker_name=worker_name,
-                scan_interval=coordinator.update_interval,
+        # USD values of the worker's BTC sensors, disabled by default
+        safe_worker_name = worker_name.replace(" ", "_").replace("-", "_")
+        for sensor_key, description in worker_sensor_types.items():
+            if description.native_unit_of_measurement != BITCOIN:
+                continue
+            new_entities.append(
+                OceanUSDSensor(
+                    coordinator=coordinator,
+                    exchange_rate=exchange_rate,
+                    unique_id=f"{coordinator.username}_{safe_worker_name}_{sensor_key}_usd",
+                    name=f"{worker_name} {description.name} USD",
+                    btc_value=partial(_worker_btc, coordinator, worker_name, sensor_key),
+                    source_changed=partial(coordinator.worker_changed, worker_name),
+                    worker_name=worker_name,
+                )
             )
-        )
+        
+        # Lifetime earnings are scraped only for workers with these sensors
+        if "lifetime_earnings" in entity_types:
+            lifetime_coordinator.async_add_worker(worker_name)
+            new_entities.append(
+                OceanWorkerLifetimeEarningsSensor(
+                    coordinator=lifetime_coordinator,
+                    worker_name=worker_name,
+                )
+            )
+            new_entities.append(
+                OceanUSDSensor(
+                    coordinator=lifetime_coordinator,
+                    exchange_rate=exchange_rate,
+                    unique_id=f"{coordinator.username}_{safe_worker_name}_lifetime_earnings_usd",
+                    name=f"{worker_name} Lifetime Earnings USD",
+                    btc_value=partial(_lifetime_btc, lifetime_coordinator, worker_name),
+                    source_changed=_always,
+                    worker_name=worker_name,
+                )
+            )
+        worker_entities[worker_name] = new_entities
+        return new_entities
+    
+    for worker_name in coordinator.worker_registry:
+        entities.extend(_async_create_worker_entities(worker_name))
     
     async_add_entities(entities)
     
-    # Listen for coordinator updates to add new workers
+    # Drop worker sensors of types that were turned off in the options
+    coordinator.async_remove_unused_worker_entities(
+        entry.entry_id, "sensor", {sensor.unique_id for sensor in entities}
+    )
+    
+    # Scrape all lifetime earnings pages in the background, unless the
+    # restored values are recent enough
+    if lifetime_coordinator.scrape_due:
+        entry.async_create_background_task(
+            hass,
+            lifetime_coordinator.async_refresh(),
+            f"OCEAN {coordinator.username} lifetime earnings refresh",
+        )
+    
     @callback
-    def _async_add_new_workers():
-        """Add sensors for newly discovered workers."""
+    def _async_workers_changed(added: set[str], removed: set[str]) -> None:
+        """Add sensors for new workers and remove those of dropped workers."""
         new_entities = []
-        current_workers = coordinator.data.get("workers", {})
+        for worker_name in added:
+            new_entities.extend(_async_create_worker_entities(worker_name))
         
-        # Find workers that don't have entities yet
-        existing_workers = {
-            entity.worker_name
-            for entity in entities
-            if isinstance(entity, OceanWorkerSensor)
-        }
-        
-        new_workers = set(current_workers.keys()) - existing_workers
-        
-        for worker_name in new_workers:
-            for sensor_key, description in WORKER_SENSOR_TYPES.items():
-                new_entity = OceanWorkerSensor(
-                    coordinator=coordinator,
-                    description=description,
-                    sensor_key=sensor_key,
-                    worker_name=worker_name,
-                )
-                new_entities.append(new_entity)
-                entities.append(new_entity)
-            
-            # Add lifetime earnings scrape sensor for new worker
-            lifetime_entity = OceanWorkerLifetimeEarningsSensor(
-                hass=hass,
-                username=coordinator.username,
-                worker_name=worker_name,
-                scan_interval=coordinator.update_interval,
-            )
-            new_entities.append(lifetime_entity)
-            entities.append(lifetime_entity)
+        for worker_name in removed:
+            for worker_entity in worker_entities.pop(worker_name, ()):
+                # Entities disabled in the entity registry were never added
+                if worker_entity.hass is not None:
+                    hass.async_create_task(worker_entity.async_remove(force_remove=True))
         
         if new_entities:
             _LOGGER.info(f"Adding {len(new_entities)} sensors for new workers")
             async_add_entities(new_entities)
+            # Pick up lifetime earnings for the new workers
+            hass.async_create_task(lifetime_coordinator.async_request_refresh())
     
-    # Subscribe to coordinator updates
+    # Subscribe to worker registry changes
     entry.async_on_unload(
-        coordinator.async_add_listener(_async_add_new_workers)
+        coordinator.async_add_workers_listener(_async_workers_changed)
     )
 
 
@@ -283,6 +590,12 @@ class OceanAccountSensor(CoordinatorEntity, SensorEntity):
         # Remove address from entity names - just use description
         self._attr_name = f"Mining Account {description.name}"
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Only write state when this sensor's value changed."""
+        if self.coordinator.key_changed(self._sensor_key):
+            super()._handle_coordinator_update()
+
     @property
     def device_info(self) -> entity.DeviceInfo:
         """Return device info."""
@@ -319,20 +632,90 @@ class OceanAccountSensor(CoordinatorEntity, SensorEntity):
         return self.coordinator.available and self.coordinator.last_update_success
 
 
-class OceanUnpaidUSDSensor(CoordinatorEntity, SensorEntity):
-    """Sensor for unpaid balance in USD."""
+class OceanRollingSensor(CoordinatorEntity, SensorEntity):
+    """Rolling hashrate statistic of the account or one worker."""
 
-    def __init__(self, coordinator) -> None:
+    def __init__(
+        self,
+        coordinator,
+        description: SensorEntityDescription,
+        worker_name: str | None = None,
+    ) -> None:
         """Initialize the sensor."""
         super().__init__(coordinator)
-        self._attr_unique_id = f"{coordinator.username}_unpaid_usd"
-        # Remove address from entity names
-        self._attr_name = "Mining Account Unpaid Balance USD"
-        self._attr_native_unit_of_measurement = CURRENCY_DOLLAR
-        self._attr_state_class = SensorStateClass.TOTAL
-        self._attr_device_class = SensorDeviceClass.MONETARY
-        self._attr_icon = "mdi:currency-usd"
-        self._attr_suggested_display_precision = 2
+        self.entity_description = description
+        self.worker_name = worker_name
+        self._value_fn = ROLLING_VALUES[description.key]
+        
+        if worker_name is None:
+            self._attr_unique_id = f"{coordinator.username}_{description.key}"
+            self._attr_name = f"Mining Account {description.name}"
+        else:
+            # Sanitize worker name for entity ID
+            safe_worker_name = worker_name.replace(" ", "_").replace("-", "_")
+            self._attr_unique_id = f"{coordinator.username}_{safe_worker_name}_{description.key}"
+            self._attr_name = f"{worker_name} {description.name}"
+            # Thousands of workers would add thousands of entities, opt in per worker
+            self._attr_entity_registry_enabled_default = False
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Only write state when new samples were added."""
+        if self.coordinator.rolling_changed(self.worker_name):
+            super()._handle_coordinator_update()
+
+    @property
+    def device_info(self) -> entity.DeviceInfo:
+        """Return device info."""
+        if self.worker_name is None:
+            return entity.DeviceInfo(
+                identifiers={(DOMAIN, self.coordinator.username)},
+                name="Mining Account",
+                manufacturer="OCEAN Mining Pool",
+                model="Mining Account",
+                configuration_url="https://ocean.xyz",
+            )
+        return entity.DeviceInfo(
+            identifiers={(DOMAIN, f"{self.coordinator.username}_{self.worker_name}")},
+            name=f"{self.worker_name}",
+            manufacturer="OCEAN Mining Pool",
+            model="Worker",
+            configuration_url="https://ocean.xyz",
+            via_device=(DOMAIN, self.coordinator.username),
+        )
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the statistic."""
+        if self.worker_name is None:
+            stats = self.coordinator.account_rolling
+        else:
+            stats = self.coordinator.worker_rolling.get(self.worker_name)
+        if not isinstance(stats, RollingStats):
+            return None
+        return self._value_fn(stats)
+
+    @property
+    def available(self) -> bool:
+        """Return if entity is available."""
+        return self.coordinator.available and self.coordinator.last_update_success
+
+
+class OceanFleetSensor(CoordinatorEntity, SensorEntity):
+    """Aggregate of all workers of the account."""
+
+    def __init__(self, coordinator, description: SensorEntityDescription) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self.entity_description = description
+        self._attr_unique_id = f"{coordinator.username}_{description.key}"
+        self._attr_name = f"Mining Account {description.name}"
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Only write state when the fleet summary was recomputed."""
+        if self.coordinator.fleet_changed():
+            super()._handle_coordinator_update()
 
     @property
     def device_info(self) -> entity.DeviceInfo:
@@ -346,62 +729,175 @@ class OceanUnpaidUSDSensor(CoordinatorEntity, SensorEntity):
         )
 
     @property
-    def native_value(self):
-        """Return the state of the sensor in USD."""
-        unpaid_btc = self.coordinator.data.get("unpaid", 0)
-        
-        # Get exchange rate from sensor
-        exchange_rate_state = self.hass.states.get(EXCHANGE_RATE_ENTITY)
-        if not exchange_rate_state:
-            _LOGGER.warning(f"Exchange rate sensor {EXCHANGE_RATE_ENTITY} not found")
+    def native_value(self) -> float | int:
+        """Return the aggregate value."""
+        return self.coordinator.fleet["values"][self.entity_description.key]
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the capped worker lists of the aggregate."""
+        return self.coordinator.fleet["attributes"].get(self.entity_description.key)
+
+    @property
+    def available(self) -> bool:
+        """Return if entity is available."""
+        return self.coordinator.available and self.coordinator.last_update_success
+
+
+class OceanMetricSensor(CoordinatorEntity, SensorEntity):
+    """Latest sample of a poll or scrape metric, with rolling percentiles."""
+
+    def __init__(self, coordinator, description: SensorEntityDescription) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self.entity_description = description
+        self._metrics = coordinator.api.metrics
+        # Durations are measured in seconds and shown in milliseconds
+        self._scale = 1000 if description.device_class == SensorDeviceClass.DURATION else 1
+        self._attr_unique_id = f"{coordinator.username}_metric_{description.key}"
+        self._attr_name = f"Mining Account {description.name}"
+
+    @property
+    def device_info(self) -> entity.DeviceInfo:
+        """Return device info."""
+        return entity.DeviceInfo(
+            identifiers={(DOMAIN, self.coordinator.username)},
+            name="Mining Account",
+            manufacturer="OCEAN Mining Pool",
+            model="Mining Account",
+            configuration_url="https://ocean.xyz",
+        )
+
+    @property
+    def native_value(self) -> float | int | None:
+        """Return the latest sample or the counter."""
+        key = self.entity_description.key
+        if key in self._metrics.counters:
+            return self._metrics.counters[key]
+        summary = self._metrics.summary(key)
+        return summary["last"] * self._scale if summary else None
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return the percentiles over the latest samples."""
+        summary = self._metrics.summary(self.entity_description.key)
+        if summary is None:
             return None
+        return {
+            "p50": summary["p50"] * self._scale,
+            "p95": summary["p95"] * self._scale,
+            "max": summary["max"] * self._scale,
+            "samples": summary["samples"],
+        }
+
+
+class OceanUSDSensor(CoordinatorEntity, SensorEntity):
+    """USD value of a BTC sensor, converted with the cached exchange rate.
+
+    The value is computed when the source value changes or the rate changes,
+    not on every state read.
+    """
+
+    def __init__(
+        self,
+        coordinator,
+        exchange_rate: ExchangeRateCache,
+        unique_id: str,
+        name: str,
+        btc_value: Callable[[], float | None],
+        source_changed: Callable[[], bool],
+        worker_name: str | None = None,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinator)
+        self._exchange_rate = exchange_rate
+        self._btc_value = btc_value
+        self._source_changed = source_changed
+        self.worker_name = worker_name
         
-        try:
-            exchange_rate = float(exchange_rate_state.state)
-            return unpaid_btc * exchange_rate
-        except (ValueError, TypeError):
-            _LOGGER.error(f"Invalid exchange rate: {exchange_rate_state.state}")
-            return None
+        self._attr_unique_id = unique_id
+        self._attr_name = name
+        self._attr_native_unit_of_measurement = CURRENCY_DOLLAR
+        self._attr_state_class = SensorStateClass.TOTAL
+        self._attr_device_class = SensorDeviceClass.MONETARY
+        self._attr_icon = "mdi:currency-usd"
+        self._attr_suggested_display_precision = 2
+        if worker_name is not None:
+            self._attr_entity_registry_enabled_default = False
+
+    @property
+    def device_info(self) -> entity.DeviceInfo:
+        """Return device info."""
+        if self.worker_name is None:
+            return entity.DeviceInfo(
+                identifiers={(DOMAIN, self.coordinator.username)},
+                name="Mining Account",
+                manufacturer="OCEAN Mining Pool",
+                model="Mining Account",
+                configuration_url="https://ocean.xyz",
+            )
+        return entity.DeviceInfo(
+            identifiers={(DOMAIN, f"{self.coordinator.username}_{self.worker_name}")},
+            name=f"{self.worker_name}",
+            manufacturer="OCEAN Mining Pool",
+            model="Worker",
+            configuration_url="https://ocean.xyz",
+            via_device=(DOMAIN, self.coordinator.username),
+        )
+
+    @callback
+    def _recompute(self) -> None:
+        """Convert the current BTC value with the current rate."""
+        rate = self._exchange_rate.rate
+        btc = self._btc_value() if self.coordinator.data is not None else None
+        self._attr_native_value = None if rate is None or btc is None else btc * rate
+
+    async def async_added_to_hass(self) -> None:
+        """Compute the first value and follow rate changes."""
+        self._recompute()
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            self._exchange_rate.async_add_listener(self._async_rate_changed)
+        )
+
+    @callback
+    def _async_rate_changed(self) -> None:
+        """Recompute the value for a new exchange rate."""
+        self._recompute()
+        self.async_write_ha_state()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Recompute and write state when the BTC value changed."""
+        if self._source_changed():
+            self._recompute()
+            super()._handle_coordinator_update()
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
+        coordinator_available = getattr(self.coordinator, "available", True)
         return (
-            self.coordinator.available
+            coordinator_available
             and self.coordinator.last_update_success
-            and self.hass.states.get(EXCHANGE_RATE_ENTITY) is not None
+            and self._exchange_rate.rate is not None
         )
 
 
-class OceanAccountLifetimeEarningsSensor(SensorEntity):
+class OceanAccountLifetimeEarningsSensor(CoordinatorEntity, SensorEntity):
     """Sensor for account lifetime earnings scraped from OCEAN website."""
 
-    def __init__(
-        self,
-        hass: HomeAssistant,
-        username: str,
-        scan_interval: timedelta,
-    ) -> None:
+    def __init__(self, coordinator) -> None:
         """Initialize the sensor."""
-        self.hass = hass
-        self._username = username
+        super().__init__(coordinator)
+        self._username = coordinator.username
         
-        self._attr_unique_id = f"{username}_lifetime_earnings"
+        self._attr_unique_id = f"{self._username}_lifetime_earnings"
         self._attr_name = "Mining Account Lifetime Earnings"
         self._attr_native_unit_of_measurement = BITCOIN
         self._attr_state_class = SensorStateClass.TOTAL_INCREASING
         self._attr_icon = "mdi:bitcoin"
         self._attr_suggested_display_precision = 8
-        self._attr_native_value = None
-        
-        # Create a dedicated coordinator for scraping - uses same interval as API
-        self._coordinator = DataUpdateCoordinator(
-            hass,
-            _LOGGER,
-            name=f"OCEAN Account Lifetime Earnings",
-            update_method=self._async_update_data,
-            update_interval=scan_interval,
-        )
 
     @property
     def device_info(self) -> entity.DeviceInfo:
@@ -414,58 +910,27 @@ class OceanAccountLifetimeEarningsSensor(SensorEntity):
             configuration_url="https://ocean.xyz",
         )
 
-    async def async_added_to_hass(self) -> None:
-        """When entity is added to hass."""
-        await super().async_added_to_hass()
-        await self._coordinator.async_refresh()
-
-    async def async_update(self) -> None:
-        """Update the sensor."""
-        await self._coordinator.async_request_refresh()
-        if self._coordinator.data is not None:
-            self._attr_native_value = self._coordinator.data
-
-    async def _async_update_data(self) -> float | None:
-        """Fetch lifetime earnings from OCEAN website."""
-        url = f"https://ocean.xyz/stats/{self._username}"
-        
-        try:
-            session = async_get_clientsession(self.hass)
-            async with session.get(url, timeout=aiohttp.ClientTimeout(total=15)) as response:
-                if response.status != 200:
-                    _LOGGER.warning(f"HTTP {response.status} from {url}")
-                    return None
-                
-                html = await response.text()
-                soup = BeautifulSoup(html, 'html.parser')
-                
-                # Find the Lifetime Earnings label and get the next span
-                labels = soup.find_all('div', class_='blocks-label')
-                for label in labels:
-                    if 'Lifetime Earnings' in label.get_text():
-                        # Get the sibling span that contains the value
-                        value_span = label.find_next_sibling('span')
-                        if value_span:
-                            value_text = value_span.get_text()
-                            # Clean the value: remove ' BTC', commas, newlines, and whitespace
-                            clean_value = value_text.replace(' BTC', '').replace(',', '').replace('\n', '').strip()
-                            try:
-                                return float(clean_value)
-                            except ValueError:
-                                _LOGGER.warning(f"Could not parse account lifetime earnings value: {clean_value}")
-                                return None
-                
-                _LOGGER.warning(f"Could not find Lifetime Earnings on account page: {url}")
-                return None
-                
-        except Exception as err:
-            _LOGGER.error(f"Error fetching account lifetime earnings: {err}")
+    @property
+    def native_value(self) -> float | None:
+        """Return the lifetime earnings of the account."""
+        if self.coordinator.data is None:
             return None
+        return self.coordinator.data["account"]
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return parse timing of the last scrape."""
+        parse_stats = self.coordinator.parse_stats
+        return {
+            "pages_parsed": parse_stats["pages"],
+            "parse_loop_blocked_ms": round(parse_stats["loop_blocked"] * 1000, 2),
+            "parse_offloaded_ms": round(parse_stats["offloaded"] * 1000, 2),
+        }
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        return self._coordinator.last_update_success
+        return self.coordinator.last_update_success
 
 
 class OceanWorkerSensor(CoordinatorEntity, SensorEntity):
@@ -491,6 +956,17 @@ class OceanWorkerSensor(CoordinatorEntity, SensorEntity):
         # Remove "OCEAN" prefix from entity names
         self._attr_name = f"{worker_name} {description.name}"
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Only write state when this worker's data changed."""
+        if self.coordinator.worker_changed(self.worker_name):
+            super()._handle_coordinator_update()
+
+    async def async_update(self) -> None:
+        """Update the entity, fetching a fresh worker list."""
+        if self.enabled:
+            await self.coordinator.async_request_workers_refresh()
+
     @property
     def device_info(self) -> entity.DeviceInfo:
         """Return device info - each worker is its own device."""
@@ -552,40 +1028,24 @@ class OceanWorkerSensor(CoordinatorEntity, SensorEntity):
         }
 
 
-class OceanWorkerLifetimeEarningsSensor(SensorEntity):
+class OceanWorkerLifetimeEarningsSensor(CoordinatorEntity, SensorEntity):
     """Sensor for worker lifetime earnings scraped from OCEAN website."""
 
-    def __init__(
-        self,
-        hass: HomeAssistant,
-        username: str,
-        worker_name: str,
-        scan_interval: timedelta,
-    ) -> None:
+    def __init__(self, coordinator, worker_name: str) -> None:
         """Initialize the sensor."""
-        self.hass = hass
-        self._username = username
+        super().__init__(coordinator)
+        self._username = coordinator.username
         self.worker_name = worker_name
         
         # Sanitize worker name for entity ID
         safe_worker_name = worker_name.replace(" ", "_").replace("-", "_")
         
-        self._attr_unique_id = f"{username}_{safe_worker_name}_lifetime_earnings"
+        self._attr_unique_id = f"{self._username}_{safe_worker_name}_lifetime_earnings"
         self._attr_name = f"{worker_name} Lifetime Earnings"
         self._attr_native_unit_of_measurement = BITCOIN
         self._attr_state_class = SensorStateClass.TOTAL_INCREASING
         self._attr_icon = "mdi:bitcoin"
         self._attr_suggested_display_precision = 8
-        self._attr_native_value = None
-        
-        # Create a dedicated coordinator for scraping - uses same interval as API
-        self._coordinator = DataUpdateCoordinator(
-            hass,
-            _LOGGER,
-            name=f"OCEAN Lifetime Earnings {worker_name}",
-            update_method=self._async_update_data,
-            update_interval=scan_interval,
-        )
 
     @property
     def device_info(self) -> entity.DeviceInfo:
@@ -599,55 +1059,19 @@ class OceanWorkerLifetimeEarningsSensor(SensorEntity):
             via_device=(DOMAIN, self._username),
         )
 
-    async def async_added_to_hass(self) -> None:
-        """When entity is added to hass."""
-        await super().async_added_to_hass()
-        await self._coordinator.async_refresh()
+    async def async_will_remove_from_hass(self) -> None:
+        """Stop scraping this worker when the entity is removed."""
+        await super().async_will_remove_from_hass()
+        self.coordinator.async_remove_worker(self.worker_name)
 
-    async def async_update(self) -> None:
-        """Update the sensor."""
-        await self._coordinator.async_request_refresh()
-        if self._coordinator.data is not None:
-            self._attr_native_value = self._coordinator.data
-
-    async def _async_update_data(self) -> float | None:
-        """Fetch lifetime earnings from OCEAN website."""
-        url = f"https://ocean.xyz/stats/{self._username}.{self.worker_name}"
-        
-        try:
-            session = async_get_clientsession(self.hass)
-            async with session.get(url, timeout=aiohttp.ClientTimeout(total=15)) as response:
-                if response.status != 200:
-                    _LOGGER.warning(f"HTTP {response.status} from {url}")
-                    return None
-                
-                html = await response.text()
-                soup = BeautifulSoup(html, 'html.parser')
-                
-                # Find the Lifetime Earnings label and get the next span
-                labels = soup.find_all('div', class_='blocks-label')
-                for label in labels:
-                    if 'Lifetime Earnings' in label.get_text():
-                        # Get the sibling span that contains the value
-                        value_span = label.find_next_sibling('span')
-                        if value_span:
-                            value_text = value_span.get_text()
-                            # Clean the value: remove ' BTC', commas, newlines, and whitespace
-                            clean_value = value_text.replace(' BTC', '').replace(',', '').replace('\n', '').strip()
-                            try:
-                                return float(clean_value)
-                            except ValueError:
-                                _LOGGER.warning(f"Could not parse lifetime earnings value: {clean_value}")
-                                return None
-                
-                _LOGGER.warning(f"Could not find Lifetime Earnings on page: {url}")
-                return None
-                
-        except Exception as err:
-            _LOGGER.error(f"Error fetching lifetime earnings for {self.worker_name}: {err}")
+    @property
+    def native_value(self) -> float | None:
+        """Return the lifetime earnings of the worker."""
+        if self.coordinator.data is None:
             return None
+        return self.coordinator.data["workers"].get(self.worker_name)
 
     @property
     def available(self) -> bool:
         """Return if entity is available."""
-        return self._coordinator.last_update_success
+        return self.coordinator.last_update_success
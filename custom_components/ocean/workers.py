@@ -0,0 +1,331 @@
+"""Array-backed worker table for the OCEAN Mining Pool integration."""
+from __future__ import annotations
+
+from array import array
+from collections.abc import Iterable, Iterator, Mapping
+import logging
+from operator import itemgetter
+import time
+from typing import Any
+
+_LOGGER = logging.getLogger(__name__)
+
+# Hashrates are reported in H/s, we store TH/s
+_TERA = 1_000_000_000_000
+
+# column -> array typecode, in the order WorkerTable.update fills them
+_COLUMNS: dict[str, str] = {
+    "hashrate_60s": "d",
+    "hashrate_300s": "d",
+    "shares_60s": "q",
+    "shares_300s": "q",
+    "last_share_ts": "q",
+    "shares_in_tides": "q",
+    "estimated_earn_next_block": "d",
+    "estimated_bonus_next_block": "d",
+    "estimated_total_earn_next_block": "d",
+}
+WORKER_KEYS = (*_COLUMNS, "is_active")
+
+# API fields feeding the columns, same order
+_API_FIELDS = (
+    "hashrate_60s",
+    "hashrate_300s",
+    "shares_60s",
+    "shares_300s",
+    "lastest_share_ts",
+    "shares_in_tides",
+    "estimated_earn_next_block",
+    "estimated_bonus_earn_next_block",
+    "estimated_total_earn_next_block",
+)
+_get_api_fields = itemgetter(*_API_FIELDS)
+
+
+def _timestamp(value: Any) -> int:
+    """Convert a share timestamp to epoch seconds, 0 if missing or malformed."""
+    try:
+        timestamp = float(value or 0)
+    except (TypeError, ValueError):
+        return 0
+    # Millisecond timestamps
+    if timestamp > 1e11:
+        timestamp /= 1000
+    return int(timestamp) if 0 < timestamp < 1e11 else 0
+
+
+def _convert(raw: tuple[Any, ...]) -> tuple[float | int, ...]:
+    """Convert raw API values to the column storage types."""
+    return (
+        float(raw[0] or 0) / _TERA,
+        float(raw[1] or 0) / _TERA,
+        int(raw[2] or 0),
+        int(raw[3] or 0),
+        _timestamp(raw[4]),
+        int(raw[5] or 0),
+        float(raw[6] or 0),
+        float(raw[7] or 0),
+        float(raw[8] or 0),
+    )
+
+
+class WorkerRow(Mapping[str, Any]):
+    """Read-only view of one worker's row in a WorkerTable."""
+
+    __slots__ = ("_table", "_row")
+
+    def __init__(self, table: WorkerTable, row: int) -> None:
+        """Initialize the view."""
+        self._table = table
+        self._row = row
+
+    def __getitem__(self, key: str) -> Any:
+        """Return a worker value by key."""
+        columns = self._table.columns
+        if key == "is_active":
+            return columns["shares_60s"][self._row] > 0
+        value = columns[key][self._row]
+        # 0 marks a missing timestamp
+        if key == "last_share_ts" and not value:
+            return None
+        return value
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the worker keys."""
+        return iter(WORKER_KEYS)
+
+    def __len__(self) -> int:
+        """Return the number of worker keys."""
+        return len(WORKER_KEYS)
+
+
+class WorkerTable(Mapping[str, WorkerRow]):
+    """Worker data stored column-wise in typed arrays.
+
+    Each worker keeps a stable row across polls and rows are updated in place,
+    so a poll allocates no per-worker dicts. A hash of each row's raw API
+    values lets unchanged workers skip conversion entirely. Converted rows
+    are only written once the whole worker list was read, so a list that
+    fails part way leaves the table untouched. Workers missing
+    from the latest poll keep their row, and the time they went missing, but
+    are not visible through the mapping interface until :meth:`remove`
+    drops them.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty table."""
+        self.columns: dict[str, array] = {
+            column: array(typecode) for column, typecode in _COLUMNS.items()
+        }
+        self._index: dict[str, int] = {}
+        self._names: list[str] = []
+        self._present = bytearray()
+        self._signatures = array("q")
+        # Wall clock time an absent worker went missing
+        self._missing_since = array("d")
+        self._present_count = 0
+        self.active_count = 0
+        # Workers present in the latest poll but not in the one before
+        self.appeared: set[str] = set()
+        # Bumped whenever any row changes
+        self.version = 0
+
+    def __getitem__(self, worker_name: str) -> WorkerRow:
+        """Return the row view of a present worker."""
+        row = self._index[worker_name]
+        if not self._present[row]:
+            raise KeyError(worker_name)
+        return WorkerRow(self, row)
+
+    def __contains__(self, worker_name: object) -> bool:
+        """Return True if the worker was present in the latest poll."""
+        row = self._index.get(worker_name)  # type: ignore[arg-type]
+        return row is not None and bool(self._present[row])
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the workers present in the latest poll."""
+        present = self._present
+        return (name for row, name in enumerate(self._names) if present[row])
+
+    def __len__(self) -> int:
+        """Return the number of workers present in the latest poll."""
+        return self._present_count
+
+    @property
+    def names(self) -> list[str]:
+        """Return every worker that has a row, present or not."""
+        return self._names
+
+    def _add_row(self, worker_name: str) -> int:
+        """Append an empty row for a new worker."""
+        row = len(self._names)
+        self._index[worker_name] = row
+        self._names.append(worker_name)
+        self._present.append(0)
+        self._signatures.append(0)
+        self._missing_since.append(0)
+        for column in self.columns.values():
+            column.append(0)
+        return row
+
+    def as_compact(self) -> dict[str, Any]:
+        """Return all rows column-wise in a JSON serializable form."""
+        return {
+            "names": list(self._names),
+            "present": list(self._present),
+            "missing_since": self._missing_since.tolist(),
+            "columns": {column: values.tolist() for column, values in self.columns.items()},
+        }
+
+    def restore(self, compact: dict[str, Any]) -> None:
+        """Fill an empty table with workers saved by as_compact."""
+        names = compact["names"]
+        saved_columns = [compact["columns"][column] for column in self.columns]
+        saved_present = compact.get("present") or [1] * len(names)
+        saved_missing = compact.get("missing_since") or [0] * len(names)
+        for position, worker_name in enumerate(names):
+            row = self._add_row(worker_name)
+            self._present[row] = saved_present[position]
+            self._missing_since[row] = saved_missing[position]
+            for values, saved in zip(self.columns.values(), saved_columns):
+                values[row] = saved[position]
+
+        # Signatures stay 0, so the first poll rewrites every restored row
+        self._recount()
+        self.version += 1
+
+    def _recount(self) -> None:
+        """Recompute the present and active worker counts."""
+        self._present_count = self._present.count(1)
+        self.active_count = sum(
+            1
+            for is_present, shares in zip(self._present, self.columns["shares_60s"])
+            if is_present and shares > 0
+        )
+
+    def samples(self) -> Iterator[tuple[str, float, bool]]:
+        """Yield (worker, hashrate_60s, active) for every row, absent workers as idle."""
+        hashrate_60s = self.columns["hashrate_60s"]
+        shares_60s = self.columns["shares_60s"]
+        present = self._present
+        for row, name in enumerate(self._names):
+            if present[row]:
+                yield name, hashrate_60s[row], shares_60s[row] > 0
+            else:
+                yield name, 0.0, False
+
+    def missing_since(self, cutoff: float) -> list[str]:
+        """Return the absent workers that went missing before cutoff."""
+        present = self._present
+        missing_since = self._missing_since
+        return [
+            name
+            for row, name in enumerate(self._names)
+            if not present[row] and missing_since[row] < cutoff
+        ]
+
+    def remove(self, worker_names: Iterable[str]) -> None:
+        """Drop workers and their rows, compacting the columns."""
+        dropped = {self._index[name] for name in worker_names if name in self._index}
+        if not dropped:
+            return
+        keep = [row for row in range(len(self._names)) if row not in dropped]
+        for column, values in self.columns.items():
+            self.columns[column] = array(values.typecode, [values[row] for row in keep])
+        self._signatures = array("q", [self._signatures[row] for row in keep])
+        self._missing_since = array("d", [self._missing_since[row] for row in keep])
+        self._present = bytearray(self._present[row] for row in keep)
+        self._names = [self._names[row] for row in keep]
+        self._index = {name: row for row, name in enumerate(self._names)}
+        self._recount()
+        self.version += 1
+
+    def update(self, workers_list: Iterable[dict[str, Any]] | None) -> set[str]:
+        """Update the table in place from userinfo_full workers, return changed workers.
+
+        A worker whose values cannot be converted keeps its previous row.
+        """
+        (
+            hashrate_60s,
+            hashrate_300s,
+            shares_60s,
+            shares_300s,
+            last_share_ts,
+            shares_in_tides,
+            earn,
+            bonus,
+            total_earn,
+        ) = self.columns.values()
+        index = self._index
+        present = self._present
+        signatures = self._signatures
+        seen = bytearray(len(self._names))
+        appeared: set[str] = set()
+        # Converted rows, written after the whole list was read
+        updates: list[tuple[str, int, int, tuple[float | int, ...]]] = []
+        added: dict[str, tuple[int, tuple[float | int, ...]]] = {}
+
+        for worker_dict in workers_list or ():
+            # Each worker is a dict with one key (worker name) and value (worker data)
+            for worker_name, worker_data in worker_dict.items():
+                try:
+                    raw = _get_api_fields(worker_data)
+                except KeyError:
+                    raw = tuple(worker_data.get(field) for field in _API_FIELDS)
+
+                row = index.get(worker_name)
+                try:
+                    signature = hash(raw)
+                    if row is not None and present[row] and signatures[row] == signature:
+                        seen[row] = 1
+                        continue
+                    values = _convert(raw)
+                except (TypeError, ValueError, OverflowError) as err:
+                    _LOGGER.debug(f"Keeping previous values of worker {worker_name}: {err}")
+                    if row is not None and present[row]:
+                        seen[row] = 1
+                    continue
+
+                if row is None:
+                    added[worker_name] = (signature, values)
+                else:
+                    if not present[row]:
+                        appeared.add(worker_name)
+                    updates.append((worker_name, row, signature, values))
+                    seen[row] = 1
+
+        for worker_name, (signature, values) in added.items():
+            row = self._add_row(worker_name)
+            seen.append(1)
+            appeared.add(worker_name)
+            updates.append((worker_name, row, signature, values))
+
+        changed: set[str] = set()
+        for worker_name, row, signature, values in updates:
+            (
+                hashrate_60s[row],
+                hashrate_300s[row],
+                shares_60s[row],
+                shares_300s[row],
+                last_share_ts[row],
+                shares_in_tides[row],
+                earn[row],
+                bonus[row],
+                total_earn[row],
+            ) = values
+            signatures[row] = signature
+            changed.add(worker_name)
+
+        # Workers missing from this poll
+        now = time.time()
+        for row, name in enumerate(self._names):
+            if present[row] and not seen[row]:
+                changed.add(name)
+                self._missing_since[row] = now
+
+        self._present[:] = seen
+        self.appeared = appeared
+        self._recount()
+        if changed:
+            self.version += 1
+        return changed
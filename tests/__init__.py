@@ -0,0 +1 @@
+"""Tests for the OCEAN Mining Pool integration."""
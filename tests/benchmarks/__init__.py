@@ -0,0 +1 @@
+"""Opt-in benchmarks for the OCEAN Mining Pool integration, run with --benchmark."""
@@ -0,0 +1,14 @@
+"""Fixtures for the OCEAN Mining Pool benchmarks."""
+import pytest
+
+
+@pytest.fixture
+def stand_in_threaded() -> bool:
+    """Keep building the stand-in server's responses off the measured event loop."""
+    return True
+
+
+@pytest.fixture(autouse=True)
+def enable_event_loop_debug(event_loop):
+    """Measure without the debug mode the test harness turns on, it records every call's stack."""
+    event_loop.set_debug(False)
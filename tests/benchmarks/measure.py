@@ -0,0 +1,31 @@
+"""Timing and memory measurements shared by the benchmarks."""
+from collections.abc import Callable
+import time
+import tracemalloc
+from typing import Any
+
+
+def best_time(func: Callable[[], Any], repeat: int = 5) -> float:
+    """Return the seconds of the fastest of repeat calls of func."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def traced(func: Callable[[], Any]) -> tuple[Any, int, int]:
+    """Call func under tracemalloc, return its result and the bytes it kept and peaked at."""
+    tracemalloc.start()
+    try:
+        result = func()
+        kept, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return result, kept, peak
+
+
+def mib(size: int) -> str:
+    """Format a byte count in MiB."""
+    return f"{size / 1_048_576:.2f} MiB"
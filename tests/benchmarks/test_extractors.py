@@ -0,0 +1,84 @@
+"""Benchmark of the stats page extractors, per page."""
+import codecs
+from functools import partial
+
+import pytest
+
+from custom_components.ocean.const import SCRAPE_CHUNK_SIZE
+from custom_components.ocean.scrape import AccountPageExtractor, LifetimeEarningsExtractor
+
+from ..server import Account
+from .measure import best_time, mib, traced
+
+
+def _soup_lifetime_earnings(page):
+    """Find the lifetime earnings in a full BeautifulSoup tree, as before the extractors."""
+    from bs4 import BeautifulSoup
+
+    soup = BeautifulSoup(page.decode(), "html.parser")
+    for label in soup.find_all("div", class_="blocks-label"):
+        if "Lifetime Earnings" in label.get_text():
+            if value_span := label.find_next_sibling("span"):
+                return value_span.get_text().strip()
+    return None
+
+
+def _scan(extractor, page):
+    """Feed page bytes to an extractor in download sized batches, as a scrape does."""
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    for start in range(0, len(page), SCRAPE_CHUNK_SIZE):
+        if extractor.feed(decoder.decode(page[start:start + SCRAPE_CHUNK_SIZE])):
+            break
+    return extractor
+
+
+PAGES = pytest.mark.parametrize(
+    ("page", "workers"), [("worker", 1), ("account", 10), ("account", 1_000), ("account", 10_000)]
+)
+
+
+def _stats_page(page, workers):
+    """Return the body of a worker or account stats page."""
+    account = Account("acct", workers)
+    if page == "worker":
+        return account.stats_page("worker0").encode()
+    return account.stats_page().encode()
+
+
+@pytest.mark.benchmark
+@PAGES
+def test_extractor(report, page, workers):
+    """Measure the time and peak memory of scanning a worker or account stats page."""
+    body = _stats_page(page, workers)
+    if page == "worker":
+        new_extractor = LifetimeEarningsExtractor
+    else:
+        new_extractor = partial(AccountPageExtractor, "acct")
+
+    extractor, _, peak = traced(lambda: _scan(new_extractor(), body))
+    elapsed = best_time(lambda: _scan(new_extractor(), body))
+
+    assert extractor.found
+    if page == "account":
+        assert len(extractor.workers) == workers
+    report(
+        f"extractor {page} page, {workers:>5} workers, {len(body) / 1024:.0f} KiB: "
+        f"{elapsed * 1000:.2f} ms, peak {mib(peak)}"
+    )
+
+
+@pytest.mark.benchmark
+@PAGES
+def test_beautifulsoup_baseline(report, page, workers):
+    """Measure the same pages parsed into a BeautifulSoup tree, the approach replaced."""
+    pytest.importorskip("bs4")
+    body = _stats_page(page, workers)
+
+    value, _, peak = traced(lambda: _soup_lifetime_earnings(body))
+    elapsed = best_time(lambda: _soup_lifetime_earnings(body))
+
+    assert value is not None
+    report(
+        f"soup      {page} page, {workers:>5} workers, {len(body) / 1024:.0f} KiB: "
+        f"{elapsed * 1000:.2f} ms, peak {mib(peak)}"
+    )
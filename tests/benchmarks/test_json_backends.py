@@ -0,0 +1,25 @@
+"""Benchmark of decoding API payloads with orjson and the standard library."""
+import json
+
+import pytest
+
+from ..server import Account
+from .measure import best_time
+
+orjson = pytest.importorskip("orjson")
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("workers", [10, 500, 5_000, 50_000])
+def test_json_backends(report, workers):
+    """Measure the decode time of a userinfo_full body by payload size."""
+    body = json.dumps(Account("acct", workers).userinfo_full()).encode()
+
+    assert orjson.loads(body) == json.loads(body)
+    stdlib_time = best_time(lambda: json.loads(body))
+    orjson_time = best_time(lambda: orjson.loads(body))
+
+    report(
+        f"json backends {workers:>6} workers, {len(body) / 1024:.0f} KiB: "
+        f"json {stdlib_time * 1000:.2f} ms, orjson {orjson_time * 1000:.2f} ms"
+    )
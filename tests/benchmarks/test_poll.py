@@ -0,0 +1,70 @@
+"""Poll benchmark of the account coordinator and its entity platforms.
+
+Every poll follows a snapshot roll, so each worker's data changes and every
+worker entity is written: the worst case for an account of that size.
+"""
+import asyncio
+import resource
+import statistics
+import time
+
+import pytest
+
+from custom_components.ocean.const import DOMAIN
+from custom_components.ocean.metrics import METRIC_STATE_WRITES
+
+POLLS = 5
+# Seconds between event loop lag samples
+LAG_PROBE_INTERVAL = 0.005
+
+
+def _peak_rss_mib() -> float:
+    """Return the peak resident set size of the process in MiB."""
+    # ru_maxrss is in KiB on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("workers", [10, 100, 1_000, 10_000])
+async def test_poll(hass, setup_account, stand_in, report, workers):
+    """Measure poll latency, event loop lag, state writes and memory by account size."""
+    rss_before = _peak_rss_mib()
+    start = time.perf_counter()
+    entry = await setup_account(workers=workers)
+    setup_time = time.perf_counter() - start
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+
+    lag = 0.0
+
+    async def probe_lag() -> None:
+        nonlocal lag
+        loop = asyncio.get_running_loop()
+        while True:
+            start = loop.time()
+            await asyncio.sleep(LAG_PROBE_INTERVAL)
+            lag = max(lag, loop.time() - start - LAG_PROBE_INTERVAL)
+
+    latencies = []
+    state_writes = []
+    probe = asyncio.ensure_future(probe_lag())
+    try:
+        for _ in range(POLLS):
+            stand_in.roll()
+            start = time.perf_counter()
+            await coordinator.async_refresh()
+            latencies.append(time.perf_counter() - start)
+            state_writes.append(coordinator.metrics.summary(METRIC_STATE_WRITES)["last"])
+    finally:
+        probe.cancel()
+        await asyncio.gather(probe, return_exceptions=True)
+
+    assert coordinator.last_update_success
+    assert len(coordinator.workers) == workers
+    peak = _peak_rss_mib()
+    report(
+        f"poll {workers:>6} workers: setup {setup_time:.2f} s, "
+        f"poll median {statistics.median(latencies) * 1000:.1f} ms "
+        f"max {max(latencies) * 1000:.1f} ms, loop lag max {lag * 1000:.1f} ms, "
+        f"{statistics.mean(state_writes):.0f} state writes per poll, "
+        f"peak RSS {peak:.0f} MiB (+{peak - rss_before:.0f} MiB)"
+    )
@@ -0,0 +1,52 @@
+"""Benchmark of streamed against full decoding of userinfo_full bodies."""
+import json
+
+import pytest
+
+from custom_components.ocean.decode import StreamedUserinfo, json_loads
+from custom_components.ocean.workers import WorkerTable
+
+from ..server import Account
+from .measure import best_time, mib, traced
+
+
+def _full(body):
+    """Decode the whole body, then update a worker table from it."""
+    table = WorkerTable()
+    table.update(json_loads(body)["result"]["workers"])
+    return table
+
+
+def _streamed(body):
+    """Update a worker table while the body is decoded worker by worker."""
+    table = WorkerTable()
+    table.update(StreamedUserinfo(body.decode("utf-8")).iter_workers())
+    return table
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("workers", [1_000, 10_000, 50_000])
+def test_streamed_decode(report, workers):
+    """Measure peak memory, total time and time to the first worker of both decoders."""
+    body = json.dumps(Account("acct", workers).userinfo_full()).encode()
+    results = {}
+    for name, decode, workers_of in (
+        ("full", _full, lambda body: json_loads(body)["result"]["workers"]),
+        ("streamed", _streamed, lambda body: StreamedUserinfo(body.decode("utf-8")).iter_workers()),
+    ):
+        table, _, peak = traced(lambda: decode(body))
+        assert len(table) == workers
+        results[name] = (
+            peak,
+            best_time(lambda: decode(body)),
+            # Until the first worker can be read
+            best_time(lambda: next(iter(workers_of(body)))),
+        )
+
+    report(
+        f"decode {workers:>6} workers, {len(body) / 1_048_576:.1f} MiB body: "
+        + "; ".join(
+            f"{name} peak {mib(peak)}, {total * 1000:.1f} ms, first worker {first * 1000:.2f} ms"
+            for name, (peak, total, first) in results.items()
+        )
+    )
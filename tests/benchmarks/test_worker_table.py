@@ -0,0 +1,67 @@
+"""Benchmark of the worker table against the dict of worker dicts it replaced."""
+import itertools
+
+import pytest
+
+from custom_components.ocean.workers import WorkerTable
+
+from ..server import Account
+from .measure import best_time, mib, traced
+
+
+def _worker_dicts(workers_list):
+    """Convert a worker list into one dict per worker, as before the worker table."""
+    workers = {}
+    for worker_dict in workers_list:
+        for worker_name, worker_data in worker_dict.items():
+            workers[worker_name] = {
+                "hashrate_60s": float(worker_data.get("hashrate_60s", 0)) / 1_000_000_000_000,
+                "hashrate_300s": float(worker_data.get("hashrate_300s", 0)) / 1_000_000_000_000,
+                "shares_60s": int(worker_data.get("shares_60s", 0)),
+                "shares_300s": int(worker_data.get("shares_300s", 0)),
+                "last_share_ts": worker_data.get("lastest_share_ts"),
+                "shares_in_tides": int(worker_data.get("shares_in_tides", 0)),
+                "estimated_earn_next_block": float(worker_data.get("estimated_earn_next_block", 0)),
+                "estimated_bonus_next_block": float(
+                    worker_data.get("estimated_bonus_earn_next_block", 0)
+                ),
+                "estimated_total_earn_next_block": float(
+                    worker_data.get("estimated_total_earn_next_block", 0)
+                ),
+                "is_active": int(worker_data.get("shares_60s", 0)) > 0,
+            }
+    return workers
+
+
+def _filled_table(workers_list):
+    """Return a worker table updated with a worker list."""
+    table = WorkerTable()
+    table.update(workers_list)
+    return table
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("workers", [1_000, 10_000, 50_000])
+def test_worker_table(report, workers):
+    """Measure memory and update time of the worker table and of worker dicts."""
+    account = Account("acct", workers)
+    first = account.userinfo_full()["result"]["workers"]
+    account.snap_ts += 60
+    rolled = account.userinfo_full()["result"]["workers"]
+
+    dicts, dicts_kept, _ = traced(lambda: _worker_dicts(first))
+    dicts_time = best_time(lambda: _worker_dicts(rolled))
+    table, table_kept, table_peak = traced(lambda: _filled_table(first))
+    # Every other update finds every worker changed
+    lists = itertools.cycle([rolled, first])
+    changed_time = best_time(lambda: table.update(next(lists)))
+    table.update(rolled)
+    unchanged_time = best_time(lambda: table.update(rolled))
+
+    assert len(table) == len(dicts) == workers
+    report(
+        f"worker table {workers:>6} workers: dicts {mib(dicts_kept)}, "
+        f"{dicts_time * 1000:.1f} ms per poll; table {mib(table_kept)} "
+        f"(peak {mib(table_peak)}), {changed_time * 1000:.1f} ms changed, "
+        f"{unchanged_time * 1000:.1f} ms unchanged"
+    )
@@ -0,0 +1,126 @@
+"""Fixtures for the OCEAN Mining Pool tests."""
+from __future__ import annotations
+
+import asyncio
+from functools import partial
+import threading
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from homeassistant.config_entries import ConfigEntry, ConfigEntryState
+from homeassistant.core import HomeAssistant
+
+from custom_components.ocean.const import CONF_SCAN_INTERVAL, CONF_USERNAME, DOMAIN
+from custom_components.ocean.engine import OceanPollingEngine
+
+from .server import StandInServer
+
+_BENCHMARK_REPORT = pytest.StashKey[list[str]]()
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add the option running the benchmarks."""
+    parser.addoption(
+        "--benchmark", action="store_true", default=False, help="run the benchmark tests"
+    )
+
+
+def pytest_collection_modifyitems(config: pytest.Config, items: list[pytest.Item]) -> None:
+    """Skip the benchmarks unless they were asked for."""
+    if config.getoption("--benchmark"):
+        return
+    skip = pytest.mark.skip(reason="benchmark, run with --benchmark")
+    for item in items:
+        if "benchmark" in item.keywords:
+            item.add_marker(skip)
+
+
+def pytest_terminal_summary(terminalreporter: Any, config: pytest.Config) -> None:
+    """Print the lines reported by the benchmarks."""
+    if lines := config.stash.get(_BENCHMARK_REPORT, None):
+        terminalreporter.section("OCEAN benchmarks")
+        for line in lines:
+            terminalreporter.write_line(line)
+
+
+@pytest.fixture
+def report(request: pytest.FixtureRequest):
+    """Return a function adding a line to the benchmark report."""
+    lines = request.config.stash.setdefault(_BENCHMARK_REPORT, [])
+    return lines.append
+
+
+@pytest.fixture(autouse=True)
+def join_parse_threads():
+    """Wait for the parse pools' threads, which shut down without waiting."""
+    yield
+    for thread in threading.enumerate():
+        if thread.name.startswith("ocean_parse"):
+            thread.join(5)
+
+
+@pytest.fixture
+def stand_in_threaded() -> bool:
+    """Return True to run the stand-in server on its own thread."""
+    return False
+
+
+@pytest.fixture
+async def stand_in(socket_enabled, stand_in_threaded):
+    """Serve the OCEAN API and stats pages locally and point the integration at them."""
+    server = StandInServer(threaded=stand_in_threaded)
+    await server.start()
+    base = server.url("/")
+    with patch.multiple(
+        "custom_components.ocean.coordinator",
+        API_STATSNAP=f"{base}v1/statsnap/{{username}}",
+        API_USERINFO_FULL=f"{base}v1/userinfo_full/{{username}}",
+        STATS_ACCOUNT_URL=f"{base}stats/{{username}}",
+        STATS_WORKER_URL=f"{base}stats/{{username}}.{{worker}}",
+        API_RETRY_BASE_DELAY=0.01,
+    ), patch(
+        # Tests poll far faster than the request budget allows
+        "custom_components.ocean.OceanPollingEngine",
+        partial(OceanPollingEngine, requests_per_minute=600_000, burst=10_000),
+    ):
+        yield server
+    await server.stop()
+
+
+@pytest.fixture
+async def setup_account(hass: HomeAssistant, enable_custom_integrations, stand_in):
+    """Return a function setting up an account's config entry against the stand-in server."""
+    entries: list[ConfigEntry] = []
+
+    async def setup(
+        username: str = "acct",
+        workers: int = 3,
+        options: dict[str, Any] | None = None,
+    ) -> ConfigEntry:
+        if username not in stand_in.accounts:
+            stand_in.add_account(username, workers)
+        entry = MockConfigEntry(
+            domain=DOMAIN,
+            title=username,
+            unique_id=username,
+            data={CONF_USERNAME: username, CONF_SCAN_INTERVAL: 60},
+            options=options or {},
+        )
+        entry.add_to_hass(hass)
+        assert await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done()
+        # Also let the lifetime earnings scrape finish, it runs as a background task
+        await asyncio.gather(*entry._background_tasks)
+        entries.append(entry)
+        return entry
+
+    yield setup
+
+    # Unloading cancels the coordinators' timers and shuts the parse pool down
+    for entry in entries:
+        if entry.state is ConfigEntryState.LOADED:
+            await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
@@ -0,0 +1,231 @@
+"""Local stand-in for the OCEAN API and stats pages.
+
+Serves synthetic accounts with any number of workers under the same paths as
+api.ocean.xyz (/v1/userinfo_full/<username>, /v1/statsnap/<username>) and
+ocean.xyz (/stats/<username>, /stats/<username>.<worker>). Latency and
+error responses can be injected per endpoint, and API responses can carry
+an ETag that is answered with 304 Not Modified. A threaded server runs on its
+own event loop, so benchmarks do not measure building its responses.
+"""
+from __future__ import annotations
+
+import asyncio
+from collections import defaultdict, deque
+from dataclasses import dataclass
+import hashlib
+import json
+import threading
+from typing import Any
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+# Endpoint names used for hits, latency and injected errors
+USERINFO_FULL = "userinfo_full"
+STATSNAP = "statsnap"
+STATS = "stats"
+
+# Hashrates are reported in H/s
+_TERA = 1_000_000_000_000
+# Markup before and after the values, so pages span several chunks
+_FILLER = "<div class=\"filler\">x</div>" * 2000
+
+
+@dataclass
+class Account:
+    """Synthetic OCEAN account."""
+
+    username: str
+    workers: int
+    snap_ts: int = 1_700_000_000
+    unpaid: float = 0.001
+    # The account page carries the workers table
+    worker_table: bool = True
+
+    def worker_names(self) -> list[str]:
+        """Return the names of the account's workers."""
+        return [f"worker{index}" for index in range(self.workers)]
+
+    def worker_data(self, index: int) -> dict[str, Any]:
+        """Return the API data of a worker."""
+        return {
+            "hashrate_60s": (100 + index) * _TERA,
+            "hashrate_300s": 100 * _TERA,
+            "shares_60s": index % 3,
+            "shares_300s": 5,
+            "lastest_share_ts": self.snap_ts - index,
+            "shares_in_tides": 10,
+            "estimated_earn_next_block": 0.0001,
+            "estimated_bonus_earn_next_block": 0,
+            "estimated_total_earn_next_block": 0.0001,
+        }
+
+    def user_full(self) -> dict[str, Any]:
+        """Return the account totals."""
+        return {
+            "snap_ts": self.snap_ts,
+            "hashrate_60s": 100 * self.workers * _TERA,
+            "hashrate_300s": 100 * self.workers * _TERA,
+            "shares_60s": self.workers,
+            "shares_300s": 5 * self.workers,
+            "lastest_share_ts": self.snap_ts,
+            "shares_in_tides": 10 * self.workers,
+            "estimated_earn_next_block": 0.0001 * self.workers,
+            "estimated_bonus_earn_next_block": 0,
+            "estimated_total_earn_next_block": 0.0001 * self.workers,
+            "estimated_payout_next_block": 0.0001 * self.workers,
+            "unpaid": self.unpaid,
+        }
+
+    def userinfo_full(self) -> dict[str, Any]:
+        """Return the userinfo_full response."""
+        workers = [
+            {name: self.worker_data(index)} for index, name in enumerate(self.worker_names())
+        ]
+        return {"result": {"user_full": self.user_full(), "workers": workers}}
+
+    def lifetime_earnings(self, worker: str | None = None) -> float:
+        """Return the lifetime earnings shown on a stats page."""
+        if worker is None:
+            return 0.5
+        return int(worker.removeprefix("worker")) / 1000
+
+    def stats_page(self, worker: str | None = None) -> str:
+        """Return the HTML of the account's or a worker's stats page."""
+        page = [
+            "<html><body>",
+            _FILLER,
+            '<div class="blocks-label">Lifetime Earnings</div>',
+            f"<span>{self.lifetime_earnings(worker):.8f} BTC</span>",
+        ]
+        if worker is None and self.worker_table:
+            rows = "".join(
+                f"<tr><td><a>{self.username}.{name}</a></td><td>100 TH/s</td>"
+                f"<td>{self.lifetime_earnings(name):.8f} BTC</td></tr>"
+                for name in self.worker_names()
+            )
+            page.append(
+                "<table><thead><tr><th>Worker</th><th>Hashrate</th>"
+                f"<th>Lifetime Earnings</th></tr></thead><tbody>{rows}</tbody></table>"
+            )
+        page.extend((_FILLER, "</body></html>"))
+        return "".join(page)
+
+
+class StandInServer:
+    """aiohttp server answering like OCEAN for the accounts added to it."""
+
+    def __init__(self, threaded: bool = False) -> None:
+        """Initialize a server without accounts."""
+        self._threaded = threaded
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self.accounts: dict[str, Account] = {}
+        # Seconds added before each response, per endpoint
+        self.latency: dict[str, float] = defaultdict(float)
+        self.hits: dict[str, int] = defaultdict(int)
+        # Send ETags with API responses and honour If-None-Match
+        self.etags = False
+        self._errors: dict[str, deque[int]] = defaultdict(deque)
+        self._server: TestServer | None = None
+
+    def add_account(self, username: str, workers: int, **kwargs: Any) -> Account:
+        """Add a synthetic account with `workers` workers."""
+        account = self.accounts[username] = Account(username, workers, **kwargs)
+        return account
+
+    def fail(self, endpoint: str, *statuses: int) -> None:
+        """Answer the next requests to endpoint with these HTTP statuses."""
+        self._errors[endpoint].extend(statuses)
+
+    def roll(self, seconds: int = 60) -> None:
+        """Advance the snapshot of every account."""
+        for account in self.accounts.values():
+            account.snap_ts += seconds
+
+    def url(self, path: str) -> str:
+        """Return the URL of a path on the running server."""
+        assert self._server is not None
+        return str(self._server.make_url(path))
+
+    async def start(self) -> None:
+        """Start serving on a free local port."""
+        if not self._threaded:
+            await self._start_server()
+            return
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="stand_in_server")
+        self._thread.start()
+        await self._run_threaded(self._start_server())
+
+    async def stop(self) -> None:
+        """Stop the server."""
+        if self._server is None:
+            return
+        if self._loop is None:
+            await self._server.close()
+        else:
+            await self._run_threaded(self._server.close())
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop.close()
+            self._loop = self._thread = None
+        self._server = None
+
+    async def _start_server(self) -> None:
+        """Create the application and start serving it on the running loop."""
+        app = web.Application()
+        app.router.add_get("/v1/userinfo_full/{username}", self._userinfo_full)
+        app.router.add_get("/v1/statsnap/{username}", self._statsnap)
+        app.router.add_get("/stats/{name}", self._stats)
+        self._server = TestServer(app)
+        await self._server.start_server()
+
+    async def _run_threaded(self, coro: Any) -> Any:
+        """Run a coroutine on the server thread's loop and wait for it."""
+        return await asyncio.wrap_future(asyncio.run_coroutine_threadsafe(coro, self._loop))
+
+    async def _answer(self, endpoint: str, username: str) -> Account | web.Response:
+        """Count the request, apply latency, return the account or an error response."""
+        self.hits[endpoint] += 1
+        if delay := self.latency[endpoint]:
+            await asyncio.sleep(delay)
+        if errors := self._errors[endpoint]:
+            return web.Response(status=errors.popleft(), text="Injected error")
+        if (account := self.accounts.get(username)) is None:
+            return web.Response(status=404, text="Unknown account")
+        return account
+
+    async def _userinfo_full(self, request: web.Request) -> web.Response:
+        """Answer /v1/userinfo_full/<username>."""
+        account = await self._answer(USERINFO_FULL, request.match_info["username"])
+        if isinstance(account, web.Response):
+            return account
+        return self._json(request, account.userinfo_full())
+
+    async def _statsnap(self, request: web.Request) -> web.Response:
+        """Answer /v1/statsnap/<username>."""
+        account = await self._answer(STATSNAP, request.match_info["username"])
+        if isinstance(account, web.Response):
+            return account
+        return self._json(request, {"result": account.user_full()})
+
+    def _json(self, request: web.Request, data: dict[str, Any]) -> web.Response:
+        """Answer with data as JSON, or 304 when the client has the same body."""
+        body = json.dumps(data)
+        if not self.etags:
+            return web.json_response(text=body)
+        etag = f'"{hashlib.sha1(body.encode()).hexdigest()}"'
+        if request.headers.get("If-None-Match") == etag:
+            return web.Response(status=304, headers={"ETag": etag})
+        return web.json_response(text=body, headers={"ETag": etag})
+
+    async def _stats(self, request: web.Request) -> web.Response:
+        """Answer /stats/<username> and /stats/<username>.<worker>."""
+        username, _, worker = request.match_info["name"].partition(".")
+        account = await self._answer(STATS, username)
+        if isinstance(account, web.Response):
+            return account
+        if worker and worker not in account.worker_names():
+            return web.Response(status=404, text="Unknown worker")
+        return web.Response(text=account.stats_page(worker or None), content_type="text/html")
@@ -0,0 +1,52 @@
+"""Tests for the circuit breaker."""
+from custom_components.ocean.breaker import CircuitBreaker
+
+
+def test_opens_after_threshold():
+    """Test the breaker opens after consecutive failures and fails fast."""
+    breaker = CircuitBreaker(threshold=3, cooldown=60, max_cooldown=900)
+
+    assert not breaker.record_failure(0)
+    assert not breaker.record_failure(1)
+    assert breaker.record_failure(2)
+    assert not breaker.allow(10)
+    assert breaker.retry_in(10) == 52
+
+
+def test_success_resets_failures():
+    """Test a success in between keeps the breaker closed."""
+    breaker = CircuitBreaker(threshold=2, cooldown=60, max_cooldown=900)
+
+    breaker.record_failure(0)
+    breaker.record_success()
+    assert not breaker.record_failure(1)
+    assert breaker.allow(1)
+
+
+def test_half_open_trial():
+    """Test a single trial after the cool-down, doubling the cool-down on failure."""
+    breaker = CircuitBreaker(threshold=1, cooldown=60, max_cooldown=100)
+    breaker.record_failure(0)
+
+    assert breaker.allow(60)
+    # Only one trial request at a time
+    assert not breaker.allow(60)
+    assert breaker.record_failure(61)
+    assert breaker.cooldown == 100
+    assert not breaker.allow(150)
+
+    assert breaker.allow(161)
+    breaker.record_success()
+    assert breaker.allow(162)
+    assert breaker.cooldown == 60
+    assert breaker.as_dict(162) == {"open": False, "failures": 0, "cooldown": 60, "retry_in": 0.0}
+
+
+def test_release_abandoned_trial():
+    """Test an abandoned trial request lets the next one through."""
+    breaker = CircuitBreaker(threshold=1, cooldown=60, max_cooldown=900)
+    breaker.record_failure(0)
+
+    assert breaker.allow(60)
+    breaker.release()
+    assert breaker.allow(60)
@@ -0,0 +1,231 @@
+"""Tests of the account coordinator and its API client against the stand-in server."""
+import asyncio
+from unittest.mock import patch
+
+from custom_components.ocean.const import DOMAIN
+from custom_components.ocean.coordinator import data_store
+from custom_components.ocean.metrics import COUNTER_RETRIES
+
+from .server import STATSNAP, USERINFO_FULL
+
+
+def _coordinator(hass, entry):
+    """Return the coordinator of a loaded config entry."""
+    return hass.data[DOMAIN][entry.entry_id]
+
+
+async def _wait_background_tasks(entry):
+    """Wait for the entry's background tasks, async_block_till_done does not."""
+    await asyncio.gather(*entry._background_tasks)
+
+
+async def test_first_refresh_parses_account_and_workers(hass, setup_account):
+    """Test setup fetches userinfo_full into the account data and worker table."""
+    entry = await setup_account(workers=3)
+    coordinator = _coordinator(hass, entry)
+
+    assert coordinator.last_update_success
+    assert coordinator.data["hashrate_60s"] == 300.0
+    assert coordinator.data["active_workers"] == 2
+    assert coordinator.workers.names == ["worker0", "worker1", "worker2"]
+    assert coordinator.worker_registry == {"worker0", "worker1", "worker2"}
+
+
+async def test_transient_errors_are_retried(hass, setup_account, stand_in):
+    """Test transient HTTP errors are retried within one poll."""
+    stand_in.fail(USERINFO_FULL, 503, 502)
+    entry = await setup_account()
+    coordinator = _coordinator(hass, entry)
+
+    assert coordinator.last_update_success
+    assert stand_in.hits[USERINFO_FULL] == 3
+    assert coordinator.metrics.counters[COUNTER_RETRIES] == 2
+
+
+async def test_client_errors_are_not_retried(hass, setup_account, stand_in):
+    """Test a 404 fails the request without retries."""
+    entry = await setup_account()
+    coordinator = _coordinator(hass, entry)
+    hits = stand_in.hits[USERINFO_FULL]
+
+    stand_in.fail(USERINFO_FULL, 404)
+    await coordinator.async_refresh()
+
+    assert stand_in.hits[USERINFO_FULL] == hits + 1
+    assert coordinator.metrics.counters[COUNTER_RETRIES] == 0
+
+
+async def test_breaker_pauses_failing_endpoint(hass, setup_account, stand_in):
+    """Test requests stop after repeated failures while the last good data is served."""
+    entry = await setup_account()
+    coordinator = _coordinator(hass, entry)
+    stand_in.fail(USERINFO_FULL, *[503] * 9)
+
+    for _ in range(3):
+        await coordinator.async_refresh()
+    hits = stand_in.hits[USERINFO_FULL]
+    await coordinator.async_refresh()
+
+    assert stand_in.hits[USERINFO_FULL] == hits
+    assert coordinator.api.stats["short_circuited"] == 1
+    assert coordinator.last_update_success
+    assert coordinator.stale
+    assert coordinator.changed_keys == {"data_age"}
+    assert coordinator.data["hashrate_60s"] == 300.0
+
+
+async def test_stale_data_expires(hass, setup_account, stand_in):
+    """Test the last good data is dropped once it is older than STALE_MAX_AGE."""
+    entry = await setup_account()
+    coordinator = _coordinator(hass, entry)
+
+    stand_in.fail(USERINFO_FULL, 503, 503, 503)
+    with patch("custom_components.ocean.coordinator.STALE_MAX_AGE", -1):
+        await coordinator.async_refresh()
+
+    assert not coordinator.last_update_success
+    assert not coordinator.stale
+    assert not coordinator.available
+
+
+async def test_stale_data_recovers(hass, setup_account, stand_in):
+    """Test the first good poll after an outage clears the stale flag."""
+    entry = await setup_account()
+    coordinator = _coordinator(hass, entry)
+
+    stand_in.fail(USERINFO_FULL, 503, 503, 503)
+    await coordinator.async_refresh()
+    assert coordinator.stale
+    stand_in.roll()
+    await coordinator.async_refresh()
+
+    assert not coordinator.stale
+    assert not coordinator.changed_keys & {"data_age", "unpaid"}
+    # The states written before the outage are current, only the roll changed
+    assert coordinator.key_changed("snap_ts")
+    assert not coordinator.key_changed("unpaid")
+    assert coordinator.worker_changed("worker0")
+
+
+async def test_unchanged_body_is_not_parsed(hass, setup_account, stand_in):
+    """Test a byte-identical response keeps the current data object."""
+    entry = await setup_account()
+    coordinator = _coordinator(hass, entry)
+    data = coordinator.data
+
+    await coordinator.async_refresh()
+
+    assert coordinator.data is data
+    assert coordinator.api.stats["unchanged"] == 1
+    assert stand_in.hits[USERINFO_FULL] == 2
+
+
+async def test_not_modified_response(hass, setup_account, stand_in):
+    """Test the cached ETag is sent and a 304 keeps the current data object."""
+    stand_in.etags = True
+    entry = await setup_account()
+    coordinator = _coordinator(hass, entry)
+    data = coordinator.data
+
+    await coordinator.async_refresh()
+    assert coordinator.data is data
+    assert coordinator.api.stats["not_modified"] == 1
+
+    stand_in.roll()
+    await coordinator.async_refresh()
+    assert coordinator.data is not data
+    assert coordinator.data["snap_ts"] == 1_700_000_060
+
+
+async def test_unconditional_fetch_after_endpoint_switch(hass, setup_account, stand_in):
+    """Test a payload that is not the one parsed last is fetched without validators."""
+    stand_in.etags = True
+    entry = await setup_account(options={"worker_scan_interval": 3600})
+    coordinator = _coordinator(hass, entry)
+
+    # The statsnap is fetched between worker list fetches, then userinfo_full again
+    await coordinator.async_refresh()
+    assert stand_in.hits[STATSNAP] == 1
+    await coordinator.async_request_workers_refresh()
+    await hass.async_block_till_done()
+
+    assert stand_in.hits[USERINFO_FULL] == 2
+    assert coordinator.api.stats["not_modified"] == 0
+
+
+async def test_concurrent_fetches_share_one_request(hass, setup_account, stand_in):
+    """Test concurrent fetches of one URL are coalesced into a single request."""
+    entry = await setup_account()
+    api = _coordinator(hass, entry).api
+    stand_in.latency[USERINFO_FULL] = 0.05
+    hits = stand_in.hits[USERINFO_FULL]
+
+    first, second = await asyncio.gather(
+        api.fetch_userinfo_full(False), api.fetch_userinfo_full(False)
+    )
+
+    assert first is second
+    assert stand_in.hits[USERINFO_FULL] == hits + 1
+    assert api.stats["coalesced"] == 1
+
+
+async def test_cancelled_caller_does_not_cancel_shared_fetch(hass, setup_account, stand_in):
+    """Test a cancelled caller leaves the shared request running for the others."""
+    entry = await setup_account()
+    api = _coordinator(hass, entry).api
+    stand_in.latency[USERINFO_FULL] = 0.05
+
+    cancelled = asyncio.ensure_future(api.fetch_userinfo_full(False))
+    waiting = asyncio.ensure_future(api.fetch_userinfo_full(False))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    payload, unchanged = await waiting
+
+    assert cancelled.cancelled()
+    assert payload["user_full"]["snap_ts"] == 1_700_000_000
+    assert not unchanged
+
+
+async def test_pending_save_is_flushed_on_unload(hass, hass_storage, setup_account, stand_in):
+    """Test unloading writes the data that was waiting for the delayed save."""
+    entry = await setup_account()
+    stand_in.roll()
+    await _coordinator(hass, entry).async_refresh()
+
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+    stored = hass_storage[data_store(hass, "acct").key]["data"]
+    assert stored["account"]["snap_ts"] == 1_700_000_060
+    assert len(stored["workers"]["names"]) == 3
+
+
+async def test_restore_serves_saved_data_before_the_api(hass, setup_account, stand_in):
+    """Test a reloaded entry starts from the saved data while the API is down."""
+    entry = await setup_account()
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+    stand_in.fail(USERINFO_FULL, *[503] * 3)
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    coordinator = _coordinator(hass, entry)
+    assert coordinator.data["hashrate_60s"] == 300.0
+    # The refresh started in the background fails, the saved data is served stale
+    await _wait_background_tasks(entry)
+
+    assert coordinator.stale
+    assert coordinator.available
+    assert coordinator.data["hashrate_60s"] == 300.0
+    assert coordinator.workers.names == ["worker0", "worker1", "worker2"]
+    assert coordinator.worker_registry == {"worker0", "worker1", "worker2"}
+
+
+async def test_removed_entry_deletes_saved_data(hass, hass_storage, setup_account):
+    """Test removing the config entry removes its saved data."""
+    entry = await setup_account()
+    key = data_store(hass, "acct").key
+    assert await hass.config_entries.async_unload(entry.entry_id)
+    assert key in hass_storage
+
+    await hass.config_entries.async_remove(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert key not in hass_storage
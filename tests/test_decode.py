@@ -0,0 +1,57 @@
+"""Tests for the JSON decoding helpers."""
+import json
+
+import pytest
+
+from custom_components.ocean.decode import StreamedUserinfo, json_loads
+
+
+def test_streamed_userinfo_matches_full_decode():
+    """Test workers and fields equal those of a full decode."""
+    document = {
+        "result": {
+            "user_full": {"snap_ts": 1_700_000_000, "unpaid": 0.001},
+            "workers": [{f"w{index}": {"hashrate_60s": index}} for index in range(5)],
+            "extra": [1, {"nested": None}],
+        },
+        "error": None,
+    }
+    text = json.dumps(document, indent=2)
+
+    payload = StreamedUserinfo(text)
+    workers = list(payload.iter_workers())
+
+    assert workers == document["result"]["workers"]
+    assert payload.fields == {
+        "user_full": document["result"]["user_full"],
+        "extra": document["result"]["extra"],
+    }
+    assert json_loads(text) == document
+
+
+def test_streamed_userinfo_empty_workers():
+    """Test a result without workers."""
+    payload = StreamedUserinfo('{"result": {"workers": [], "user_full": {}}}')
+
+    assert list(payload.iter_workers()) == []
+    assert payload.fields == {"user_full": {}}
+
+
+def test_streamed_userinfo_truncated():
+    """Test a truncated body fails after the complete workers."""
+    payload = StreamedUserinfo('{"result": {"workers": [{"a": {}}, {"b": {}}, {"c": ')
+    workers = payload.iter_workers()
+
+    assert next(workers) == {"a": {}}
+    assert next(workers) == {"b": {}}
+    with pytest.raises(ValueError):
+        next(workers)
+
+
+@pytest.mark.parametrize("text", ['{"result": null, "error": "busy"}', '{"error": "busy"}'])
+def test_streamed_userinfo_without_result(text):
+    """Test a body without a result object fails instead of yielding no workers."""
+    payload = StreamedUserinfo(text)
+
+    with pytest.raises(ValueError):
+        list(payload.iter_workers())
@@ -0,0 +1,48 @@
+"""Tests of what importing the integration loads and how long it takes."""
+from pathlib import Path
+import subprocess
+import sys
+
+# Loaded only when the first lifetime earnings scrape needs them
+DEFERRED_MODULES = ("custom_components.ocean.scrape", "concurrent.futures.thread", "bs4")
+# Seconds the integration's own modules may take to import, without their dependencies
+OWN_IMPORT_BUDGET = 0.25
+
+
+def _import_times(module: str) -> dict[str, tuple[int, int]]:
+    """Import module in a fresh interpreter, return (self, cumulative) microseconds by module."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=Path(__file__).parent.parent,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        own, cumulative, name = line.removeprefix("import time:").split("|")
+        if own.strip().isdigit():
+            times[name.strip()] = (int(own), int(cumulative))
+    return times
+
+
+def test_integration_import():
+    """Test importing the integration leaves out the scrape stack and stays fast."""
+    times = _import_times("custom_components.ocean")
+
+    assert "custom_components.ocean" in times
+    for module in DEFERRED_MODULES:
+        assert not any(
+            name == module or name.startswith(f"{module}.") for name in times
+        ), f"{module} is imported with the integration"
+
+    _, cumulative = times["custom_components.ocean"]
+    own = sum(
+        own for name, (own, _) in times.items() if name.startswith("custom_components.ocean")
+    )
+    assert own / 1e6 < OWN_IMPORT_BUDGET, (
+        f"integration modules took {own / 1000:.1f} ms to import, "
+        f"{cumulative / 1000:.1f} ms with their dependencies"
+    )
@@ -0,0 +1,82 @@
+"""Tests for the rolling hashrate statistics."""
+import pytest
+
+from custom_components.ocean.rolling import RollingMean, RollingStats
+
+HOUR = 3600
+DAY = 86400
+
+
+def test_rolling_stats_windows():
+    """Test means and uptime only cover each window's samples."""
+    stats = RollingStats(capacity=DAY // 60, windows=(HOUR, DAY))
+    for minute in range(24 * 60):
+        # The last hour runs at twice the hashrate
+        stats.add(minute * 60, 200.0 if minute >= 23 * 60 else 100.0, minute % 2 == 0)
+
+    assert stats.mean(HOUR) == pytest.approx(200.0)
+    assert stats.mean(DAY) == pytest.approx(100.0 * 23 / 24 + 200.0 / 24)
+    assert stats.uptime(DAY) == pytest.approx(50.0)
+    assert len(stats) == 24 * 60
+
+
+def test_rolling_stats_percentile():
+    """Test percentiles within the histogram's resolution."""
+    stats = RollingStats(capacity=1000, windows=(HOUR,))
+    for second in range(100):
+        stats.add(second, float(second + 1), True)
+
+    assert stats.percentile(HOUR, 95) == pytest.approx(95, rel=0.05)
+    assert stats.percentile(HOUR, 5) == pytest.approx(5, rel=0.05)
+
+
+def test_rolling_stats_capacity():
+    """Test the oldest samples are dropped once the buffer is full."""
+    stats = RollingStats(capacity=10, windows=(DAY,))
+    for second in range(20):
+        stats.add(second, 1.0 if second < 10 else 3.0, True)
+
+    assert len(stats) == 10
+    assert stats.mean(DAY) == pytest.approx(3.0)
+
+
+def test_rolling_stats_empty():
+    """Test an empty window has no statistics."""
+    stats = RollingStats(capacity=10, windows=(HOUR,))
+
+    assert stats.mean(HOUR) is None
+    assert stats.uptime(HOUR) is None
+    assert stats.percentile(HOUR, 95) is None
+
+
+def test_rolling_mean_expires_whole_buckets():
+    """Test the running sums drop buckets the window moved past."""
+    mean = RollingMean(DAY, buckets=24)
+    for minute in range(24 * 60):
+        mean.add(minute * 60, 100.0, True)
+    assert mean.mean(DAY) == pytest.approx(100.0)
+
+    # A day later only the new samples remain
+    mean.add(2 * DAY, 50.0, False)
+    assert len(mean) == 1
+    assert mean.mean(DAY) == pytest.approx(50.0)
+    assert mean.uptime(DAY) == 0.0
+
+
+def test_rolling_mean_clock_going_back():
+    """Test samples from an earlier bucket count towards the newest one."""
+    mean = RollingMean(DAY, buckets=24)
+    mean.add(10 * HOUR, 1.0, True)
+    mean.add(HOUR, 3.0, True)
+
+    assert len(mean) == 2
+    assert mean.mean(DAY) == pytest.approx(2.0)
+
+
+def test_rolling_mean_only_has_its_window():
+    """Test other windows are rejected."""
+    mean = RollingMean(DAY, buckets=24)
+
+    assert mean.mean(DAY) is None
+    with pytest.raises(KeyError):
+        mean.mean(HOUR)
@@ -0,0 +1,74 @@
+"""Tests for snapshot-aligned poll scheduling."""
+import math
+
+import pytest
+
+from custom_components.ocean.const import SNAPSHOT_FAST_DELAY, SNAPSHOT_ROLL_MARGIN
+from custom_components.ocean.scheduler import SnapshotScheduler, parse_snap_ts
+
+START = 1_700_000_000
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (1_700_000_000, 1_700_000_000),
+        ("1700000000", 1_700_000_000),
+        (1_700_000_000_500, 1_700_000_000.5),
+        ("2023-11-14T22:13:20Z", 1_700_000_000),
+        (None, None),
+        ("", None),
+        ("soon", None),
+    ],
+)
+def test_parse_snap_ts(value, expected):
+    """Test snap_ts formats."""
+    assert parse_snap_ts(value) == expected
+
+
+def _run(scan_interval, cadence, lag, hours=3):
+    """Poll a simulated OCEAN, return (scheduler, poll times, staleness per poll)."""
+    scheduler = SnapshotScheduler(scan_interval)
+    now = START + 7.0
+    polls = []
+    staleness = []
+    while now < START + hours * 3600:
+        # Snapshots roll every cadence seconds and become visible lag seconds later
+        snap = START + ((now - START - lag) // cadence) * cadence
+        polls.append(now)
+        staleness.append(now - snap - lag)
+        now += scheduler.observe(snap, now)
+    return scheduler, polls, staleness
+
+
+@pytest.mark.parametrize(("scan_interval", "cadence"), [(30, 60), (60, 60), (60, 300), (120, 60)])
+def test_polls_follow_snapshots(scan_interval, cadence):
+    """Test the cadence is learned and polls land right after each roll."""
+    scheduler, polls, staleness = _run(scan_interval, cadence, lag=4.0)
+
+    assert scheduler.cadence == pytest.approx(cadence)
+    # Never closer together than the scan interval
+    assert min(b - a for a, b in zip(polls, polls[1:])) >= scan_interval - 1e-6
+    # Once the roll is located, every poll sees a snapshot that just rolled
+    half = len(polls) // 2
+    assert max(staleness[half:]) <= 2 * SNAPSHOT_ROLL_MARGIN
+    # One poll per roll, or per first roll at least the scan interval away
+    spacing = (polls[-1] - polls[half]) / (len(polls) - 1 - half)
+    assert spacing == pytest.approx(math.ceil(scan_interval / cadence) * cadence, rel=0.02)
+
+
+def test_fast_polls_after_block():
+    """Test a found block polls faster than the scan interval for a few cycles."""
+    scheduler = SnapshotScheduler(60)
+    scheduler.observe(START, START + 5)
+
+    delay = scheduler.observe(START + 60, START + 65, block_found=True)
+
+    assert delay <= SNAPSHOT_FAST_DELAY
+
+
+def test_unparsable_snap_ts():
+    """Test polls fall back to the scan interval without a snap_ts."""
+    scheduler = SnapshotScheduler(60)
+
+    assert scheduler.observe(None, START) == 60
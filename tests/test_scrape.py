@@ -0,0 +1,94 @@
+"""Tests for the stats page extractors."""
+import pytest
+
+from custom_components.ocean.scrape import (
+    AccountPageExtractor,
+    LifetimeEarningsExtractor,
+    WorkerTableExtractor,
+)
+
+from .server import Account
+
+PAGE = (
+    "<html><div class='stat'><div class='blocks-label'>Hashrate</div><span>1 PH/s</span></div>"
+    "<div class='stat'><div class=\"col blocks-label\">Lifetime Earnings</div>"
+    "<span class='value'>0.01234567 <small>BTC</small></span></div></html>"
+)
+
+
+def _chunks(text, size):
+    """Split text into chunks of size characters."""
+    return [text[start:start + size] for start in range(0, len(text), size)]
+
+
+@pytest.mark.parametrize("size", [1, 7, 64, len(PAGE)])
+def test_lifetime_earnings_in_chunks(size):
+    """Test the value is found whatever the chunk boundaries."""
+    extractor = LifetimeEarningsExtractor()
+    found = False
+    for chunk in _chunks(PAGE, size):
+        found = extractor.feed(chunk)
+        if found:
+            break
+
+    assert found
+    assert extractor.value == 0.01234567
+
+
+def test_lifetime_earnings_missing():
+    """Test a page without the label."""
+    extractor = LifetimeEarningsExtractor()
+
+    assert not extractor.feed("<html><div class='blocks-label'>Hashrate</div></html>")
+    assert extractor.value is None
+
+
+def test_lifetime_earnings_unparsable():
+    """Test a value that is not a BTC amount."""
+    extractor = LifetimeEarningsExtractor()
+
+    assert extractor.feed("<div class='blocks-label'>Lifetime Earnings</div><span>n/a</span>")
+    assert extractor.value is None
+
+
+def test_worker_table():
+    """Test the workers table is found by its headers and other tables are skipped."""
+    html = (
+        "<table><tr><th>Block</th><th>Lifetime</th></tr><tr><td>1</td><td>2</td></tr></table>"
+        "<table><tr><th>Worker</th><th>Lifetime Earnings</th></tr>"
+        "<tr><td><a>acct.rig1</a></td><td>0.001 BTC</td></tr>"
+        "<tr><td>rig2</td><td>1,000.5 BTC</td></tr>"
+        "<tr><td>rig3</td><td>-</td></tr></table>"
+    )
+    extractor = WorkerTableExtractor("acct")
+    found = False
+    for chunk in _chunks(html, 16):
+        found = extractor.feed(chunk)
+
+    assert found
+    assert extractor.workers == {"rig1": 0.001, "rig2": 1000.5}
+
+
+def test_worker_table_missing():
+    """Test workers stay None without a workers table."""
+    extractor = WorkerTableExtractor("acct")
+
+    assert not extractor.feed(PAGE)
+    assert extractor.workers is None
+
+
+@pytest.mark.parametrize("worker_table", [True, False])
+def test_account_page(worker_table):
+    """Test the account page yields the account and worker earnings."""
+    account = Account("acct", workers=3, worker_table=worker_table)
+    extractor = AccountPageExtractor("acct")
+    for chunk in _chunks(account.stats_page(), 4096):
+        if extractor.feed(chunk):
+            break
+
+    assert extractor.found
+    assert extractor.value == 0.5
+    if worker_table:
+        assert extractor.workers == {"worker0": 0.0, "worker1": 0.001, "worker2": 0.002}
+    else:
+        assert extractor.workers is None
@@ -0,0 +1,173 @@
+"""Tests of the sensor and binary sensor platforms against the stand-in server."""
+import time
+from unittest.mock import Mock, patch
+
+from homeassistant.const import STATE_UNAVAILABLE
+from homeassistant.helpers import device_registry as dr, entity_registry as er
+from homeassistant.helpers.entity import Entity
+
+from custom_components.ocean.const import DOMAIN
+
+from .server import USERINFO_FULL
+
+
+def _entity_id(hass, platform, unique_id):
+    """Return the entity ID registered for a unique ID."""
+    return er.async_get(hass).async_get_entity_id(platform, DOMAIN, unique_id)
+
+
+def _worker_device(hass, worker_name):
+    """Return the device of a worker of the test account."""
+    return dr.async_get(hass).async_get_device(identifiers={(DOMAIN, f"acct_{worker_name}")})
+
+
+async def test_account_and_worker_sensors(hass, setup_account):
+    """Test account and worker sensors report the parsed values."""
+    await setup_account(workers=2)
+
+    hashrate = hass.states.get(_entity_id(hass, "sensor", "acct_hashrate_60s"))
+    assert float(hashrate.state) == 200.0
+    worker = hass.states.get(_entity_id(hass, "sensor", "acct_worker1_hashrate_60s"))
+    assert float(worker.state) == 101.0
+    assert hass.states.get(_entity_id(hass, "binary_sensor", "acct_worker0_status")).state == "off"
+    assert hass.states.get(_entity_id(hass, "binary_sensor", "acct_worker1_status")).state == "on"
+
+
+async def test_only_changed_entities_write_state(hass, setup_account, stand_in):
+    """Test a poll that changes one account value leaves the worker entities alone."""
+    entry = await setup_account(workers=3)
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    account_device = dr.async_get(hass).async_get_device(identifiers={(DOMAIN, "acct")})
+    worker_entity_ids = {
+        entity.entity_id
+        for entity in er.async_entries_for_config_entry(er.async_get(hass), entry.entry_id)
+        if entity.device_id != account_device.id
+    }
+    written = []
+    write_ha_state = Entity.async_write_ha_state
+
+    def record_write(entity):
+        written.append(entity.entity_id)
+        write_ha_state(entity)
+
+    # Lower, so the poll does not count as a found block
+    stand_in.accounts["acct"].unpaid = 0.0005
+    with patch.object(Entity, "async_write_ha_state", autospec=True, side_effect=record_write):
+        await coordinator.async_refresh()
+
+    assert coordinator.changed_keys == {"unpaid"}
+    assert _entity_id(hass, "sensor", "acct_unpaid") in written
+    assert not worker_entity_ids & set(written)
+    assert _entity_id(hass, "sensor", "acct_hashrate_60s") not in written
+
+
+async def test_stale_poll_keeps_states(hass, setup_account, stand_in):
+    """Test failed polls keep the states while the last good data is recent."""
+    entry = await setup_account()
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    entity_id = _entity_id(hass, "sensor", "acct_hashrate_60s")
+
+    stand_in.fail(USERINFO_FULL, 503, 503, 503)
+    await coordinator.async_refresh()
+    assert float(hass.states.get(entity_id).state) == 300.0
+
+    stand_in.fail(USERINFO_FULL, 503, 503, 503)
+    with patch("custom_components.ocean.coordinator.STALE_MAX_AGE", -1):
+        await coordinator.async_refresh()
+    assert hass.states.get(entity_id).state == STATE_UNAVAILABLE
+
+
+async def test_restored_entities_have_states_before_the_api(hass, setup_account, stand_in):
+    """Test entities of a reloaded entry show the saved values while the API is down."""
+    entry = await setup_account(workers=2)
+    assert await hass.config_entries.async_unload(entry.entry_id)
+
+    stand_in.latency[USERINFO_FULL] = 0.5
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    # Entities exist before the background refresh returns
+    worker = hass.states.get(_entity_id(hass, "sensor", "acct_worker1_hashrate_60s"))
+    assert float(worker.state) == 101.0
+    await hass.async_block_till_done()
+
+
+async def test_new_workers_get_entities(hass, setup_account, stand_in):
+    """Test workers appearing in the API get their devices and entities."""
+    entry = await setup_account(workers=2)
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+
+    stand_in.accounts["acct"].workers = 3
+    stand_in.roll()
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    assert coordinator.worker_registry == {"worker0", "worker1", "worker2"}
+    assert _worker_device(hass, "worker2") is not None
+    worker = hass.states.get(_entity_id(hass, "sensor", "acct_worker2_hashrate_60s"))
+    assert float(worker.state) == 102.0
+    assert _entity_id(hass, "binary_sensor", "acct_worker2_status") is not None
+
+
+async def test_removed_workers_lose_entities(hass, setup_account):
+    """Test workers removed from the registry have their entities removed."""
+    entry = await setup_account(workers=2)
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    entity_id = _entity_id(hass, "sensor", "acct_worker1_hashrate_60s")
+
+    coordinator.async_remove_workers(["worker1"])
+    coordinator.async_update_listeners()
+    await hass.async_block_till_done()
+
+    assert hass.states.get(entity_id) is None
+    assert hass.states.get(_entity_id(hass, "sensor", "acct_worker0_hashrate_60s")) is not None
+
+
+async def test_summary_mode_removes_other_worker_devices(hass, setup_account):
+    """Test switching to summary mode drops the devices of workers not included."""
+    entry = await setup_account(workers=3)
+    assert _worker_device(hass, "worker2") is not None
+
+    hass.config_entries.async_update_entry(
+        entry, options={"worker_mode": "summary", "worker_include": ["worker0"]}
+    )
+    await hass.async_block_till_done()
+
+    assert hass.data[DOMAIN][entry.entry_id].worker_registry == {"worker0"}
+    assert _worker_device(hass, "worker0") is not None
+    assert _worker_device(hass, "worker1") is None
+    assert _worker_device(hass, "worker2") is None
+
+
+async def test_missing_workers_are_evicted(hass, setup_account, stand_in):
+    """Test workers missing for longer than the retention are removed with their devices."""
+    entry = await setup_account(workers=3, options={"worker_retention": 1})
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+    entity_id = _entity_id(hass, "sensor", "acct_worker2_hashrate_60s")
+
+    # worker2 goes missing, recorded as two hours ago
+    stand_in.accounts["acct"].workers = 2
+    stand_in.roll()
+    with patch(
+        "custom_components.ocean.workers.time", Mock(time=Mock(return_value=time.time() - 7200))
+    ):
+        await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    assert coordinator.workers.names == ["worker0", "worker1"]
+    assert coordinator.worker_registry == {"worker0", "worker1"}
+    assert "worker2" not in coordinator.worker_rolling
+    assert _worker_device(hass, "worker2") is None
+    assert hass.states.get(entity_id) is None
+
+
+async def test_missing_workers_are_kept_within_retention(hass, setup_account, stand_in):
+    """Test a worker that just went missing keeps its entities."""
+    entry = await setup_account(workers=3, options={"worker_retention": 1})
+    coordinator = hass.data[DOMAIN][entry.entry_id]
+
+    stand_in.accounts["acct"].workers = 2
+    stand_in.roll()
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    assert coordinator.workers.names == ["worker0", "worker1", "worker2"]
+    assert _worker_device(hass, "worker2") is not None
@@ -0,0 +1,94 @@
+"""End-to-end tests of the decoding and scraping paths against the stand-in server."""
+import codecs
+
+import aiohttp
+import pytest
+
+from custom_components.ocean.decode import StreamedUserinfo, json_loads
+from custom_components.ocean.scrape import AccountPageExtractor, ParsePool
+from custom_components.ocean.workers import WorkerTable
+
+from .server import STATS, USERINFO_FULL, StandInServer
+
+
+async def _with_server(test, **accounts):
+    """Run test(server, session) against a server with the given accounts."""
+    server = StandInServer()
+    for username, workers in accounts.items():
+        server.add_account(username, workers)
+    await server.start()
+    try:
+        async with aiohttp.ClientSession() as session:
+            return await test(server, session)
+    finally:
+        await server.stop()
+
+
+@pytest.mark.parametrize("workers", [10, 1000])
+async def test_userinfo_into_worker_table(socket_enabled, workers):
+    """Test a streamed userinfo_full body fills the worker table."""
+
+    async def test(server, session):
+        table = WorkerTable()
+        for _ in range(2):
+            async with session.get(server.url("/v1/userinfo_full/acct")) as response:
+                payload = StreamedUserinfo(await response.text())
+            changed = table.update(payload.iter_workers())
+            server.roll()
+        return table, changed, payload.fields
+
+    table, changed, fields = await _with_server(test, acct=workers)
+
+    assert len(table) == workers
+    # Every worker's lastest_share_ts moved with the snapshot
+    assert len(changed) == workers
+    assert fields["user_full"]["snap_ts"] == 1_700_000_060
+    assert table["worker1"]["hashrate_60s"] == 101.0
+
+
+async def test_injected_errors_and_latency(socket_enabled):
+    """Test injected statuses are answered in order before normal responses."""
+
+    async def test(server, session):
+        server.fail(USERINFO_FULL, 503, 429)
+        server.latency[USERINFO_FULL] = 0.05
+        statuses = []
+        for _ in range(3):
+            async with session.get(server.url("/v1/userinfo_full/acct")) as response:
+                statuses.append(response.status)
+                body = await response.read()
+        async with session.get(server.url("/v1/statsnap/nobody")) as response:
+            statuses.append(response.status)
+        return statuses, json_loads(body), server.hits[USERINFO_FULL]
+
+    statuses, body, hits = await _with_server(test, acct=3)
+
+    assert statuses == [503, 429, 200, 404]
+    assert len(body["result"]["workers"]) == 3
+    assert hits == 3
+
+
+@pytest.mark.parametrize("max_workers", [0, 2])
+async def test_account_page_through_parse_pool(socket_enabled, max_workers):
+    """Test a streamed account page is scanned in batches until both values are found."""
+
+    async def test(server, session):
+        pool = ParsePool(max_workers=max_workers)
+        extractor = AccountPageExtractor("acct")
+        try:
+            async with session.get(server.url("/stats/acct")) as response:
+                decoder = codecs.getincrementaldecoder("utf-8")()
+                async for chunk in response.content.iter_chunked(4096):
+                    found, _ = await pool.async_feed(extractor, decoder, chunk)
+                    if found:
+                        break
+        finally:
+            pool.shutdown()
+        return extractor, server.hits[STATS]
+
+    extractor, hits = await _with_server(test, acct=50)
+
+    assert hits == 1
+    assert extractor.value == 0.5
+    assert len(extractor.workers) == 50
+    assert extractor.workers["worker49"] == 0.049
@@ -0,0 +1,130 @@
+"""Tests for the worker table."""
+import pytest
+
+from custom_components.ocean.decode import StreamedUserinfo
+from custom_components.ocean.workers import WorkerTable
+
+
+def _worker(name, shares_60s=1, last_share_ts=1_700_000_000, hashrate=1e12):
+    """Return a userinfo_full workers element."""
+    return {
+        name: {
+            "hashrate_60s": hashrate,
+            "hashrate_300s": hashrate,
+            "shares_60s": shares_60s,
+            "shares_300s": 5,
+            "lastest_share_ts": last_share_ts,
+            "shares_in_tides": 10,
+            "estimated_earn_next_block": 0.0001,
+            "estimated_bonus_earn_next_block": 0,
+            "estimated_total_earn_next_block": 0.0001,
+        }
+    }
+
+
+def test_update_converts_and_reports_changes():
+    """Test new, unchanged, changed and missing workers."""
+    table = WorkerTable()
+
+    assert table.update([_worker("a"), _worker("b", shares_60s=0)]) == {"a", "b"}
+    assert table.appeared == {"a", "b"}
+    assert table["a"]["hashrate_60s"] == 1.0
+    assert table["a"]["is_active"] is True
+    assert table.active_count == 1
+    version = table.version
+
+    assert table.update([_worker("a"), _worker("b", shares_60s=0)]) == set()
+    assert table.version == version
+
+    assert table.update([_worker("a", shares_60s=2)]) == {"a", "b"}
+    assert "b" not in table
+    assert table.names == ["a", "b"]
+    assert len(table) == 1
+
+    assert table.update([_worker("a", shares_60s=2), _worker("b")]) == {"b"}
+    assert table.appeared == {"b"}
+
+
+def test_update_is_atomic():
+    """Test a worker list that fails part way leaves the table untouched."""
+    table = WorkerTable()
+    table.update([_worker("a")])
+    version = table.version
+
+    def broken():
+        yield _worker("a", shares_60s=5)
+        yield _worker("c")
+        raise ValueError("truncated body")
+
+    with pytest.raises(ValueError):
+        table.update(broken())
+
+    assert table["a"]["shares_60s"] == 1
+    assert table.names == ["a"]
+    assert table.version == version
+    # The rows kept their signatures, so the new values are picked up next time
+    assert table.update([_worker("a", shares_60s=5)]) == {"a"}
+
+
+def test_update_tolerates_bad_values():
+    """Test malformed values only affect their own worker."""
+    table = WorkerTable()
+    table.update([_worker("a"), _worker("b")])
+
+    changed = table.update(
+        [
+            _worker("a", shares_60s="many"),
+            _worker("b", last_share_ts="not a timestamp"),
+            _worker("c", last_share_ts="1700000000.5"),
+            _worker("d", last_share_ts=1_700_000_000_123),
+        ]
+    )
+
+    assert changed == {"b", "c", "d"}
+    assert table["a"]["shares_60s"] == 1
+    assert table["b"]["last_share_ts"] is None
+    assert table["c"]["last_share_ts"] == 1_700_000_000
+    assert table["d"]["last_share_ts"] == 1_700_000_000
+
+
+def test_compact_round_trip():
+    """Test restoring a table saved with as_compact."""
+    table = WorkerTable()
+    table.update([_worker("a"), _worker("b")])
+    table.update([_worker("a")])
+
+    restored = WorkerTable()
+    restored.restore(table.as_compact())
+
+    assert list(restored) == ["a"]
+    assert restored.names == ["a", "b"]
+    assert dict(restored["a"]) == dict(table["a"])
+    # Restored rows have no signatures, the first poll rewrites them
+    assert restored.update([_worker("a")]) == {"a"}
+
+
+def test_remove_and_missing_since():
+    """Test absent workers are reported by age and dropped."""
+    table = WorkerTable()
+    table.update([_worker("a"), _worker("b")])
+    table.update([_worker("b")])
+
+    assert table.missing_since(0) == []
+    missing = table.missing_since(float("inf"))
+    assert missing == ["a"]
+
+    table.remove(missing)
+    assert table.names == ["b"]
+    assert list(table.samples()) == [("b", 1.0, True)]
+
+
+def test_update_from_body_without_result():
+    """Test a large body without a result keeps every worker present."""
+    table = WorkerTable()
+    table.update([_worker("a")])
+
+    with pytest.raises(ValueError):
+        table.update(StreamedUserinfo('{"result": null}').iter_workers())
+
+    assert list(table) == ["a"]
+    assert table["a"]["hashrate_60s"] == 1.0